@@ -1,7 +1,14 @@
 # -*- coding: utf-8 -*-
 """Insert ISS-047~050 into project-seed.yaml and update related inputs."""
+import pathlib
 import sys
 
+if __package__ in {None, ""}:
+    sys.path.append(str(pathlib.Path(__file__).resolve().parents[1]))
+
+from scripts.seed_editor import edit_seed
+from scripts.seed_loader import parse_seed_text
+
 SEED_PATH = 'data/project-seed.yaml'
 
 NEW_ISSUES = u'''\
@@ -271,66 +278,47 @@ NEW_ISSUES = u'''\
   focus: "\u65e2\u5b58\u306e\u5236\u5fa1\xd7AI \u6210\u679c\u7269\u3092 Azure AI Foundry \u3067\u30b9\u30b1\u30fc\u30eb\u3057\u3066\u30dd\u30fc\u30c8\u30d5\u30a9\u30ea\u30aa\u6700\u7d42\u5f62\u306b\u3059\u308b"
 '''
 
+# Appended to the end of each issue's `inputs` list.
 ADDITIONS = {
-    'ISS-020': u'  - "Azure IoT Hub \u7121\u6599\u67a0\u30c9\u30ad\u30e5\u30e1\u30f3\u30c8\uff08ISS-048 \u3067\u5229\u7528\uff09https://docs.microsoft.com/ja-jp/azure/iot-hub/"\n',
-    'ISS-034': u'  - "Azure AI Foundry https://azure.microsoft.com/ja-jp/products/ai-foundry/\uff08ISS-050 \u306e\u57fa\u76e4\uff09"\n',
-    'ISS-035': u'  - "Azure AI Foundry\uff08ISS-050 \u3067\u7d71\u5408\u4e88\u5b9a\uff09"\n',
-    'ISS-045': u'  - "Microsoft Defender for IoT\uff08ISS-049 \u3067\u5b9f\u969b\u306b\u4f7f\u7528\uff09https://azure.microsoft.com/ja-jp/products/defender-for-iot/"\n',
+    'ISS-020': u'Azure IoT Hub \u7121\u6599\u67a0\u30c9\u30ad\u30e5\u30e1\u30f3\u30c8\uff08ISS-048 \u3067\u5229\u7528\uff09https://docs.microsoft.com/ja-jp/azure/iot-hub/',
+    'ISS-034': u'Azure AI Foundry https://azure.microsoft.com/ja-jp/products/ai-foundry/\uff08ISS-050 \u306e\u57fa\u76e4\uff09',
+    'ISS-035': u'Azure AI Foundry\uff08ISS-050 \u3067\u7d71\u5408\u4e88\u5b9a\uff09',
+    'ISS-045': u'Microsoft Defender for IoT\uff08ISS-049 \u3067\u5b9f\u969b\u306b\u4f7f\u7528\uff09https://azure.microsoft.com/ja-jp/products/defender-for-iot/',
 }
 
-def find_inputs_end(lines, target_id):
-    """Find index of 'things_to_make:' line within the target issue's inputs."""
-    in_target = False
-    for i, line in enumerate(lines):
-        stripped = line.strip()
-        if stripped == f'- id: {target_id}':
-            in_target = True
-        elif stripped.startswith('- id: ISS') and target_id not in stripped and in_target:
-            in_target = False
-        if in_target and (stripped.startswith('things_to_make:') or stripped.startswith('completion_check:')):
-            return i
-    return None
-
-with open(SEED_PATH, encoding='utf-8') as f:
-    lines = f.readlines()
-
-print(f"Total lines before: {len(lines)}")
-
-# --- Step 1: Insert new issues before ISS-R01 ---
-insert_idx = None
-for i, line in enumerate(lines):
-    if line.strip() == '- id: ISS-R01':
-        insert_idx = i
-        break
-
-if insert_idx is None:
-    print("ERROR: ISS-R01 not found!")
-    sys.exit(1)
 
-print(f"Inserting 4 new issues at line {insert_idx+1}")
-new_issue_lines = [l + '\n' for l in NEW_ISSUES.splitlines()]
-lines = lines[:insert_idx] + new_issue_lines + lines[insert_idx:]
+def main() -> int:
+    new_issues = parse_seed_text(NEW_ISSUES)
+    with edit_seed(SEED_PATH) as editor:
+        present = [issue['id'] for issue in new_issues if issue['id'] in editor.index]
+        if present:
+            print(f"ERROR: already in the seed: {', '.join(present)}")
+            return 1
+        issues = editor.data['issues']
+        insert_idx = next((i for i, issue in enumerate(issues) if issue['id'] == 'ISS-R01'), None)
+        if insert_idx is None:
+            print("ERROR: ISS-R01 not found!")
+            return 1
+        missing = [target_id for target_id in ADDITIONS if target_id not in editor.index]
+        if missing:
+            print(f"ERROR: inputs target not found: {', '.join(missing)}")
+            return 1
 
-# --- Step 2: Update inputs for ISS-020, ISS-034, ISS-035, ISS-045 ---
-for target_id in ['ISS-045', 'ISS-035', 'ISS-034', 'ISS-020']:
-    idx = find_inputs_end(lines, target_id)
-    if idx is None:
-        print(f"ERROR: inputs end not found for {target_id}")
-        sys.exit(1)
-    print(f"Inserting input for {target_id} at line {idx+1} (before: {lines[idx].rstrip()})")
-    lines.insert(idx, ADDITIONS[target_id])
+        # --- Step 1: Insert new issues before ISS-R01 ---
+        print(f"Inserting {len(new_issues)} new issues before ISS-R01 (issue #{insert_idx + 1})")
+        issues[insert_idx:insert_idx] = new_issues
 
-# --- Step 3: Write back ---
-with open(SEED_PATH, 'w', encoding='utf-8') as f:
-    f.writelines(lines)
+        # --- Step 2: Update inputs for ISS-020, ISS-034, ISS-035, ISS-045 ---
+        for target_id, addition in ADDITIONS.items():
+            print(f"Appending input for {target_id}")
+            editor.entity(target_id)['inputs'].append(addition)
 
-print(f"Total lines after: {len(lines)}")
-print("File written successfully.")
+    # --- Step 3: Written back atomically when the block above exits ---
+    print("File written successfully.")
+    for iss_id in ['ISS-047', 'ISS-048', 'ISS-049', 'ISS-050']:
+        print(f"  {iss_id} present: {iss_id in editor.index}")
+    return 0
 
-# Verify
-with open(SEED_PATH, encoding='utf-8') as f:
-    content = f.read()
 
-for iss_id in ['ISS-047', 'ISS-048', 'ISS-049', 'ISS-050']:
-    found = f'- id: {iss_id}' in content
-    print(f"  {iss_id} present: {found}")
+if __name__ == "__main__":
+    raise SystemExit(main())
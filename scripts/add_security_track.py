@@ -1,9 +1,13 @@
 from __future__ import annotations
 
 import pathlib
+import sys
 from typing import Any
 
-import yaml
+if __package__ in {None, ""}:
+    sys.path.append(str(pathlib.Path(__file__).resolve().parents[1]))
+
+from scripts.seed_editor import edit_seed
 
 
 TASK_PROFILES: dict[str, dict[str, Any]] = {
@@ -369,14 +373,13 @@ def update_win_conditions(seed: dict[str, Any]) -> None:
 
 
 def main() -> int:
-    path = pathlib.Path("data/project-seed.yaml")
-    seed = yaml.safe_load(path.read_text(encoding="utf-8"))
-    ensure_area_label(seed)
-    ensure_area_field(seed)
-    ensure_security_epic(seed)
-    upsert_security_issues(seed)
-    update_win_conditions(seed)
-    path.write_text(yaml.safe_dump(seed, allow_unicode=True, sort_keys=False, width=120), encoding="utf-8")
+    with edit_seed(pathlib.Path("data/project-seed.yaml")) as editor:
+        seed = editor.data
+        ensure_area_label(seed)
+        ensure_area_field(seed)
+        ensure_security_epic(seed)
+        upsert_security_issues(seed)
+        update_win_conditions(seed)
     return 0
 
 
@@ -0,0 +1,249 @@
+from __future__ import annotations
+
+import argparse
+import copy
+import json
+import os
+import pathlib
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Any
+
+import yaml
+
+if __package__ in {None, ""}:
+    sys.path.append(str(pathlib.Path(__file__).resolve().parents[1]))
+
+from scripts import github_project_sync as sync
+from scripts.github_standin import StandinConfig, StandinServer
+from scripts.seed_loader import load_seed
+
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+BENCH_OWNER = "bench"
+TRAFFIC_KEYS = ("requests", "rest", "graphql", "request_bytes", "response_bytes", "rate_limited")
+
+
+def synthetic_seed(base: dict[str, Any], size: int, *, repo: str) -> dict[str, Any]:
+    """Scale the seed's concrete issues to `size` by cloning them with suffixed ids and titles."""
+    seed = copy.deepcopy(base)
+    template = base.get("issues", [])
+    template_ids = {issue["id"] for issue in template}
+    issues: list[dict[str, Any]] = []
+    copy_index = 0
+    while template and len(issues) < size:
+        suffix = f"-x{copy_index}" if copy_index else ""
+        for original in template:
+            if len(issues) >= size:
+                break
+            clone = copy.deepcopy(original)
+            if suffix:
+                clone["id"] = f"{original['id']}{suffix}"
+                clone["title"] = f"{original['title']} #{copy_index}"
+                for key in ("dependencies", "blocked_by"):
+                    clone[key] = [
+                        f"{dependency}{suffix}" if dependency in template_ids else dependency
+                        for dependency in original.get(key, [])
+                    ]
+            issues.append(clone)
+        copy_index += 1
+    seed["issues"] = issues
+    seed["meta"] = {**seed["meta"], "owner": BENCH_OWNER, "repo": repo}
+
+    # Truncation can cut off a dependency of the last copy; drop references that no longer resolve.
+    entity_ids = {item["id"] for _, items in sync.entity_collections(seed) for item in items}
+    for _, items in sync.entity_collections(seed):
+        for item in items:
+            for key in ("dependencies", "blocked_by", "linked_issue_ids"):
+                if isinstance(item.get(key), list):
+                    item[key] = [reference for reference in item[key] if reference in entity_ids]
+    return seed
+
+
+def run_sync(
+    seed_path: pathlib.Path,
+    *,
+    repo: str,
+    env: dict[str, str],
+    work_dir: pathlib.Path,
+    args: argparse.Namespace,
+    label: str,
+) -> subprocess.CompletedProcess[str]:
+    command = [
+        sys.executable,
+        "-m",
+        "scripts.github_project_sync",
+        "--apply",
+        "--seed-path",
+        str(seed_path),
+        "--owner",
+        BENCH_OWNER,
+        "--repo",
+        repo,
+        "--project-owner",
+        BENCH_OWNER,
+        "--transport",
+        "http",
+        "--today",
+        args.today,
+        "--concurrency",
+        str(args.concurrency),
+        "--report-dir",
+        str(work_dir / "reports"),
+    ]
+    if args.with_cache:
+        command.extend(["--cache-dir", str(work_dir / "cache")])
+    else:
+        command.append("--no-cache")
+    if args.record_fixtures:
+        fixtures_dir = pathlib.Path(args.record_fixtures)
+        command.extend(["--record-fixtures", str(fixtures_dir / f"{repo}-{label}.jsonl")])
+    return subprocess.run(command, cwd=ROOT, env=env, capture_output=True, text=True, encoding="utf-8")
+
+
+def benchmark_size(base_seed: dict[str, Any], size: int, args: argparse.Namespace) -> list[dict[str, Any]]:
+    repo = f"plan-{size}"
+    config = StandinConfig(
+        latency=args.latency_ms / 1000,
+        rate_limit=args.rate_limit,
+        rate_window=args.rate_window,
+    )
+    results: list[dict[str, Any]] = []
+    with tempfile.TemporaryDirectory(prefix="sync-bench-") as temp_dir, StandinServer(config) as server:
+        work_dir = pathlib.Path(temp_dir)
+        seed_path = work_dir / "project-seed.yaml"
+        seed_path.write_text(
+            yaml.safe_dump(synthetic_seed(base_seed, size, repo=repo), allow_unicode=True, sort_keys=False),
+            encoding="utf-8",
+        )
+        env = {**os.environ, **server.environment()}
+        for label in args.runs:
+            before = dict(server.traffic)
+            started = time.perf_counter()
+            completed = run_sync(seed_path, repo=repo, env=env, work_dir=work_dir, args=args, label=label)
+            elapsed = time.perf_counter() - started
+            result: dict[str, Any] = {"size": size, "run": label, "seconds": round(elapsed, 3)}
+            for key in TRAFFIC_KEYS:
+                result[key] = server.traffic.get(key, 0) - before.get(key, 0)
+            result["exit_code"] = completed.returncode
+            if completed.returncode:
+                result["stderr"] = (completed.stderr or completed.stdout).strip().splitlines()[-5:]
+            results.append(result)
+    return results
+
+
+def benchmark_planning(base_seed: dict[str, Any], size: int, *, today: str) -> list[dict[str, Any]]:
+    """Time build_planned_issues with an empty, an in-memory and an on-disk render cache."""
+    seed = synthetic_seed(base_seed, size, repo=f"plan-{size}")
+    planning_date = sync.parse_iso_date(today)
+    results: list[dict[str, Any]] = []
+    with tempfile.TemporaryDirectory(prefix="plan-bench-") as temp_dir:
+        cache_path = pathlib.Path(temp_dir) / sync.RENDER_CACHE_FILE
+        runs = [
+            ("cold", lambda: sync.RenderCache(cache_path)),
+            ("warm memory", lambda: sync.RENDER_CACHE),
+            ("warm disk", lambda: sync.RenderCache(cache_path)),
+        ]
+        for label, make_cache in runs:
+            started = time.perf_counter()
+            sync.set_render_cache(make_cache())
+            planned = sync.build_planned_issues(seed, today=planning_date)
+            elapsed = time.perf_counter() - started
+            sync.RENDER_CACHE.save()
+            results.append(
+                {
+                    "size": size,
+                    "run": label,
+                    "planned": len(planned),
+                    "seconds": round(elapsed, 3),
+                    "render_hits": sync.RENDER_CACHE.stats["hit"],
+                    "render_misses": sync.RENDER_CACHE.stats["miss"],
+                }
+            )
+            sync.RENDER_CACHE.stats.clear()
+    sync.set_render_cache(sync.RenderCache())
+    return results
+
+
+def render_planning_table(results: list[dict[str, Any]]) -> str:
+    lines = [
+        "| items | run | planned | seconds | render hits | render misses |",
+        "|---:|---|---:|---:|---:|---:|",
+    ]
+    for result in results:
+        lines.append(
+            f"| {result['size']} | {result['run']} | {result['planned']} | {result['seconds']:.2f} | "
+            f"{result['render_hits']} | {result['render_misses']} |"
+        )
+    return "\n".join(lines)
+
+
+def render_table(results: list[dict[str, Any]]) -> str:
+    lines = [
+        "| items | run | seconds | requests | REST | GraphQL | request bytes | response bytes | rate limited | exit |",
+        "|---:|---|---:|---:|---:|---:|---:|---:|---:|---:|",
+    ]
+    for result in results:
+        lines.append(
+            f"| {result['size']} | {result['run']} | {result['seconds']:.2f} | {result['requests']} | "
+            f"{result['rest']} | {result['graphql']} | {result['request_bytes']} | {result['response_bytes']} | "
+            f"{result['rate_limited']} | {result['exit_code']} |"
+        )
+    return "\n".join(lines)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark github_project_sync against a local GitHub stand-in.")
+    parser.add_argument("--seed-path", default="data/project-seed.yaml", help="Seed used as the template for synthetic seeds.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10000], help="Concrete issue counts to sync.")
+    parser.add_argument(
+        "--runs",
+        nargs="+",
+        default=["cold", "warm"],
+        help="Labels of consecutive apply runs per size; the first creates everything, later ones re-sync.",
+    )
+    parser.add_argument("--today", default="2026-03-14")
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Latency the stand-in adds to every response.")
+    parser.add_argument("--rate-limit", type=int, help="Requests per window before the stand-in answers 403.")
+    parser.add_argument("--rate-window", type=float, default=60.0)
+    parser.add_argument("--with-cache", action="store_true", help="Keep the remote state cache between runs.")
+    parser.add_argument("--record-fixtures", help="Directory to record each run's requests for --replay-fixtures.")
+    parser.add_argument(
+        "--planning",
+        action="store_true",
+        help="Only time the planning phase (body rendering and fingerprints) without a stand-in.",
+    )
+    parser.add_argument("--json", help="Write the results to this JSON file.")
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    base_seed = load_seed(ROOT / args.seed_path, cache_dir=None, lazy=False)
+    results: list[dict[str, Any]] = []
+    if args.planning:
+        for size in args.sizes:
+            results.extend(benchmark_planning(base_seed, size, today=args.today))
+        print(render_planning_table(results))
+        if args.json:
+            pathlib.Path(args.json).write_text(json.dumps(results, ensure_ascii=False, indent=2), encoding="utf-8")
+        return 0
+    for size in args.sizes:
+        size_results = benchmark_size(base_seed, size, args)
+        summary = ", ".join(
+            f"{result['run']} {result['seconds']:.2f}s / {result['requests']} requests" for result in size_results
+        )
+        print(f"{size} items: {summary}", flush=True)
+        results.extend(size_results)
+    print()
+    print(render_table(results))
+    if args.json:
+        pathlib.Path(args.json).write_text(json.dumps(results, ensure_ascii=False, indent=2), encoding="utf-8")
+    return 1 if any(result["exit_code"] for result in results) else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
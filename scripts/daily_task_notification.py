@@ -5,16 +5,14 @@ import dataclasses
 import datetime as dt
 import json
 import pathlib
-import subprocess
 import sys
 from typing import Any
 
-import yaml
-
 if __package__ in {None, ""}:
     sys.path.append(str(pathlib.Path(__file__).resolve().parents[1]))
 
 from scripts import github_project_sync as sync
+from scripts.seed_loader import load_seed, seed_digest
 
 
 PRIORITY_ORDER = {"p0": 0, "p1": 1, "p2": 2, "p3": 3}
@@ -42,25 +40,17 @@ def issue_state(issue: dict[str, Any]) -> str:
     return str(issue.get("state") or "").strip().lower()
 
 
-def closed_issue_seed_ids(existing_issues: list[dict[str, Any]]) -> set[str]:
-    closed_ids: set[str] = set()
-    for issue in existing_issues:
-        if issue_state(issue) != "closed":
-            continue
-        marker = sync.extract_marker(issue.get("body"))
-        if marker and marker.get("seed_id"):
-            closed_ids.add(str(marker["seed_id"]))
-    return closed_ids
+def closed_issue_seed_ids(existing_issues: sync.IssueIndex | list[dict[str, Any]]) -> set[str]:
+    return sync.issue_index(existing_issues).closed_seed_ids()
 
 
-def parse_marker_issue_map(existing_issues: list[dict[str, Any]]) -> dict[str, dict[str, Any]]:
-    issue_map: dict[str, dict[str, Any]] = {}
-    for issue in existing_issues:
-        marker = sync.extract_marker(issue.get("body"))
-        if not marker or marker.get("entity_kind") not in {"issue", "phase_card", "win_condition"}:
-            continue
-        issue_map[str(marker["seed_id"])] = issue
-    return issue_map
+def parse_marker_issue_map(existing_issues: sync.IssueIndex | list[dict[str, Any]]) -> dict[str, dict[str, Any]]:
+    index = sync.issue_index(existing_issues)
+    return {
+        seed_id: issue
+        for seed_id, issue in index.by_seed_id.items()
+        if (index.marker(issue) or {}).get("entity_kind") in {"issue", "phase_card", "win_condition"}
+    }
 
 
 def first_execution(issue: dict[str, Any]) -> str:
@@ -72,27 +62,33 @@ def normalize_text(value: Any) -> str:
     return sync.normalize_text(value)
 
 
-def status_reason(issue: dict[str, Any], *, today: dt.date, closed_issue_seed_ids: set[str]) -> tuple[str, str]:
-    deferred_date = sync.parse_iso_date(issue.get("deferred_until"))
-    if deferred_date and today <= deferred_date:
-        return "延期", f"{issue['deferred_until']} まで保留"
-
-    active_date = sync.parse_iso_date(issue.get("active_from"))
-    if active_date and today < active_date:
-        return "バックログ", f"{issue['active_from']} から着手"
-
-    blocked_by = [seed_id for seed_id in issue.get("blocked_by", []) if seed_id not in closed_issue_seed_ids]
-    if blocked_by:
-        return "ブロック中", f"{blocked_by[0]} 完了待ち"
-
-    if sync.is_exam_priority_period(today) and not sync.normalize_bool(issue.get("exam_priority_guard")):
-        return "バックログ", "試験優先期間のため後回し"
-
-    due_date = sync.parse_iso_date(issue.get("due_date"))
-    if due_date and due_date <= today + dt.timedelta(days=sync.DATE_WINDOW_DAYS):
-        return "未着手", "今日の主役候補"
-
-    return "バックログ", "期限まで余裕があるため後回し"
+def reason_text(issue: dict[str, Any], result: sync.StatusResult) -> str:
+    if result.reason == "deferred":
+        return f"{issue['deferred_until']} まで保留"
+    if result.reason == "not-active":
+        return f"{issue['active_from']} から着手"
+    if result.reason == "blocked":
+        first = result.blockers[0]
+        root = (result.roots or result.blockers)[0]
+        return f"{root} 完了待ち ({first} 経由)" if root != first else f"{root} 完了待ち"
+    if result.reason == "exam-priority":
+        return "試験優先期間のため後回し"
+    if result.reason == "due-soon":
+        return "今日の主役候補"
+    return "期限まで余裕があるため後回し"
+
+
+def status_reason(
+    issue: dict[str, Any],
+    *,
+    today: dt.date,
+    closed_issue_seed_ids: set[str],
+    root_blockers: list[str] | None = None,
+) -> tuple[str, str]:
+    result = sync.StatusEngine([issue], closed_issue_seed_ids=closed_issue_seed_ids).status(issue["id"], today)
+    if result.blockers and root_blockers:
+        result = dataclasses.replace(result, roots=tuple(root_blockers))
+    return result.status, reason_text(issue, result)
 
 
 def notification_item(issue: dict[str, Any], existing_issue: dict[str, Any], reason: str) -> NotificationItem:
@@ -118,36 +114,161 @@ def sort_key(issue: dict[str, Any]) -> tuple[int, dt.date, dt.date]:
     return (priority, due_date, active_from)
 
 
-def build_plan(seed: dict[str, Any], existing_issues: list[dict[str, Any]], *, today: dt.date) -> DailyTaskPlan:
-    issue_map = parse_marker_issue_map(existing_issues)
-    closed_ids = closed_issue_seed_ids(existing_issues)
+@dataclasses.dataclass
+class PlanInputs:
+    """The date-independent half of planning: issue lookup, the status engine and ready-queue order."""
 
-    ready_candidates: list[tuple[dict[str, Any], dict[str, Any], str]] = []
-    blocked: list[NotificationItem] = []
-    deferred: list[NotificationItem] = []
+    open_issues: list[tuple[dict[str, Any], dict[str, Any]]]
+    engine: sync.StatusEngine
+    sort_keys: dict[str, tuple[int, dt.date, dt.date]] = dataclasses.field(default_factory=dict)
 
-    for issue in concrete_seed_issues(seed):
-        existing_issue = issue_map.get(issue["id"])
-        if not existing_issue or issue_state(existing_issue) != "open":
-            continue
+    def sort_key(self, issue: dict[str, Any]) -> tuple[int, dt.date, dt.date]:
+        # Only ready issues are ranked, and a calendar ranks the same ones on many days.
+        key = self.sort_keys.get(issue["id"])
+        if key is None:
+            key = self.sort_keys[issue["id"]] = sort_key(issue)
+        return key
 
-        status, reason = status_reason(issue, today=today, closed_issue_seed_ids=closed_ids)
-        if status == "未着手":
-            ready_candidates.append((issue, existing_issue, reason))
-        elif status == "ブロック中":
+
+@dataclasses.dataclass
+class DayPlan:
+    ready: list[NotificationItem]
+    blocked: list[NotificationItem]
+    deferred: list[NotificationItem]
+    # Open seed ids the blocked items wait on; closing one of them changes the plan.
+    blockers: list[str]
+
+    def daily_plan(self) -> DailyTaskPlan:
+        return DailyTaskPlan(
+            focus=self.ready[0] if self.ready else None,
+            blocked=self.blocked[:3],
+            deferred=self.deferred[:3],
+        )
+
+
+def plan_inputs(seed: dict[str, Any], existing_issues: sync.IssueIndex | list[dict[str, Any]]) -> PlanInputs:
+    index = sync.issue_index(existing_issues)
+    issue_map = parse_marker_issue_map(index)
+    graph = sync.DependencyGraph.from_seed(seed)
+    closed_ids = closed_issue_seed_ids(index)
+    open_issues = [
+        (issue, issue_map[issue["id"]])
+        for issue in concrete_seed_issues(seed)
+        if issue["id"] in issue_map and issue_state(issue_map[issue["id"]]) == "open"
+    ]
+    return PlanInputs(
+        open_issues=open_issues,
+        engine=sync.StatusEngine.from_seed(seed, closed_issue_seed_ids=closed_ids, graph=graph),
+    )
+
+
+def plan_day(
+    inputs: PlanInputs,
+    *,
+    today: dt.date,
+    statuses: dict[str, sync.StatusResult] | None = None,
+) -> DayPlan:
+    if statuses is None:
+        statuses = inputs.engine.evaluate(today, [issue["id"] for issue, _ in inputs.open_issues])
+    ready: list[tuple[dict[str, Any], dict[str, Any], str]] = []
+    blocked: list[NotificationItem] = []
+    deferred: list[NotificationItem] = []
+    blockers: set[str] = set()
+
+    for issue, existing_issue in inputs.open_issues:
+        result = statuses[issue["id"]]
+        reason = reason_text(issue, result)
+        if result.status == "未着手":
+            ready.append((issue, existing_issue, reason))
+        elif result.status == "ブロック中":
             blocked.append(notification_item(issue, existing_issue, reason))
-        elif status in {"バックログ", "延期"}:
+            blockers.update(result.blockers)
+            blockers.update(result.roots)
+        elif result.status in {"バックログ", "延期"}:
             deferred.append(notification_item(issue, existing_issue, reason))
 
-    ready_candidates.sort(key=lambda item: sort_key(item[0]))
-    focus = None
-    if ready_candidates:
-        selected_issue, selected_existing, reason = ready_candidates[0]
-        focus = notification_item(selected_issue, selected_existing, reason)
-
+    ready.sort(key=lambda item: inputs.sort_key(item[0]))
     blocked.sort(key=lambda item: item.issue_number)
     deferred.sort(key=lambda item: item.issue_number)
-    return DailyTaskPlan(focus=focus, blocked=blocked[:3], deferred=deferred[:3])
+    return DayPlan(
+        ready=[notification_item(issue, existing_issue, reason) for issue, existing_issue, reason in ready],
+        blocked=blocked,
+        deferred=deferred,
+        blockers=sorted(blockers),
+    )
+
+
+def build_plan(
+    seed: dict[str, Any],
+    existing_issues: sync.IssueIndex | list[dict[str, Any]],
+    *,
+    today: dt.date,
+) -> DailyTaskPlan:
+    return plan_day(plan_inputs(seed, existing_issues), today=today).daily_plan()
+
+
+CALENDAR_VERSION = 1
+
+
+def build_calendar(
+    seed: dict[str, Any],
+    existing_issues: sync.IssueIndex | list[dict[str, Any]],
+    *,
+    start: dt.date,
+    horizon: int,
+    seed_hash: str,
+) -> dict[str, Any]:
+    """Plan `horizon` days from `start`, re-planning only where the engine reports a transition."""
+    inputs = plan_inputs(seed, existing_issues)
+    open_ids = [issue["id"] for issue, _ in inputs.open_issues]
+    days: dict[str, dict[str, Any]] = {}
+    previous: dict[str, sync.StatusResult] | None = None
+    row: dict[str, Any] = {}
+    for day, statuses in inputs.engine.evaluate_range(start, horizon, open_ids).items():
+        if statuses is not previous:
+            row = dataclasses.asdict(plan_day(inputs, today=day, statuses=statuses))
+            previous = statuses
+        days[day.isoformat()] = row
+    return {
+        "version": CALENDAR_VERSION,
+        "start": start.isoformat(),
+        "horizon": horizon,
+        "seed_hash": seed_hash,
+        "open_seed_ids": sorted(issue["id"] for issue, _ in inputs.open_issues),
+        "closed_seed_ids": sorted(inputs.engine.closed_issue_seed_ids),
+        "days": days,
+    }
+
+
+def plan_from_calendar(
+    calendar: dict[str, Any],
+    seed: dict[str, Any],
+    existing_issues: sync.IssueIndex | list[dict[str, Any]],
+    *,
+    today: dt.date,
+    seed_hash: str,
+) -> DailyTaskPlan | None:
+    """Read today's precomputed row, dropping issues closed since the calendar was built."""
+    row = calendar.get("days", {}).get(today.isoformat())
+    if row is None or calendar.get("version") != CALENDAR_VERSION:
+        return None
+    if calendar.get("seed_hash") != seed_hash:
+        return None
+    index = sync.issue_index(existing_issues)
+    issue_map = parse_marker_issue_map(index)
+    open_ids = {
+        issue["id"]
+        for issue in concrete_seed_issues(seed)
+        if issue["id"] in issue_map and issue_state(issue_map[issue["id"]]) == "open"
+    }
+    newly_closed = closed_issue_seed_ids(index) - set(calendar["closed_seed_ids"])
+    if open_ids != set(calendar["open_seed_ids"]) - newly_closed or newly_closed & set(row["blockers"]):
+        return None
+
+    def items(key: str) -> list[NotificationItem]:
+        return [NotificationItem(**item) for item in row[key] if item["seed_id"] not in newly_closed]
+
+    return DayPlan(ready=items("ready"), blocked=items("blocked"), deferred=items("deferred"), blockers=[]).daily_plan()
 
 
 def render_issue_body(plan: DailyTaskPlan, *, today: dt.date, recipient: str) -> str:
@@ -205,32 +326,128 @@ def issue_title(today: dt.date) -> str:
     return f"[今日の主タスク] {today.year}/{today.month:02d}/{today.day:02d}（{day_name}）"
 
 
-def fetch_existing_issues(repo: str, *, limit: int = 500) -> list[dict[str, Any]]:
-    result = subprocess.run(
-        [
-            "gh",
-            "issue",
-            "list",
-            "--repo",
-            repo,
-            "--state",
-            "all",
-            "--limit",
-            str(limit),
-            "--json",
-            "number,title,body,state,labels",
-        ],
-        check=True,
-        capture_output=True,
-        text=True,
-        encoding="utf-8",
-    )
-    return json.loads(result.stdout)
+NOTIFY_LABEL = "daily-notify"
+
+# Search stops returning results after this many matches.
+SEARCH_RESULT_LIMIT = 1000
+
+MANAGED_ISSUE_QUERY = """
+query($query: String!, $after: String) {
+  search(type: ISSUE, query: $query, first: 100, after: $after) {
+    nodes {
+      ... on Issue {
+        number
+        state
+        body
+      }
+    }
+    pageInfo { hasNextPage endCursor }
+  }
+}
+"""
+
+ISSUE_LISTING_QUERY = """
+query(
+  $owner: String!, $name: String!, $labels: [String!], $states: [IssueState!],
+  $withIssues: Boolean!, $issuesAfter: String
+) {
+  repository(owner: $owner, name: $name) {
+    issues(first: 100, after: $issuesAfter, labels: $labels, states: $states) @include(if: $withIssues) {
+      nodes {
+        number
+        state
+        body
+      }
+      pageInfo { hasNextPage endCursor }
+    }
+  }
+}
+"""
+
+
+def marker_line(body: str | None) -> str:
+    for line in (body or "").splitlines():
+        if sync.MARKER_PREFIX in line:
+            return line.strip()
+    return ""
+
+
+def fetch_issue_listing(
+    repo: str,
+    *,
+    labels: list[str] | None = None,
+    states: list[str] | None = None,
+) -> list[dict[str, Any]]:
+    owner, name = repo.split("/", 1)
+    return sync.fetch_graphql_connections(
+        ISSUE_LISTING_QUERY,
+        {"owner": owner, "name": name, "labels": labels, "states": states},
+        ("repository",),
+        ("issues",),
+    )["issues"]
+
+
+def seed_work_item_ids(seed: dict[str, Any]) -> set[str]:
+    return {str(item["id"]) for _, item in sync.iter_seed_work_items(seed)}
+
+
+def fetch_existing_issues(repo: str, seed_ids: set[str]) -> list[dict[str, Any]]:
+    """Fetch the sync-managed issues, open and closed, as number, state and marker line only."""
+    query = f'repo:{repo} is:issue -label:{NOTIFY_LABEL} in:body "{sync.MARKER_PREFIX}"'
+    nodes = list(sync.iter_graphql_nodes(MANAGED_ISSUE_QUERY, {"query": query}, ("search",)))
+    found = {sync.marker_seed_id(sync.extract_marker(node.get("body"))) for node in nodes}
+    if len(nodes) >= SEARCH_RESULT_LIMIT or not seed_ids <= found:
+        nodes = fetch_issue_listing(repo)
+    return [
+        {"number": node["number"], "state": str(node.get("state") or "").lower(), "body": marker_line(node.get("body"))}
+        for node in nodes
+        if node.get("number") is not None and marker_line(node.get("body"))
+    ]
 
 
-def build_payload(seed_path: pathlib.Path, *, repo: str, today: dt.date, recipient: str) -> dict[str, str]:
-    seed = yaml.safe_load(seed_path.read_text(encoding="utf-8"))
-    plan = build_plan(seed, fetch_existing_issues(repo), today=today)
+def open_notification_numbers(repo: str) -> list[int]:
+    return [
+        node["number"]
+        for node in fetch_issue_listing(repo, labels=[NOTIFY_LABEL], states=["OPEN"])
+        if node.get("number") is not None
+    ]
+
+
+def publish_notification(repo: str, payload: dict[str, str], *, recipient: str) -> dict[str, Any]:
+    # Create before closing, so a failed create leaves yesterday's notice open rather than none.
+    previous = open_notification_numbers(repo)
+    created = sync.gh_api_json(
+        f"repos/{repo}/issues",
+        method="POST",
+        body={
+            "title": payload["title"],
+            "body": payload["body"],
+            "labels": [NOTIFY_LABEL],
+            "assignees": [recipient],
+        },
+    )
+    for number in previous:
+        if number != created["number"]:
+            sync.gh_api_json(f"repos/{repo}/issues/{number}", method="PATCH", body={"state": "closed"})
+    return created
+
+
+def build_payload(
+    seed_path: pathlib.Path,
+    *,
+    repo: str,
+    today: dt.date,
+    recipient: str,
+    calendar_path: pathlib.Path | None = None,
+) -> dict[str, str]:
+    seed = load_seed(seed_path)
+    existing_issues = fetch_existing_issues(repo, seed_work_item_ids(seed))
+    plan = None
+    if calendar_path is not None and calendar_path.exists():
+        calendar = json.loads(calendar_path.read_text(encoding="utf-8"))
+        plan = plan_from_calendar(calendar, seed, existing_issues, today=today, seed_hash=seed_digest(seed_path))
+    if plan is None:
+        plan = build_plan(seed, existing_issues, today=today)
     return {
         "title": issue_title(today),
         "body": render_issue_body(plan, today=today, recipient=recipient),
@@ -241,16 +458,70 @@ def main() -> None:
     parser = argparse.ArgumentParser(description="Render the daily focus task issue body.")
     parser.add_argument("--repo", required=True, help="GitHub repository in owner/name form.")
     parser.add_argument("--recipient", required=True, help="GitHub username to mention and assign.")
-    parser.add_argument("--seed-path", default="data/project-seed.yaml")
+    parser.add_argument(
+        "--seed-path",
+        default="data/project-seed.yaml",
+        help="Seed file, or a sharded seed directory written by scripts.shard_seed.",
+    )
     parser.add_argument("--today", help="Override the date used for planning (YYYY-MM-DD).")
-    parser.add_argument("--title-path", required=True)
-    parser.add_argument("--body-path", required=True)
+    parser.add_argument("--title-path")
+    parser.add_argument("--body-path")
+    parser.add_argument(
+        "--publish",
+        action="store_true",
+        help=f"Create today's issue and close the previous open '{NOTIFY_LABEL}' issues.",
+    )
+    parser.add_argument(
+        "--calendar",
+        help="Focus calendar JSON: written with --horizon, otherwise read for today's row when present.",
+    )
+    parser.add_argument(
+        "--horizon",
+        type=int,
+        help="Plan this many days from --today into --calendar instead of rendering today's issue.",
+    )
+    parser.add_argument(
+        "--transport",
+        choices=["auto", "http", "gh"],
+        default="auto",
+        help="GitHub API transport, as for github_project_sync.",
+    )
     args = parser.parse_args()
+    if args.horizon is not None and not args.calendar:
+        parser.error("--horizon needs --calendar")
+    if args.horizon is None and not args.publish and not (args.title_path and args.body_path):
+        parser.error("pass --publish, or --title-path and --body-path")
 
+    sync.set_transport(sync.build_transport(args.transport))
     today = sync.parse_iso_date(args.today) if args.today else sync.iso_today()
-    payload = build_payload(pathlib.Path(args.seed_path), repo=args.repo, today=today, recipient=args.recipient)
-    pathlib.Path(args.title_path).write_text(payload["title"], encoding="utf-8")
-    pathlib.Path(args.body_path).write_text(payload["body"], encoding="utf-8")
+    calendar_path = pathlib.Path(args.calendar) if args.calendar else None
+    if args.horizon is not None:
+        seed = load_seed(pathlib.Path(args.seed_path))
+        calendar = build_calendar(
+            seed,
+            fetch_existing_issues(args.repo, seed_work_item_ids(seed)),
+            start=today,
+            horizon=args.horizon,
+            seed_hash=seed_digest(pathlib.Path(args.seed_path)),
+        )
+        calendar_path.parent.mkdir(parents=True, exist_ok=True)
+        calendar_path.write_text(json.dumps(calendar, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+        print(f"Focus calendar: {calendar_path} ({args.horizon} days from {today.isoformat()})")
+        return
+    payload = build_payload(
+        pathlib.Path(args.seed_path),
+        repo=args.repo,
+        today=today,
+        recipient=args.recipient,
+        calendar_path=calendar_path,
+    )
+    if args.title_path:
+        pathlib.Path(args.title_path).write_text(payload["title"], encoding="utf-8")
+    if args.body_path:
+        pathlib.Path(args.body_path).write_text(payload["body"], encoding="utf-8")
+    if args.publish:
+        created = publish_notification(args.repo, payload, recipient=args.recipient)
+        print(created.get("html_url") or f"#{created['number']}")
 
 
 if __name__ == "__main__":
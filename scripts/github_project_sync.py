@@ -1,24 +1,41 @@
 from __future__ import annotations
 
 import argparse
-import copy
+import bisect
+import contextlib
 import dataclasses
 import datetime as dt
+import functools
 import hashlib
+import http.client
 import json
+import os
 import pathlib
+import pickle
+import random
 import re
+import shutil
 import subprocess
 import sys
 import tempfile
-from collections import Counter, defaultdict
-from typing import Any
+import threading
+import time
+import urllib.parse
+from collections import Counter, defaultdict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Iterable, Iterator
 
-import yaml
+if __package__ in {None, ""}:
+    sys.path.append(str(pathlib.Path(__file__).resolve().parents[1]))
+
+from scripts.seed_loader import SEED_CACHE_DIR, SEED_LOAD_ERRORS, load_seed, seed_source
 
 
 MARKER_PREFIX = "github-project-sync"
+GITHUB_API_URL = "https://api.github.com"
 REPORT_VERSION = 2
+SYNC_REPORT_VERSION = 3
+BODY_TEMPLATE_VERSION = 1
 DATE_WINDOW_DAYS = 45
 
 TASK_TYPE_TO_FIELD = {
@@ -117,6 +134,46 @@ class SyncOperation:
     details: dict[str, Any]
 
 
+class ApplyExecutor:
+    def __init__(self, concurrency: int = 1) -> None:
+        self.concurrency = max(1, concurrency)
+        self._pool: ThreadPoolExecutor | None = None
+        self._pending: list[tuple[str, Future[Any]]] = []
+
+    def submit(
+        self, description: str, fn: Callable[..., Any], *args: Any, serial: bool = False, **kwargs: Any
+    ) -> None:
+        """Run `fn` on a worker thread, or inline in submission order when `serial` (creates)."""
+        if self.concurrency == 1 or serial:
+            future: Future[Any] = Future()
+            try:
+                future.set_result(fn(*args, **kwargs))
+            except SyncCommandError as exc:
+                future.set_exception(exc)
+        else:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="sync-apply")
+            future = self._pool.submit(fn, *args, **kwargs)
+        self._pending.append((description, future))
+
+    def drain(self) -> list[str]:
+        failures: list[str] = []
+        pending, self._pending = self._pending, []
+        for description, future in pending:
+            exc = future.exception()
+            if exc is None:
+                continue
+            if not isinstance(exc, SyncCommandError):
+                raise exc
+            failures.append(f"{description}: {exc}")
+        return failures
+
+    def shutdown(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+
+
 @dataclasses.dataclass
 class SyncContext:
     dry_run: bool
@@ -126,20 +183,60 @@ class SyncContext:
     today: dt.date
     seed_path: pathlib.Path
     report_dir: pathlib.Path
+    field_batch_size: int = 50
+    item_batch_size: int = 50
+    concurrency: int = 1
+    full: bool = False
+    # False when the previous apply left its journal behind: its field writes may be missing.
+    fields_settled: bool = True
+    journal: OperationJournal | None = None
+    report: ReportStream | None = None
+    # Kept only while no report stream is attached; with one, operations go to disk and to `summary`.
     operations: list[SyncOperation] = dataclasses.field(default_factory=list)
     warnings: list[str] = dataclasses.field(default_factory=list)
     errors: list[str] = dataclasses.field(default_factory=list)
 
+    def __post_init__(self) -> None:
+        self._lock = threading.Lock()
+        self.executor = ApplyExecutor(self.concurrency)
+        self.unchanged_seed_ids: set[str] = set()
+        self.summary: dict[str, Counter[str]] = defaultdict(Counter)
+
     def record(self, category: str, action: str, target: str, **details: Any) -> None:
-        self.operations.append(
-            SyncOperation(category=category, action=action, target=target, details=details)
-        )
+        operation = SyncOperation(category=category, action=action, target=target, details=details)
+        with self._lock:
+            self.summary[category][action] += 1
+            if self.report is None:
+                self.operations.append(operation)
+        if self.journal is not None and action != "noop":
+            self.journal.operation(operation)
+        if self.report is not None:
+            self.report.operation(operation)
 
     def warn(self, message: str) -> None:
-        self.warnings.append(message)
+        with self._lock:
+            self.warnings.append(message)
+        if self.report is not None:
+            self.report.append({"type": "warning", "message": message})
 
     def error(self, message: str) -> None:
-        self.errors.append(message)
+        with self._lock:
+            self.errors.append(message)
+        if self.report is not None:
+            self.report.append({"type": "error", "message": message})
+
+    def submit(
+        self, description: str, fn: Callable[..., Any], *args: Any, serial: bool = False, **kwargs: Any
+    ) -> None:
+        self.executor.submit(description, fn, *args, serial=serial, **kwargs)
+
+    def drain(self, stage: str) -> None:
+        # Stage barrier: later stages depend on the writes submitted so far.
+        failures = self.executor.drain()
+        for failure in failures:
+            self.error(failure)
+        if failures:
+            raise SyncCommandError(f"{len(failures)} write(s) failed during {stage}")
 
 
 @dataclasses.dataclass
@@ -169,6 +266,7 @@ def run_command(
             handle.close()
             command.extend(["--input", str(input_path)])
 
+        started = time.perf_counter()
         result = subprocess.run(
             command,
             cwd=str(cwd) if cwd else None,
@@ -176,6 +274,7 @@ def run_command(
             text=True,
             encoding="utf-8",
         )
+        PROFILER.record_command(command, time.perf_counter() - started, failed=result.returncode != 0)
         if check and result.returncode != 0:
             stderr = result.stderr.strip() or result.stdout.strip()
             raise SyncCommandError(f"{' '.join(command)} failed: {stderr}")
@@ -185,16 +284,563 @@ def run_command(
             input_path.unlink()
 
 
-def run_json(
-    args: list[str],
-    *,
-    input_obj: dict[str, Any] | list[Any] | None = None,
-    cwd: pathlib.Path | None = None,
-) -> Any:
-    output = run_command(args, input_obj=input_obj, cwd=cwd)
-    if not output:
+@dataclasses.dataclass
+class GitHubResponse:
+    status: int
+    headers: dict[str, str]
+    data: Any
+    sent: int = 0
+    received: int = 0
+
+
+class MalformedResponseError(http.client.HTTPException):
+    """A 2xx body that is not JSON, such as a truncated read; retried like a dropped connection."""
+
+
+def decode_response_body(status: int, text: str) -> Any:
+    """Parse a response body, tolerating the HTML or plain-text pages proxies answer errors with."""
+    if not text.strip():
+        return None
+    try:
+        return json.loads(text)
+    except json.JSONDecodeError:
+        excerpt = " ".join(text.split())[:200]
+        if status >= 400:
+            return excerpt
+        raise MalformedResponseError(f"HTTP {status} with a non-JSON body: {excerpt}") from None
+
+
+def parse_gh_include_output(output: str) -> GitHubResponse:
+    parts = re.split(r"\r?\n\r?\n", output, maxsplit=1)
+    head = parts[0]
+    body_text = parts[1] if len(parts) > 1 else ""
+    lines = head.splitlines()
+    if not lines or not lines[0].startswith("HTTP/"):
+        raise SyncCommandError(f"Unexpected gh api output: {output[:200]}")
+    status = int(lines[0].split()[1])
+    headers: dict[str, str] = {}
+    for line in lines[1:]:
+        key, _separator, value = line.partition(":")
+        headers[key.strip().lower()] = value.strip()
+    data = decode_response_body(status, body_text)
+    return GitHubResponse(status=status, headers=headers, data=data, received=len(body_text.encode("utf-8")))
+
+
+class GhCliTransport:
+    name = "gh"
+
+    def request(
+        self,
+        method: str,
+        endpoint: str,
+        *,
+        body: dict[str, Any] | list[Any] | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> GitHubResponse:
+        if endpoint.startswith(("http://", "https://")):
+            parsed = urllib.parse.urlsplit(endpoint)
+            endpoint = parsed.path.lstrip("/") + (f"?{parsed.query}" if parsed.query else "")
+        command = ["gh", "api", "--include", "--method", method, endpoint]
+        for key, value in (headers or {}).items():
+            command.extend(["--header", f"{key}: {value}"])
+        if body is not None:
+            command.extend(["--input", "-"])
+        payload = json.dumps(body, ensure_ascii=False) if body is not None else None
+        result = subprocess.run(
+            command,
+            input=payload,
+            capture_output=True,
+            text=True,
+            encoding="utf-8",
+        )
+        if not result.stdout.strip():
+            stderr = result.stderr.strip() or f"exit code {result.returncode}"
+            raise SyncCommandError(f"{' '.join(command)} failed: {stderr}")
+        response = parse_gh_include_output(result.stdout)
+        response.sent = len(payload.encode("utf-8")) if payload is not None else 0
+        return response
+
+
+class HttpTransport:
+    # Keep-alive session: httpx when installed, otherwise one http.client connection per thread.
+    name = "http"
+
+    def __init__(
+        self,
+        token: str,
+        *,
+        base_url: str = GITHUB_API_URL,
+        graphql_url: str | None = None,
+        timeout: float = 30.0,
+    ) -> None:
+        self.base_url = base_url.rstrip("/")
+        self.graphql_url = graphql_url or f"{self.base_url}/graphql"
+        self.timeout = timeout
+        self.default_headers = {
+            "Authorization": f"Bearer {token}",
+            "Accept": "application/vnd.github+json",
+            "X-GitHub-Api-Version": "2022-11-28",
+            "User-Agent": "github-project-sync",
+        }
+        self._local = threading.local()
+        self._client = None
+        try:
+            import httpx
+        except ImportError:
+            return
+        try:
+            import h2  # noqa: F401
+        except ImportError:
+            http2 = False
+        else:
+            http2 = True
+        self._client = httpx.Client(http2=http2, headers=self.default_headers, timeout=timeout)
+
+    def url_for(self, endpoint: str) -> str:
+        if endpoint.startswith(("http://", "https://")):
+            return endpoint
+        if endpoint == "graphql":
+            return self.graphql_url
+        return f"{self.base_url}/{endpoint.lstrip('/')}"
+
+    def request(
+        self,
+        method: str,
+        endpoint: str,
+        *,
+        body: dict[str, Any] | list[Any] | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> GitHubResponse:
+        url = self.url_for(endpoint)
+        payload = json.dumps(body, ensure_ascii=False).encode("utf-8") if body is not None else None
+        request_headers = dict(headers or {})
+        if payload is not None:
+            request_headers["Content-Type"] = "application/json"
+        if self._client is not None:
+            import httpx
+
+            try:
+                response = self._client.request(method, url, content=payload, headers=request_headers)
+            except httpx.TransportError as exc:
+                raise ConnectionError(str(exc)) from exc
+            decoded = self._decode(response.status_code, dict(response.headers), response.content)
+        else:
+            status, response_headers, raw = self._stdlib_request(method, url, payload, request_headers)
+            decoded = self._decode(status, response_headers, raw)
+        decoded.sent = len(payload) if payload is not None else 0
+        return decoded
+
+    def _connection(self, parsed: urllib.parse.SplitResult, *, fresh: bool = False) -> http.client.HTTPConnection:
+        key = (parsed.scheme, parsed.netloc)
+        connections = getattr(self._local, "connections", None)
+        if connections is None:
+            connections = self._local.connections = {}
+        connection = connections.get(key)
+        if connection is None or fresh:
+            if connection is not None:
+                connection.close()
+            connection_class = (
+                http.client.HTTPSConnection if parsed.scheme == "https" else http.client.HTTPConnection
+            )
+            connection = connection_class(parsed.netloc, timeout=self.timeout)
+            connections[key] = connection
+        return connection
+
+    def _stdlib_request(
+        self,
+        method: str,
+        url: str,
+        payload: bytes | None,
+        headers: dict[str, str],
+    ) -> tuple[int, dict[str, str], bytes]:
+        parsed = urllib.parse.urlsplit(url)
+        target = parsed.path + (f"?{parsed.query}" if parsed.query else "")
+        request_headers = {**self.default_headers, **headers}
+        for attempt in range(2):
+            connection = self._connection(parsed, fresh=attempt > 0)
+            try:
+                connection.request(method, target, body=payload, headers=request_headers)
+                response = connection.getresponse()
+                raw = response.read()
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                # The server closed an idle keep-alive connection; reconnect once.
+                if attempt:
+                    raise
+                continue
+            return response.status, dict(response.getheaders()), raw
+        raise SyncCommandError(f"{method} {url} failed: connection closed")
+
+    @staticmethod
+    def _decode(status: int, headers: dict[str, str], raw: bytes) -> GitHubResponse:
+        data = decode_response_body(status, raw.decode("utf-8", errors="replace"))
+        return GitHubResponse(
+            status=status,
+            headers={key.lower(): value for key, value in headers.items()},
+            data=data,
+            received=len(raw),
+        )
+
+
+def fixture_key(method: str, endpoint: str, body: Any) -> str:
+    return content_hash([method.upper(), endpoint, body])
+
+
+class RecordingTransport:
+    name = "recording"
+
+    def __init__(self, inner: Any, path: pathlib.Path) -> None:
+        self.inner = inner
+        self.path = path
+        self.base_url = getattr(inner, "base_url", GITHUB_API_URL)
+        self._lock = threading.Lock()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("", encoding="utf-8")
+
+    def request(
+        self,
+        method: str,
+        endpoint: str,
+        *,
+        body: dict[str, Any] | list[Any] | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> GitHubResponse:
+        response = self.inner.request(method, endpoint, body=body, headers=headers)
+        record = {
+            "key": fixture_key(method, endpoint, body),
+            "method": method.upper(),
+            "endpoint": endpoint,
+            "status": response.status,
+            "headers": response.headers,
+            "data": response.data,
+        }
+        with self._lock:
+            with self.path.open("a", encoding="utf-8") as handle:
+                handle.write(json.dumps(record, ensure_ascii=False) + "\n")
+        return response
+
+
+class FixtureTransport:
+    # Replays a RecordingTransport file, matching requests by method, endpoint and body.
+    name = "fixture"
+
+    def __init__(self, path: pathlib.Path) -> None:
+        self.base_url = GITHUB_API_URL
+        self.responses: dict[str, list[GitHubResponse]] = defaultdict(list)
+        self.served: Counter[str] = Counter()
+        self._lock = threading.Lock()
+        for line in path.read_text(encoding="utf-8").splitlines():
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            # Recorded quota headers would make the replay sleep; drop them.
+            headers = {
+                key: value for key, value in record["headers"].items() if not key.startswith("x-ratelimit-")
+            }
+            self.responses[record["key"]].append(GitHubResponse(record["status"], headers, record["data"]))
+
+    def request(
+        self,
+        method: str,
+        endpoint: str,
+        *,
+        body: dict[str, Any] | list[Any] | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> GitHubResponse:
+        key = fixture_key(method, endpoint, body)
+        recorded = self.responses.get(key)
+        if not recorded:
+            raise SyncCommandError(f"No recorded fixture for {method.upper()} {endpoint}")
+        with self._lock:
+            index = min(self.served[key], len(recorded) - 1)
+            self.served[key] += 1
+        return recorded[index]
+
+
+class RateLimiter:
+    def __init__(
+        self,
+        *,
+        reserve: int = 50,
+        secondary_delay: float = 60.0,
+        max_sleep: float = 900.0,
+        backoff_base: float = 1.0,
+        backoff_cap: float = 60.0,
+        clock: Callable[[], float] = time.time,
+        sleep: Callable[[float], None] = time.sleep,
+        jitter: Callable[[], float] = random.random,
+    ) -> None:
+        self.reserve = reserve
+        self.secondary_delay = secondary_delay
+        self.max_sleep = max_sleep
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.clock = clock
+        self.sleep = sleep
+        self.jitter = jitter
+        self._lock = threading.Lock()
+        self._resume_at = 0.0
+
+    def pause(self, seconds: float) -> None:
+        with self._lock:
+            self._resume_at = max(self._resume_at, self.clock() + min(max(seconds, 0.0), self.max_sleep))
+
+    def wait(self) -> None:
+        with self._lock:
+            delay = self._resume_at - self.clock()
+        if delay > 0:
+            self.sleep(delay)
+
+    def backoff(self, attempt: int) -> float:
+        # Full jitter: spread retries of parallel writers instead of retrying in lockstep.
+        return self.jitter() * min(self.backoff_cap, self.backoff_base * 2**attempt)
+
+    def observe(self, response: GitHubResponse, attempt: int = 0) -> float | None:
+        headers = response.headers
+        remaining = headers.get("x-ratelimit-remaining")
+        reset = headers.get("x-ratelimit-reset")
+        until_reset = float(reset) - self.clock() if reset else self.secondary_delay
+        if response.status in (403, 429):
+            error_text = response_error_text(response.data).lower()
+            if "retry-after" in headers:
+                delay = float(headers["retry-after"])
+            elif remaining == "0":
+                delay = until_reset
+            elif "rate limit" in error_text:
+                # Secondary limits: wait at least secondary_delay, doubling on each repeat.
+                delay = self.secondary_delay * 2**attempt * (1 + 0.25 * self.jitter())
+            else:
+                return None
+            self.pause(delay)
+            return delay
+        if remaining is not None and int(remaining) <= self.reserve:
+            self.pause(until_reset)
+        return None
+
+
+RATE_LIMITER = RateLimiter()
+RATE_LIMIT_RETRIES = 3
+RETRYABLE_STATUSES = {500, 502, 503, 504}
+# Dropped connections, timeouts and success bodies that are not JSON.
+TRANSIENT_ERRORS: tuple[type[BaseException], ...] = (OSError, http.client.HTTPException)
+
+_TRANSPORT: GhCliTransport | HttpTransport | None = None
+# Upper bounds of the request latency histogram buckets, in milliseconds.
+LATENCY_BUCKETS_MS = (25, 50, 100, 250, 500, 1000, 2500, 5000)
+GRAPHQL_OPERATION_PATTERN = re.compile(r"^\s*(query|mutation)?[^{]*\{\s*(?:\w+\s*:\s*)?(\w+)")
+
+
+@functools.lru_cache(maxsize=256)
+def graphql_operation_name(query: str) -> str:
+    match = GRAPHQL_OPERATION_PATTERN.match(query)
+    if not match:
+        return "graphql"
+    return f"graphql {match.group(1) or 'query'} {match.group(2)}"
+
+
+def endpoint_name(method: str, endpoint: str, body: Any) -> str:
+    """Group requests by operation: GraphQL by root field, REST by path with ids and owner/repo masked."""
+    if endpoint == "graphql" or endpoint.endswith("/graphql"):
+        query = body.get("query", "") if isinstance(body, dict) else ""
+        return graphql_operation_name(query)
+    path = urllib.parse.urlsplit(endpoint).path.strip("/") if "://" in endpoint else endpoint.split("?", 1)[0]
+    segments = path.strip("/").split("/")
+    if len(segments) >= 3 and segments[0] == "repos":
+        segments[1:3] = ["{owner}", "{repo}"]
+    masked = "/".join("{n}" if segment.isdigit() else segment for segment in segments)
+    return f"{method.upper()} {masked}"
+
+
+class SyncProfiler:
+    """Wall-clock spans per pipeline phase plus per-endpoint request counts, latency and bytes."""
+
+    def __init__(self, *, clock: Callable[[], float] = time.perf_counter) -> None:
+        self.clock = clock
+        self.spans: dict[str, float] = {}
+        self.requests: dict[str, dict[str, Any]] = {}
+        self.commands: dict[str, dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    @contextlib.contextmanager
+    def span(self, name: str) -> Iterator[None]:
+        started = self.clock()
+        try:
+            yield
+        finally:
+            elapsed = self.clock() - started
+            with self._lock:
+                self.spans[name] = self.spans.get(name, 0.0) + elapsed
+
+    @staticmethod
+    def _observe(table: dict[str, dict[str, Any]], key: str, seconds: float) -> dict[str, Any]:
+        entry = table.get(key)
+        if entry is None:
+            entry = table[key] = {
+                "count": 0,
+                "errors": 0,
+                "seconds": 0.0,
+                "max_ms": 0.0,
+                "sent": 0,
+                "received": 0,
+                "histogram": [0] * (len(LATENCY_BUCKETS_MS) + 1),
+            }
+        milliseconds = seconds * 1000
+        entry["count"] += 1
+        entry["seconds"] += seconds
+        entry["max_ms"] = max(entry["max_ms"], milliseconds)
+        entry["histogram"][bisect.bisect_left(LATENCY_BUCKETS_MS, milliseconds)] += 1
+        return entry
+
+    def record_request(
+        self,
+        method: str,
+        endpoint: str,
+        body: Any,
+        seconds: float,
+        response: GitHubResponse | None,
+    ) -> None:
+        key = endpoint_name(method, endpoint, body)
+        with self._lock:
+            entry = self._observe(self.requests, key, seconds)
+            if response is None or response.status >= 400:
+                entry["errors"] += 1
+            if response is not None:
+                entry["sent"] += response.sent
+                entry["received"] += response.received
+
+    def record_command(self, command: list[str], seconds: float, *, failed: bool) -> None:
+        key = " ".join(command[:2])
+        with self._lock:
+            entry = self._observe(self.commands, key, seconds)
+            entry["errors"] += int(failed)
+
+    def to_dict(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "spans": {name: round(seconds, 4) for name, seconds in self.spans.items()},
+                "requests": {key: dict(entry, seconds=round(entry["seconds"], 4)) for key, entry in self.requests.items()},
+                "commands": {key: dict(entry, seconds=round(entry["seconds"], 4)) for key, entry in self.commands.items()},
+                "latency_buckets_ms": list(LATENCY_BUCKETS_MS),
+            }
+
+    def render(self) -> list[str]:
+        profile = self.to_dict()
+        lines = ["Profile:", "- spans:"]
+        for name, seconds in profile["spans"].items():
+            lines.append(f"  - {name}: {seconds:.3f}s")
+        bucket_labels = [f"<={bound}ms" for bound in LATENCY_BUCKETS_MS] + [f">{LATENCY_BUCKETS_MS[-1]}ms"]
+        for title, table in (("requests", profile["requests"]), ("commands", profile["commands"])):
+            if not table:
+                continue
+            lines.append(f"- {title}:")
+            for key, entry in sorted(table.items(), key=lambda pair: -pair[1]["seconds"]):
+                histogram = " ".join(
+                    f"{label}:{count}" for label, count in zip(bucket_labels, entry["histogram"]) if count
+                )
+                lines.append(
+                    f"  - {key}: {entry['count']} call(s), {entry['errors']} error(s), {entry['seconds']:.3f}s, "
+                    f"max {entry['max_ms']:.0f}ms, out {entry['sent']} B, in {entry['received']} B [{histogram}]"
+                )
+        return lines
+
+
+PROFILER = SyncProfiler()
+
+
+def set_profiler(profiler: SyncProfiler) -> None:
+    global PROFILER
+    PROFILER = profiler
+
+
+def set_transport(transport: GhCliTransport | HttpTransport | None) -> None:
+    global _TRANSPORT
+    _TRANSPORT = transport
+
+
+def get_transport() -> GhCliTransport | HttpTransport:
+    global _TRANSPORT
+    if _TRANSPORT is None:
+        _TRANSPORT = GhCliTransport()
+    return _TRANSPORT
+
+
+def resolve_github_token() -> str | None:
+    for key in ("GH_TOKEN", "GITHUB_TOKEN"):
+        if os.environ.get(key):
+            return os.environ[key]
+    try:
+        return run_command(["gh", "auth", "token"]) or None
+    except (SyncCommandError, OSError):
         return None
-    return json.loads(output)
+
+
+def build_transport(kind: str) -> GhCliTransport | HttpTransport:
+    if kind == "gh":
+        return GhCliTransport()
+    token = resolve_github_token()
+    if token:
+        return HttpTransport(
+            token,
+            base_url=os.environ.get("GITHUB_API_URL") or GITHUB_API_URL,
+            graphql_url=os.environ.get("GITHUB_GRAPHQL_URL") or None,
+        )
+    if kind == "http":
+        raise SyncCommandError("No GitHub token for the http transport; set GH_TOKEN or run `gh auth login`.")
+    return GhCliTransport()
+
+
+def response_error_text(data: Any) -> str:
+    if isinstance(data, dict):
+        if data.get("errors") and isinstance(data["errors"], list):
+            return "; ".join(str(error.get("message", error)) for error in data["errors"])
+        if data.get("message"):
+            return str(data["message"])
+    if isinstance(data, str):
+        return data[:500]
+    return json.dumps(data, ensure_ascii=False)[:500] if data is not None else ""
+
+
+def is_idempotent_request(method: str, endpoint: str, body: Any) -> bool:
+    if method.upper() != "POST":
+        return True
+    query = body.get("query", "") if endpoint == "graphql" and isinstance(body, dict) else ""
+    return bool(query) and not query.lstrip().startswith("mutation")
+
+
+def github_request(
+    method: str,
+    endpoint: str,
+    *,
+    body: dict[str, Any] | list[Any] | None = None,
+    headers: dict[str, str] | None = None,
+    idempotent: bool | None = None,
+) -> GitHubResponse:
+    """Send one request, waiting out rate limits; 5xx and dropped connections are retried only if idempotent."""
+    if idempotent is None:
+        idempotent = is_idempotent_request(method, endpoint, body)
+    for attempt in range(RATE_LIMIT_RETRIES + 1):
+        RATE_LIMITER.wait()
+        last_attempt = attempt == RATE_LIMIT_RETRIES
+        started = time.perf_counter()
+        try:
+            response = get_transport().request(method, endpoint, body=body, headers=headers)
+        except TRANSIENT_ERRORS as exc:
+            PROFILER.record_request(method, endpoint, body, time.perf_counter() - started, None)
+            if not idempotent or last_attempt:
+                raise SyncCommandError(f"{method} {endpoint} failed: {exc}") from exc
+            RATE_LIMITER.sleep(RATE_LIMITER.backoff(attempt))
+            continue
+        PROFILER.record_request(method, endpoint, body, time.perf_counter() - started, response)
+        if RATE_LIMITER.observe(response, attempt) is not None and not last_attempt:
+            continue
+        if response.status in RETRYABLE_STATUSES and idempotent and not last_attempt:
+            RATE_LIMITER.sleep(RATE_LIMITER.backoff(attempt))
+            continue
+        break
+    if response.status >= 400:
+        raise SyncCommandError(
+            f"{method} {endpoint} failed: HTTP {response.status} {response_error_text(response.data)}"
+        )
+    return response
 
 
 def gh_api_json(
@@ -202,18 +848,121 @@ def gh_api_json(
     *,
     method: str = "GET",
     body: dict[str, Any] | list[Any] | None = None,
-    cwd: pathlib.Path | None = None,
 ) -> Any:
-    return run_json(["gh", "api", "--method", method, endpoint], input_obj=body, cwd=cwd)
+    return github_request(method, endpoint, body=body).data
+
+
+class SyncCache:
+    def __init__(self, path: pathlib.Path, *, read_enabled: bool = True) -> None:
+        self.path = path
+        self.read_enabled = read_enabled
+        self.entries: dict[str, dict[str, Any]] = {}
+        self.stats: Counter[str] = Counter()
+        self._lock = threading.Lock()
+        if path.exists():
+            try:
+                self.entries = json.loads(path.read_text(encoding="utf-8")).get("entries", {})
+            except (OSError, json.JSONDecodeError):
+                self.entries = {}
+
+    def lookup(self, key: str) -> dict[str, Any] | None:
+        if not self.read_enabled:
+            return None
+        return self.entries.get(key)
+
+    def store(self, key: str, data: Any, *, watermark: str | None = None) -> None:
+        with self._lock:
+            self.entries[key] = {
+                "watermark": watermark,
+                "fetched_at": dt.datetime.now(dt.UTC).strftime("%Y-%m-%dT%H:%M:%SZ"),
+                "data": data,
+            }
 
+    def invalidate(self, prefix: str) -> None:
+        with self._lock:
+            for key in [key for key in self.entries if key.startswith(prefix)]:
+                del self.entries[key]
+
+    def save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.path.with_suffix(".tmp")
+        temp_path.write_text(json.dumps({"entries": self.entries}, ensure_ascii=False), encoding="utf-8")
+        temp_path.replace(self.path)
+
+
+def sync_cache_path(cache_dir: pathlib.Path, repo: RepoTarget) -> pathlib.Path:
+    return cache_dir / f"{repo.owner}__{repo.repo}.json"
+
+
+SYNC_CACHE: SyncCache | None = None
 
-def gh_graphql(query: str, variables: dict[str, Any], *, cwd: pathlib.Path | None = None) -> Any:
-    payload = {"query": query, "variables": variables}
-    return run_json(["gh", "api", "graphql", "--method", "POST"], input_obj=payload, cwd=cwd)
 
+def set_sync_cache(cache: SyncCache | None) -> None:
+    global SYNC_CACHE
+    SYNC_CACHE = cache
 
-def gh_project_json(args: list[str], *, cwd: pathlib.Path | None = None) -> Any:
-    return run_json(["gh", "project", *args], cwd=cwd)
+
+def iter_graphql_nodes(
+    query: str,
+    variables: dict[str, Any],
+    connection_path: tuple[str, ...],
+) -> Iterator[dict[str, Any]]:
+    cursor: str | None = None
+    while True:
+        payload = gh_graphql(query, {**variables, "after": cursor})
+        connection: Any = payload.get("data") or {}
+        for key in connection_path:
+            connection = (connection or {}).get(key)
+        if not connection:
+            return
+        yield from connection.get("nodes") or []
+        page_info = connection.get("pageInfo") or {}
+        if not page_info.get("hasNextPage"):
+            return
+        cursor = page_info.get("endCursor")
+
+
+def fetch_graphql_connections(
+    query: str,
+    variables: dict[str, Any],
+    root_path: tuple[str, ...],
+    connections: tuple[str, ...],
+) -> dict[str, list[dict[str, Any]]]:
+    # Each connection is guarded by @include(if: $with<Name>) and paged by $<name>After.
+    nodes: dict[str, Any] = {name: [] for name in connections}
+    cursors: dict[str, str | None] = {name: None for name in connections}
+    pending = list(connections)
+    while pending:
+        page_variables = dict(variables)
+        for name in connections:
+            page_variables[f"with{name.capitalize()}"] = name in pending
+            page_variables[f"{name}After"] = cursors[name]
+        payload = gh_graphql(query, page_variables)
+        container: Any = payload.get("data") or {}
+        for key in root_path:
+            container = (container or {}).get(key)
+        if not container:
+            break
+        # Scalar fields of the root object (ids, timestamps) come back on every page.
+        root_fields = {key: value for key, value in container.items() if key not in connections}
+        nodes.setdefault(root_path[-1], {}).update(root_fields)
+        for name in list(pending):
+            connection = container.get(name) or {}
+            nodes[name].extend(connection.get("nodes") or [])
+            page_info = connection.get("pageInfo") or {}
+            if page_info.get("hasNextPage") and page_info.get("endCursor"):
+                cursors[name] = page_info["endCursor"]
+            else:
+                pending.remove(name)
+    return nodes
+
+
+def gh_graphql(query: str, variables: dict[str, Any], *, idempotent: bool | None = None) -> Any:
+    payload = {"query": query, "variables": variables}
+    data = github_request("POST", "graphql", body=payload, idempotent=idempotent).data
+    if isinstance(data, dict) and data.get("errors"):
+        raise SyncCommandError(f"graphql failed: {response_error_text(data)}")
+    return data
 
 
 def git_remote_url(cwd: pathlib.Path) -> str | None:
@@ -237,6 +986,10 @@ def sha256_text(value: str) -> str:
     return hashlib.sha256(value.encode("utf-8")).hexdigest()
 
 
+def content_hash(value: Any) -> str:
+    return sha256_text(json.dumps(value, ensure_ascii=False, sort_keys=True, default=str))
+
+
 def normalize_text(value: str | None) -> str:
     return (value or "").replace("\r\n", "\n").strip()
 
@@ -278,15 +1031,30 @@ def iso_today() -> dt.date:
     return dt.date.today()
 
 
+@functools.lru_cache(maxsize=8192)
+def _iso_date_or_none(value: str) -> dt.date | None:
+    try:
+        return dt.date.fromisoformat(value)
+    except ValueError:
+        return None
+
+
 def parse_iso_date(value: str | None) -> dt.date | None:
     if not value:
         return None
-    return dt.date.fromisoformat(value)
+    if not isinstance(value, str):
+        return dt.date.fromisoformat(value)
+    parsed = _iso_date_or_none(value)
+    if parsed is None:
+        raise ValueError(f"Invalid isoformat string: {value!r}")
+    return parsed
 
 
 def is_valid_iso_date(value: str | None) -> bool:
     if value in (None, ""):
         return True
+    if isinstance(value, str):
+        return _iso_date_or_none(value) is not None
     try:
         parse_iso_date(value)
     except ValueError:
@@ -381,6 +1149,137 @@ def iter_seed_work_items(seed: dict[str, Any]) -> list[tuple[str, dict[str, Any]
     return items
 
 
+class DependencyGraph:
+    """`blocked_by` edges over every seed work item, resolved once per seed."""
+
+    def __init__(self, items: list[dict[str, Any]]) -> None:
+        self.items = {item["id"]: item for item in items}
+        self.blockers: dict[str, list[str]] = {}
+        self.dependents: dict[str, list[str]] = defaultdict(list)
+        for item_id, item in self.items.items():
+            references = item.get("blocked_by") if isinstance(item.get("blocked_by"), list) else []
+            self.blockers[item_id] = [blocker for blocker in dict.fromkeys(references) if blocker in self.items]
+            for blocker in self.blockers[item_id]:
+                self.dependents[blocker].append(item_id)
+        self.order = self._topological_order()
+        self.position = {item_id: index for index, item_id in enumerate(self.order)}
+        self._transitive: dict[str, dict[str, frozenset[str]]] | None = None
+
+    @classmethod
+    def from_seed(cls, seed: dict[str, Any]) -> "DependencyGraph":
+        return cls([item for _, item in iter_seed_work_items(seed)])
+
+    def _topological_order(self) -> list[str]:
+        remaining = {item_id: len(blockers) for item_id, blockers in self.blockers.items()}
+        ready = deque(item_id for item_id, count in remaining.items() if count == 0)
+        order: list[str] = []
+        while ready:
+            item_id = ready.popleft()
+            order.append(item_id)
+            for dependent in self.dependents[item_id]:
+                remaining[dependent] -= 1
+                if remaining[dependent] == 0:
+                    ready.append(dependent)
+        resolved = set(order)
+        self.cyclic = {item_id for item_id in self.items if item_id not in resolved}
+        return order + [item_id for item_id in self.items if item_id not in resolved]
+
+    def _union(self, neighbours: list[str], direction: str) -> frozenset[str]:
+        result: set[str] = set(neighbours)
+        for neighbour in neighbours:
+            # Dependents of an acyclic item can still sit behind a cycle; those fall back to a walk.
+            result |= self._transitive_set(neighbour, direction)
+        return frozenset(result)
+
+    def _walk(self, item_id: str, direction: str) -> frozenset[str]:
+        edges = self.blockers if direction == "blockers" else self.dependents
+        seen: set[str] = set()
+        stack = list(edges.get(item_id, []))
+        while stack:
+            current = stack.pop()
+            if current not in seen:
+                seen.add(current)
+                stack.extend(edges.get(current, []))
+        return frozenset(seen)
+
+    def _memoize(self) -> dict[str, dict[str, frozenset[str]]]:
+        self._transitive = {"blockers": {}, "dependents": {}}
+        acyclic = [item_id for item_id in self.order if item_id not in self.cyclic]
+        for item_id in acyclic:
+            self._transitive["blockers"][item_id] = self._union(self.blockers[item_id], "blockers")
+        for item_id in reversed(acyclic):
+            self._transitive["dependents"][item_id] = self._union(self.dependents[item_id], "dependents")
+        return self._transitive
+
+    def _transitive_set(self, item_id: str, direction: str) -> frozenset[str]:
+        memo = (self._transitive or self._memoize())[direction]
+        if item_id not in memo:
+            memo[item_id] = self._walk(item_id, direction)
+        return memo[item_id]
+
+    def transitive_blockers(self, item_id: str) -> frozenset[str]:
+        return self._transitive_set(item_id, "blockers")
+
+    def transitive_dependents(self, item_id: str) -> frozenset[str]:
+        return self._transitive_set(item_id, "dependents")
+
+    def unblock_impact(self, item_id: str) -> int:
+        """Number of items that wait on `item_id`, directly or through a chain."""
+        return len(self.transitive_dependents(item_id))
+
+    def cycles(self) -> list[list[str]]:
+        """Each dependency cycle as a closed path of ids, e.g. `[A, B, A]`, in seed order."""
+        found: list[list[str]] = []
+        on_cycle: set[str] = set()
+        for start in self.order:
+            if start not in self.cyclic or start in on_cycle:
+                continue
+            # Shortest blocker path from `start` back to itself, if there is one.
+            parents: dict[str, str] = {}
+            queue = deque([start])
+            while queue and start not in parents:
+                current = queue.popleft()
+                for blocker in self.blockers[current]:
+                    if blocker not in parents:
+                        parents[blocker] = current
+                        queue.append(blocker)
+            if start not in parents:
+                continue
+            path = [start]
+            current = parents[start]
+            while current != start:
+                path.append(current)
+                current = parents[current]
+            path.append(start)
+            path.reverse()
+            on_cycle.update(path)
+            found.append(path)
+        return found
+
+    def open_blockers(self, item_id: str, closed_issue_seed_ids: set[str]) -> list[str]:
+        item = self.items.get(item_id, {})
+        references = item.get("blocked_by") if isinstance(item.get("blocked_by"), list) else []
+        return [seed_id for seed_id in references if seed_id not in closed_issue_seed_ids]
+
+    def root_blockers(self, closed_issue_seed_ids: set[str]) -> dict[str, list[str]]:
+        """Map every blocked item to the open blockers that are not blocked themselves."""
+        roots: dict[str, list[str]] = {}
+        for item_id in self.order:
+            open_ids = self.open_blockers(item_id, closed_issue_seed_ids)
+            if not open_ids:
+                continue
+            if item_id in self.cyclic:
+                roots[item_id] = open_ids
+                continue
+            resolved: list[str] = []
+            for blocker in open_ids:
+                for root in roots.get(blocker, [blocker]):
+                    if root not in resolved:
+                        resolved.append(root)
+            roots[item_id] = sorted(resolved, key=lambda seed_id: self.position.get(seed_id, -1))
+        return roots
+
+
 def epic_major_milestones(
     child_issues: list[dict[str, Any]],
     phase_name_by_id: dict[str, str],
@@ -580,6 +1479,59 @@ def render_issue_body(
     return "\n".join(parts).strip() + "\n"
 
 
+class RenderCache:
+    """Rendered issue bodies keyed by the hash of their render inputs."""
+
+    def __init__(self, path: pathlib.Path | None = None) -> None:
+        self.path = path
+        self.entries: dict[str, str] = {}
+        self.used: set[str] = set()
+        self.stats: Counter[str] = Counter()
+        self._lock = threading.Lock()
+        if path is not None and path.exists():
+            try:
+                payload = pickle.loads(path.read_bytes())
+                if payload.get("template_version") == BODY_TEMPLATE_VERSION:
+                    self.entries = payload["entries"]
+            except (OSError, pickle.UnpicklingError, EOFError, AttributeError, KeyError, ValueError):
+                self.entries = {}
+
+    def body(self, key: str, marker: dict[str, str], render: Callable[[], str]) -> str:
+        trailer = marker_comment(marker) + "\n"
+        with self._lock:
+            self.used.add(key)
+            prefix = self.entries.get(key)
+        if prefix is not None:
+            self.stats["hit"] += 1
+            return prefix + trailer
+        self.stats["miss"] += 1
+        body = render()
+        if body.endswith(trailer):
+            with self._lock:
+                self.entries[key] = body[: -len(trailer)]
+        return body
+
+    def save(self) -> None:
+        if self.path is None:
+            return
+        # Only bodies of the current seed are kept, so edited entities do not accumulate.
+        entries = {key: value for key, value in self.entries.items() if key in self.used}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.path.with_suffix(".tmp")
+        payload = {"template_version": BODY_TEMPLATE_VERSION, "entries": entries}
+        temp_path.write_bytes(pickle.dumps(payload, protocol=pickle.HIGHEST_PROTOCOL))
+        temp_path.replace(self.path)
+
+
+RENDER_CACHE_FILE = "rendered-bodies.pickle"
+RENDER_CACHE = RenderCache()
+
+
+def set_render_cache(cache: RenderCache) -> None:
+    global RENDER_CACHE
+    RENDER_CACHE = cache
+
+
 def option_color(field_name: str, option_name: str, index: int) -> str:
     status_map = {
         "バックログ": "GRAY",
@@ -756,13 +1708,56 @@ def infer_review_cycle(issue: dict[str, Any]) -> str | None:
     return REVIEW_CYCLE_TO_FIELD.get(str(recurring).lower(), "なし")
 
 
+EXAM_PRIORITY_WINDOWS = [
+    (dt.date(2026, 3, 14), dt.date(2026, 4, 27)),
+    (dt.date(2026, 4, 28), dt.date(2026, 7, 4)),
+    (dt.date(2027, 7, 1), dt.date(2027, 8, 31)),
+]
+
+
 def is_exam_priority_period(today: dt.date) -> bool:
-    exam_windows = [
-        (dt.date(2026, 3, 14), dt.date(2026, 4, 27)),
-        (dt.date(2026, 4, 28), dt.date(2026, 7, 4)),
-        (dt.date(2027, 7, 1), dt.date(2027, 8, 31)),
-    ]
-    return any(start <= today <= end for start, end in exam_windows)
+    return any(start <= today <= end for start, end in EXAM_PRIORITY_WINDOWS)
+
+
+@dataclasses.dataclass(frozen=True)
+class StatusResult:
+    """A work item's Status with the rule that decided it."""
+
+    status: str
+    reason: str
+    blockers: tuple[str, ...] = ()
+    roots: tuple[str, ...] = ()
+
+
+@dataclasses.dataclass
+class StatusInputs:
+    deferred_until: dt.date | None
+    active_from: dt.date | None
+    due_date: dt.date | None
+    exam_priority_guard: bool
+    blockers: tuple[str, ...]
+
+
+STATUS_DEFERRED = StatusResult("延期", "deferred")
+STATUS_NOT_ACTIVE = StatusResult("バックログ", "not-active")
+STATUS_BLOCKED = StatusResult("ブロック中", "blocked")
+STATUS_EXAM_PRIORITY = StatusResult("バックログ", "exam-priority")
+STATUS_DUE_SOON = StatusResult("未着手", "due-soon")
+STATUS_NOT_DUE = StatusResult("バックログ", "not-due")
+
+
+def evaluate_status(inputs: StatusInputs, today: dt.date, *, exam_period: bool, window_end: dt.date) -> StatusResult:
+    if inputs.deferred_until and today <= inputs.deferred_until:
+        return STATUS_DEFERRED
+    if inputs.active_from and today < inputs.active_from:
+        return STATUS_NOT_ACTIVE
+    if inputs.blockers:
+        return STATUS_BLOCKED
+    if exam_period and not inputs.exam_priority_guard:
+        return STATUS_EXAM_PRIORITY
+    if inputs.due_date and inputs.due_date <= window_end:
+        return STATUS_DUE_SOON
+    return STATUS_NOT_DUE
 
 
 def compute_status(
@@ -776,20 +1771,111 @@ def compute_status(
     due_date: str | None,
     date_window_days: int = DATE_WINDOW_DAYS,
 ) -> str:
-    deferred_date = parse_iso_date(deferred_until)
-    if deferred_date and today <= deferred_date:
-        return "延期"
-    active_date = parse_iso_date(active_from)
-    if active_date and today < active_date:
-        return "バックログ"
-    if blocked_by and any(seed_id not in closed_issue_seed_ids for seed_id in blocked_by):
-        return "ブロック中"
-    if current_phase_is_exam and not exam_priority_guard:
-        return "バックログ"
-    due = parse_iso_date(due_date)
-    if due and due <= today + dt.timedelta(days=date_window_days):
-        return "未着手"
-    return "バックログ"
+    inputs = StatusInputs(
+        deferred_until=parse_iso_date(deferred_until),
+        active_from=parse_iso_date(active_from),
+        due_date=parse_iso_date(due_date),
+        exam_priority_guard=exam_priority_guard,
+        blockers=tuple(seed_id for seed_id in blocked_by or [] if seed_id not in closed_issue_seed_ids),
+    )
+    window_end = today + dt.timedelta(days=date_window_days)
+    return evaluate_status(inputs, today, exam_period=current_phase_is_exam, window_end=window_end).status
+
+
+class StatusEngine:
+    """The Status rules for a set of seed work items against a fixed set of closed issues."""
+
+    def __init__(
+        self,
+        items: list[dict[str, Any]],
+        *,
+        closed_issue_seed_ids: set[str] | frozenset[str] = frozenset(),
+        graph: DependencyGraph | None = None,
+        date_window_days: int = DATE_WINDOW_DAYS,
+    ) -> None:
+        self.items = {item["id"]: item for item in items}
+        self.closed_issue_seed_ids = closed_issue_seed_ids
+        self.graph = graph if graph is not None else DependencyGraph(items)
+        self.date_window_days = date_window_days
+        self._inputs: dict[str, StatusInputs] = {}
+        self._roots: dict[str, list[str]] | None = None
+
+    @classmethod
+    def from_seed(
+        cls,
+        seed: dict[str, Any],
+        *,
+        closed_issue_seed_ids: set[str] | frozenset[str] = frozenset(),
+        graph: DependencyGraph | None = None,
+    ) -> "StatusEngine":
+        items = list(graph.items.values()) if graph is not None else [item for _, item in iter_seed_work_items(seed)]
+        return cls(items, closed_issue_seed_ids=closed_issue_seed_ids, graph=graph)
+
+    def inputs(self, item_id: str) -> StatusInputs:
+        inputs = self._inputs.get(item_id)
+        if inputs is None:
+            item = self.items[item_id]
+            inputs = self._inputs[item_id] = StatusInputs(
+                deferred_until=parse_iso_date(item.get("deferred_until")),
+                active_from=parse_iso_date(item.get("active_from")),
+                due_date=parse_iso_date(item.get("due_date")),
+                exam_priority_guard=normalize_bool(item.get("exam_priority_guard")),
+                blockers=tuple(self.graph.open_blockers(item_id, self.closed_issue_seed_ids)),
+            )
+        return inputs
+
+    def roots(self, item_id: str) -> tuple[str, ...]:
+        if self._roots is None:
+            self._roots = self.graph.root_blockers(set(self.closed_issue_seed_ids))
+        return tuple(self._roots.get(item_id, ()))
+
+    def evaluate(self, today: dt.date, item_ids: Iterable[str] | None = None) -> dict[str, StatusResult]:
+        exam_period = is_exam_priority_period(today)
+        window_end = today + dt.timedelta(days=self.date_window_days)
+        results: dict[str, StatusResult] = {}
+        for item_id in self.items if item_ids is None else item_ids:
+            inputs = self._inputs.get(item_id) or self.inputs(item_id)
+            result = evaluate_status(inputs, today, exam_period=exam_period, window_end=window_end)
+            if result is STATUS_BLOCKED:
+                result = StatusResult(result.status, result.reason, inputs.blockers, self.roots(item_id))
+            results[item_id] = result
+        return results
+
+    def status(self, item_id: str, today: dt.date) -> StatusResult:
+        return self.evaluate(today, (item_id,))[item_id]
+
+    def transitions(self, item_ids: Iterable[str] | None = None) -> set[dt.date]:
+        """Days on which some item's status can differ from the day before."""
+        days: set[dt.date] = set()
+        for window_start, window_end in EXAM_PRIORITY_WINDOWS:
+            days.update({window_start, window_end + dt.timedelta(days=1)})
+        for item_id in self.items if item_ids is None else item_ids:
+            inputs = self.inputs(item_id)
+            if inputs.deferred_until:
+                days.add(inputs.deferred_until + dt.timedelta(days=1))
+            if inputs.active_from:
+                days.add(inputs.active_from)
+            if inputs.due_date:
+                days.add(inputs.due_date - dt.timedelta(days=self.date_window_days))
+        return days
+
+    def evaluate_range(
+        self,
+        start: dt.date,
+        days: int,
+        item_ids: Iterable[str] | None = None,
+    ) -> dict[dt.date, dict[str, StatusResult]]:
+        """Statuses for `days` consecutive days; days between transitions share one result dict."""
+        item_ids = list(self.items if item_ids is None else item_ids)
+        transitions = self.transitions(item_ids)
+        results: dict[dt.date, dict[str, StatusResult]] = {}
+        current: dict[str, StatusResult] = {}
+        for offset in range(days):
+            day = start + dt.timedelta(days=offset)
+            if offset == 0 or day in transitions:
+                current = self.evaluate(day, item_ids)
+            results[day] = current
+        return results
 
 
 def infer_status(
@@ -798,39 +1884,28 @@ def infer_status(
     entity_kind: str,
     today: dt.date,
     closed_issue_seed_ids: set[str],
+    engine: StatusEngine | None = None,
 ) -> str:
     if entity_kind == "epic":
         return "バックログ"
-    return compute_status(
-        today=today,
-        deferred_until=issue.get("deferred_until"),
-        active_from=issue.get("active_from"),
-        blocked_by=list(issue.get("blocked_by", [])),
-        closed_issue_seed_ids=closed_issue_seed_ids,
-        exam_priority_guard=normalize_bool(issue.get("exam_priority_guard")),
-        current_phase_is_exam=is_exam_priority_period(today),
-        due_date=issue.get("due_date"),
-    )
-
-
-def validate_seed(seed: dict[str, Any]) -> tuple[list[str], list[str]]:
-    errors: list[str] = []
-    warnings: list[str] = []
-    required_sections = [
-        "meta",
-        "phases",
-        "epics",
-        "milestones",
-        "labels",
-        "project_fields",
-        "phase_cards",
-        "win_conditions",
-        "issues",
-    ]
-    for section in required_sections:
-        if section not in seed:
-            errors.append(f"Missing top-level section: {section}")
-    required_fields = {
+    if engine is None:
+        engine = StatusEngine([issue], closed_issue_seed_ids=closed_issue_seed_ids)
+    return engine.status(issue["id"], today).status
+
+
+REQUIRED_SEED_SECTIONS = (
+    "meta",
+    "phases",
+    "epics",
+    "milestones",
+    "labels",
+    "project_fields",
+    "phase_cards",
+    "win_conditions",
+    "issues",
+)
+REQUIRED_PROJECT_FIELDS = frozenset(
+    {
         "Status",
         "優先度",
         "分野",
@@ -860,91 +1935,170 @@ def validate_seed(seed: dict[str, Any]) -> tuple[list[str], list[str]]:
         "Execution Outcome",
         "Execution Check",
     }
+)
+LAYERED_ENTITY_KINDS = frozenset({"phase_card", "win_condition"})
+
+
+@dataclasses.dataclass(frozen=True)
+class WorkItemSchema:
+    """Declarative shape of a seed work item; `compile_work_item_validator` turns it into checks."""
+
+    # item key -> seed section whose ids it must reference
+    references: tuple[tuple[str, str], ...]
+    choices: tuple[tuple[str, frozenset[str]], ...]
+    lists: tuple[str, ...]
+    optional_lists: tuple[str, ...]
+    required_text: tuple[str, ...]
+    required: tuple[str, ...]
+    dates: tuple[str, ...]
+    # (key, companion): an item with `key` set also needs `companion` (warning)
+    companions: tuple[tuple[str, str], ...]
+    # (earlier, later): `later` before `earlier` is a warning
+    date_order: tuple[tuple[str, str], ...]
+    layered_required: tuple[str, ...]
+    # list key -> noun used in the message; checked against every seed entity id
+    id_references: tuple[tuple[str, str], ...]
+    mirrored_lists: tuple[tuple[str, str], ...]
+
+
+WORK_ITEM_SCHEMA = WorkItemSchema(
+    references=(("phase", "phases"), ("epic", "epics"), ("milestone", "milestones")),
+    choices=(("task_type", frozenset(TASK_TYPE_TO_FIELD) - {"epic"}),),
+    lists=(
+        "work_steps",
+        "deliverables",
+        "evidence_to_keep",
+        "dod",
+        "blocked_by",
+        "dependencies",
+        "inputs",
+        "things_to_make",
+        "completion_check",
+        "daily_execution",
+    ),
+    optional_lists=("linked_issue_ids",),
+    required_text=("outcome", "next_action", "why_this_matters", "device", "time_block", "estimate", "energy", "focus"),
+    required=("work_steps", "dod", "completion_check", "daily_execution", "active_from"),
+    dates=("active_from", "deferred_until", "due_date"),
+    companions=(("evidence_type", "evidence_to_keep"),),
+    date_order=(("active_from", "due_date"),),
+    layered_required=("linked_issue_ids",),
+    id_references=(("dependencies", "dependency"), ("blocked_by", "blocked_by"), ("linked_issue_ids", "linked_issue_id")),
+    mirrored_lists=(("blocked_by", "dependencies"),),
+)
+
+
+def compile_work_item_validator(
+    schema: WorkItemSchema, entity_kind: str
+) -> tuple[Callable[..., None], Callable[..., None]]:
+    """Compile `schema` into the per-item shape check and the cross-reference check for one entity kind."""
+    label = entity_kind.replace("_", " ").title()
+    list_keys = schema.lists
+    text_keys = schema.required_text
+    required_keys = schema.required
+    date_keys = schema.dates
+    layered_keys = schema.layered_required if entity_kind in LAYERED_ENTITY_KINDS else ()
+
+    def validate_shape(item: dict[str, Any], known: dict[str, set[str]], errors: list[str], warnings: list[str]) -> None:
+        get = item.get
+        prefix = f"{label} {get('id')}"
+        for key, section in schema.references:
+            value = get(key)
+            if value and value not in known[section]:
+                errors.append(f"{prefix} references unknown {key}: {value}")
+        for key, allowed in schema.choices:
+            value = get(key)
+            if value not in allowed:
+                errors.append(f"{prefix} has invalid {key}: {value}")
+        if set(map(type, map(get, list_keys))) != {list}:
+            for key in list_keys:
+                if not isinstance(get(key), list):
+                    errors.append(f"{prefix} has non-list {key}")
+        for key in schema.optional_lists:
+            value = get(key)
+            if value is not None and not isinstance(value, list):
+                errors.append(f"{prefix} has non-list {key}")
+        texts = [get(key, "") for key in text_keys]
+        if set(map(type, texts)) != {str} or not all(map(str.strip, texts)):
+            for key, value in zip(text_keys, texts):
+                if not str(value).strip():
+                    errors.append(f"{prefix} is missing {key}")
+        if not all(map(get, required_keys)):
+            for key in required_keys:
+                if not get(key):
+                    errors.append(f"{prefix} is missing {key}")
+        parsed: dict[str, dt.date | None] = {}
+        for key in date_keys:
+            value = get(key)
+            if value in (None, ""):
+                continue
+            parsed[key] = _iso_date_or_none(value) if isinstance(value, str) else None
+            if parsed[key] is None and not is_valid_iso_date(value):
+                errors.append(f"{prefix} has invalid {key}: {value}")
+        for key, companion in schema.companions:
+            if get(key) and not get(companion):
+                warnings.append(f"{prefix} has {key} but no {companion}")
+        for earlier, later in schema.date_order:
+            earlier_date, later_date = parsed.get(earlier), parsed.get(later)
+            if earlier_date and later_date and later_date < earlier_date:
+                warnings.append(f"{prefix} {later} is earlier than {earlier}")
+        for key in layered_keys:
+            if not get(key):
+                errors.append(f"{prefix} is missing {key}")
+
+    def validate_references(item: dict[str, Any], entity_ids: set[str], errors: list[str], warnings: list[str]) -> None:
+        get = item.get
+        for key, noun in schema.id_references:
+            references = get(key) or ()
+            if not entity_ids.issuperset(references):
+                for reference in references:
+                    if reference not in entity_ids:
+                        errors.append(f"{label} {get('id')} references unknown {noun}: {reference}")
+        for key, mirror in schema.mirrored_lists:
+            left, right = get(key) or [], get(mirror) or []
+            if left != right and sorted(left) != sorted(right):
+                warnings.append(f"{label} {get('id')} {key} does not match {mirror}")
+
+    return validate_shape, validate_references
+
+
+WORK_ITEM_VALIDATORS = {
+    entity_kind: compile_work_item_validator(WORK_ITEM_SCHEMA, entity_kind)
+    for entity_kind in ("phase_card", "win_condition", "issue")
+}
+
+
+def validate_seed(
+    seed: dict[str, Any], *, graph: DependencyGraph | None = None
+) -> tuple[list[str], list[str]]:
+    errors: list[str] = []
+    warnings: list[str] = []
+    for section in REQUIRED_SEED_SECTIONS:
+        if section not in seed:
+            errors.append(f"Missing top-level section: {section}")
     project_field_names = {field["name"] for field in seed.get("project_fields", [])}
-    missing_project_fields = sorted(required_fields - project_field_names)
-    for field_name in missing_project_fields:
+    for field_name in sorted(REQUIRED_PROJECT_FIELDS - project_field_names):
         errors.append(f"Missing project field: {field_name}")
-    phase_ids = {item["id"] for item in seed.get("phases", [])}
-    epic_ids = {item["id"] for item in seed.get("epics", [])}
-    milestone_ids = {item["id"] for item in seed.get("milestones", [])}
-    allowed_task_types = set(TASK_TYPE_TO_FIELD) - {"epic"}
+    known = {
+        section: {item["id"] for item in seed.get(section, [])}
+        for section in {section for _, section in WORK_ITEM_SCHEMA.references}
+    }
+    collections = entity_collections(seed)
     entity_ids: set[str] = set()
-    for entity_kind, items in entity_collections(seed):
+    for entity_kind, items in collections:
+        validate_shape, _ = WORK_ITEM_VALIDATORS[entity_kind]
         for item in items:
             item_id = item.get("id")
-            label = entity_kind.replace("_", " ").title()
             if item_id in entity_ids:
                 errors.append(f"Duplicate seed entity id: {item_id}")
             entity_ids.add(item_id)
-            if item.get("phase") and item["phase"] not in phase_ids:
-                errors.append(f"{label} {item_id} references unknown phase: {item['phase']}")
-            if item.get("epic") and item["epic"] not in epic_ids:
-                errors.append(f"{label} {item_id} references unknown epic: {item['epic']}")
-            if item.get("milestone") and item["milestone"] not in milestone_ids:
-                errors.append(f"{label} {item_id} references unknown milestone: {item['milestone']}")
-            task_type = item.get("task_type")
-            if task_type not in allowed_task_types:
-                errors.append(f"{label} {item_id} has invalid task_type: {task_type}")
-            for list_key in (
-                "work_steps",
-                "deliverables",
-                "evidence_to_keep",
-                "dod",
-                "blocked_by",
-                "dependencies",
-                "inputs",
-                "things_to_make",
-                "completion_check",
-                "daily_execution",
-            ):
-                value = item.get(list_key)
-                if not isinstance(value, list):
-                    errors.append(f"{label} {item_id} has non-list {list_key}")
-            if item.get("linked_issue_ids") is not None and not isinstance(item.get("linked_issue_ids"), list):
-                errors.append(f"{label} {item_id} has non-list linked_issue_ids")
-            for required_text in ("outcome", "next_action", "why_this_matters", "device", "time_block", "estimate", "energy", "focus"):
-                if not normalize_text(str(item.get(required_text, ""))):
-                    errors.append(f"{label} {item_id} is missing {required_text}")
-            if not item.get("work_steps"):
-                errors.append(f"{label} {item_id} is missing work_steps")
-            if not item.get("dod"):
-                errors.append(f"{label} {item_id} is missing dod")
-            if not item.get("completion_check"):
-                errors.append(f"{label} {item_id} is missing completion_check")
-            if not item.get("daily_execution"):
-                errors.append(f"{label} {item_id} is missing daily_execution")
-            if not item.get("active_from"):
-                errors.append(f"{label} {item_id} is missing active_from")
-            if not is_valid_iso_date(item.get("active_from")):
-                errors.append(f"{label} {item_id} has invalid active_from: {item.get('active_from')}")
-            if not is_valid_iso_date(item.get("deferred_until")):
-                errors.append(f"{label} {item_id} has invalid deferred_until: {item.get('deferred_until')}")
-            if not is_valid_iso_date(item.get("due_date")):
-                errors.append(f"{label} {item_id} has invalid due_date: {item.get('due_date')}")
-            if item.get("evidence_type") and not item.get("evidence_to_keep"):
-                warnings.append(f"{label} {item_id} has evidence_type but no evidence_to_keep")
-            if item.get("due_date") and item.get("active_from"):
-                due_date = parse_iso_date(item["due_date"])
-                active_date = parse_iso_date(item["active_from"])
-                if due_date and active_date and due_date < active_date:
-                    warnings.append(f"{label} {item_id} due_date is earlier than active_from")
-            if entity_kind in {"phase_card", "win_condition"} and not item.get("linked_issue_ids"):
-                errors.append(f"{label} {item_id} is missing linked_issue_ids")
-    for entity_kind, items in entity_collections(seed):
-        label = entity_kind.replace("_", " ").title()
+            validate_shape(item, known, errors, warnings)
+    for entity_kind, items in collections:
+        _, validate_references = WORK_ITEM_VALIDATORS[entity_kind]
         for item in items:
-            item_id = item["id"]
-            for dependency in item.get("dependencies", []):
-                if dependency not in entity_ids:
-                    errors.append(f"{label} {item_id} references unknown dependency: {dependency}")
-            for blocker in item.get("blocked_by", []):
-                if blocker not in entity_ids:
-                    errors.append(f"{label} {item_id} references unknown blocked_by: {blocker}")
-            for linked_id in item.get("linked_issue_ids", []):
-                if linked_id not in entity_ids:
-                    errors.append(f"{label} {item_id} references unknown linked_issue_id: {linked_id}")
-            if sorted(item.get("blocked_by", [])) != sorted(item.get("dependencies", [])):
-                warnings.append(f"{label} {item_id} blocked_by does not match dependencies")
+            validate_references(item, entity_ids, errors, warnings)
+    for cycle in (graph or DependencyGraph.from_seed(seed)).cycles():
+        errors.append(f"Seed dependency cycle: {' -> '.join(cycle)}")
     return errors, warnings
 
 
@@ -955,6 +2109,17 @@ def build_epic_issue(
     phase_name_by_id: dict[str, str],
 ) -> PlannedIssue:
     child_titles = [f"{issue['id']}: {issue['title']}" for issue in child_issues]
+    render_inputs = content_hash(
+        {
+            "template_version": BODY_TEMPLATE_VERSION,
+            "epic": epic,
+            "children": [
+                [issue["id"], issue["title"], issue.get("phase"), issue.get("monthly_bucket")]
+                for issue in child_issues
+            ],
+            "phase_names": phase_name_by_id,
+        }
+    )
     fingerprint_source = {
         "seed_id": epic["id"],
         "entity_kind": "epic",
@@ -968,14 +2133,14 @@ def build_epic_issue(
             "分野": area_from_labels(epic.get("labels", [])),
             "タスク種別": "エピック",
         },
+        "render_inputs": render_inputs,
     }
-    fingerprint = sha256_text(json.dumps(fingerprint_source, ensure_ascii=False, sort_keys=True))
+    fingerprint = content_hash(fingerprint_source)
     marker = marker_payload(epic["id"], "epic", fingerprint)
-    body = render_epic_body(
-        epic,
-        child_issues,
-        phase_name_by_id=phase_name_by_id,
-        marker=marker,
+    body = RENDER_CACHE.body(
+        f"epic:{render_inputs}",
+        marker,
+        lambda: render_epic_body(epic, child_issues, phase_name_by_id=phase_name_by_id, marker=marker),
     )
     return PlannedIssue(
         seed_id=epic["id"],
@@ -1017,6 +2182,7 @@ def build_seed_issue(
     issue_title_by_id: dict[str, str],
     today: dt.date,
     closed_issue_seed_ids: set[str],
+    status: str | None = None,
 ) -> PlannedIssue:
     blocked_titles = [
         f"{seed_id}: {issue_title_by_id.get(seed_id, '(unknown issue)')}"
@@ -1027,12 +2193,8 @@ def build_seed_issue(
         for seed_id in issue.get("linked_issue_ids", [])
     ]
     field_values = {
-        "Status": infer_status(
-            issue,
-            entity_kind=entity_kind,
-            today=today,
-            closed_issue_seed_ids=closed_issue_seed_ids,
-        ),
+        "Status": status
+        or infer_status(issue, entity_kind=entity_kind, today=today, closed_issue_seed_ids=closed_issue_seed_ids),
         "優先度": priority_to_field(issue.get("priority")),
         "分野": area_from_labels(issue.get("labels", [])),
         "フェーズ": phase_from_labels(issue.get("labels", [])),
@@ -1071,6 +2233,15 @@ def build_seed_issue(
         "Execution Outcome": issue.get("outcome") or None,
         "Execution Check": completion_check_text(list(issue.get("completion_check", []))),
     }
+    render_inputs = content_hash(
+        {
+            "template_version": BODY_TEMPLATE_VERSION,
+            "issue": issue,
+            "phase_name": phase_name_by_id.get(issue.get("phase", "")),
+            "blocked_titles": blocked_titles,
+            "linked_titles": linked_titles,
+        }
+    )
     fingerprint_source = {
         "seed_id": issue["id"],
         "entity_kind": entity_kind,
@@ -1079,16 +2250,21 @@ def build_seed_issue(
         "labels": sorted(issue.get("labels", [])),
         "milestone": issue.get("milestone"),
         "field_values": field_values,
+        "render_inputs": render_inputs,
     }
-    fingerprint = sha256_text(json.dumps(fingerprint_source, ensure_ascii=False, sort_keys=True))
+    fingerprint = content_hash(fingerprint_source)
     marker = marker_payload(issue["id"], entity_kind, fingerprint)
-    body = render_issue_body(
-        issue,
-        entity_kind=entity_kind,
-        marker=marker,
-        phase_name=phase_name_by_id.get(issue.get("phase", "")),
-        blocked_titles=blocked_titles,
-        linked_titles=linked_titles,
+    body = RENDER_CACHE.body(
+        f"{entity_kind}:{render_inputs}",
+        marker,
+        lambda: render_issue_body(
+            issue,
+            entity_kind=entity_kind,
+            marker=marker,
+            phase_name=phase_name_by_id.get(issue.get("phase", "")),
+            blocked_titles=blocked_titles,
+            linked_titles=linked_titles,
+        ),
     )
     return PlannedIssue(
         seed_id=issue["id"],
@@ -1107,15 +2283,18 @@ def build_planned_issues(
     *,
     today: dt.date,
     closed_issue_seed_ids: set[str] | None = None,
+    only: set[str] | None = None,
 ) -> list[PlannedIssue]:
     milestone_title_by_id = {item["id"]: item["title"] for item in seed.get("milestones", [])}
     phase_name_by_id = {item["id"]: item["name"] for item in seed.get("phases", [])}
-    seed_issues = copy.deepcopy(seed.get("issues", []))
-    phase_cards = copy.deepcopy(seed.get("phase_cards", []))
-    win_conditions = copy.deepcopy(seed.get("win_conditions", []))
+    # Planning only adds milestone_title at the top level, so shallow copies keep the seed untouched.
+    seed_issues = [dict(item) for item in seed.get("issues", [])]
+    phase_cards = [dict(item) for item in seed.get("phase_cards", [])]
+    win_conditions = [dict(item) for item in seed.get("win_conditions", [])]
     all_seed_items = phase_cards + win_conditions + seed_issues
     issue_title_by_id = {item["id"]: item["title"] for item in all_seed_items}
     closed_issue_seed_ids = closed_issue_seed_ids or set()
+    engine = StatusEngine(all_seed_items, closed_issue_seed_ids=closed_issue_seed_ids)
     for issue in all_seed_items:
         issue["milestone_title"] = milestone_title_by_id.get(issue.get("milestone"))
 
@@ -1126,6 +2305,8 @@ def build_planned_issues(
 
     planned: list[PlannedIssue] = []
     for epic in seed.get("epics", []):
+        if only is not None and epic["id"] not in only:
+            continue
         planned.append(
             build_epic_issue(
                 epic,
@@ -1133,101 +2314,271 @@ def build_planned_issues(
                 phase_name_by_id=phase_name_by_id,
             )
         )
-    for entity_kind, collection in (("phase_card", phase_cards), ("win_condition", win_conditions), ("issue", seed_issues)):
-        for issue in collection:
-            planned.append(
-                build_seed_issue(
-                    issue,
-                    entity_kind=entity_kind,
-                    phase_name_by_id=phase_name_by_id,
-                    issue_title_by_id=issue_title_by_id,
-                    today=today,
-                    closed_issue_seed_ids=closed_issue_seed_ids,
-                )
+    selected = [
+        (entity_kind, issue)
+        for entity_kind, collection in (("phase_card", phase_cards), ("win_condition", win_conditions), ("issue", seed_issues))
+        for issue in collection
+        if only is None or issue["id"] in only
+    ]
+    statuses = engine.evaluate(today, [issue["id"] for _, issue in selected])
+    for entity_kind, issue in selected:
+        planned.append(
+            build_seed_issue(
+                issue,
+                entity_kind=entity_kind,
+                phase_name_by_id=phase_name_by_id,
+                issue_title_by_id=issue_title_by_id,
+                today=today,
+                closed_issue_seed_ids=closed_issue_seed_ids,
+                status=statuses[issue["id"]].status,
             )
+        )
     return planned
 
 
-def closed_issue_seed_ids(existing_issues: list[dict[str, Any]]) -> set[str]:
-    closed_ids: set[str] = set()
-    for issue in existing_issues:
-        if issue.get("state") != "closed":
-            continue
+def select_seed_ids(
+    seed: dict[str, Any],
+    *,
+    only: list[str] | None = None,
+    phases: list[str] | None = None,
+    milestones: list[str] | None = None,
+) -> set[str]:
+    """Seed ids matched by the `--only`/`--phase`/`--milestone` filters plus their dependency closure."""
+    only, phases, milestones = only or [], phases or [], milestones or []
+    work_items = [item for _, item in iter_seed_work_items(seed)]
+    epic_ids = {epic["id"] for epic in seed.get("epics", [])}
+    unknown = [seed_id for seed_id in only if seed_id not in epic_ids and seed_id not in {item["id"] for item in work_items}]
+    unknown += [phase for phase in phases if phase not in {item["id"] for item in seed.get("phases", [])}]
+    unknown += [milestone for milestone in milestones if milestone not in {item["id"] for item in seed.get("milestones", [])}]
+    if unknown:
+        raise SyncCommandError(f"Unknown seed id(s) in selection: {', '.join(unknown)}")
+
+    selected = {seed_id for seed_id in only if seed_id in epic_ids}
+    for item in work_items:
+        if (
+            item["id"] in only
+            or item.get("epic") in selected
+            or item.get("phase") in phases
+            or item.get("milestone") in milestones
+        ):
+            selected.add(item["id"])
+    graph = DependencyGraph(work_items)
+    for seed_id in list(selected):
+        selected |= graph.transitive_blockers(seed_id)
+    selected |= {item["epic"] for item in work_items if item["id"] in selected and item.get("epic") in epic_ids}
+    return selected
+
+
+def marker_seed_id(marker: dict[str, Any] | None) -> str | None:
+    return str(marker["seed_id"]) if marker and marker.get("seed_id") else None
+
+
+class IssueIndex:
+    """Managed issues by number, marker seed id and title, kept current by `upsert` in O(1)."""
+
+    def __init__(self, issues: list[dict[str, Any]]) -> None:
+        # Oldest first, so that an issue created later is appended and still lists first.
+        self.by_number: dict[int, dict[str, Any]] = {}
+        self.markers: dict[int, dict[str, Any]] = {}
+        self.seed_numbers: dict[str, list[int]] = {}
+        self.by_seed_id: dict[str, dict[str, Any]] = {}
+        self.by_title: dict[str, list[dict[str, Any]]] = defaultdict(list)
+        for issue in reversed(issues):
+            self.add(issue)
+
+    @property
+    def issues(self) -> list[dict[str, Any]]:
+        return list(reversed(self.by_number.values()))
+
+    def add(self, issue: dict[str, Any]) -> None:
+        number = issue["number"]
+        self.by_number[number] = issue
         marker = extract_marker(issue.get("body"))
-        if marker and marker.get("seed_id"):
-            closed_ids.add(str(marker["seed_id"]))
-    return closed_ids
+        if marker:
+            self.markers[number] = marker
+        seed_id = marker_seed_id(marker)
+        if seed_id:
+            self.seed_numbers.setdefault(seed_id, []).insert(0, number)
+            self.by_seed_id[seed_id] = issue
+        if issue.get("title"):
+            self.by_title[issue["title"]].insert(0, issue)
+
+    def upsert(self, issue: dict[str, Any]) -> None:
+        number = issue["number"]
+        previous = self.by_number.get(number)
+        if previous is None:
+            self.add(issue)
+            return
+        self.by_number[number] = issue
+        previous_seed_id = marker_seed_id(self.markers.pop(number, None))
+        marker = extract_marker(issue.get("body"))
+        seed_id = marker_seed_id(marker)
+        if marker:
+            self.markers[number] = marker
+        if previous_seed_id and previous_seed_id != seed_id:
+            self.seed_numbers[previous_seed_id].remove(number)
+            self.refresh_seed_id(previous_seed_id)
+        if seed_id and seed_id != previous_seed_id:
+            self.seed_numbers.setdefault(seed_id, []).insert(0, number)
+        if seed_id:
+            self.refresh_seed_id(seed_id)
+        if previous.get("title"):
+            titled = self.by_title[previous["title"]]
+            titled[:] = [current for current in titled if current["number"] != number]
+        if issue.get("title"):
+            self.by_title[issue["title"]].insert(0, issue)
+
+    def refresh_seed_id(self, seed_id: str) -> None:
+        numbers = self.seed_numbers.get(seed_id)
+        if numbers:
+            self.by_seed_id[seed_id] = self.by_number[numbers[0]]
+        else:
+            self.seed_numbers.pop(seed_id, None)
+            self.by_seed_id.pop(seed_id, None)
+
+    def marker(self, issue: dict[str, Any]) -> dict[str, Any] | None:
+        indexed = self.by_number.get(issue.get("number"))
+        if indexed is not None and indexed.get("body") == issue.get("body"):
+            return self.markers.get(issue["number"])
+        return extract_marker(issue.get("body"))
+
+    def find(self, planned_issue: PlannedIssue) -> dict[str, Any] | None:
+        marker_match = self.by_seed_id.get(planned_issue.seed_id)
+        if marker_match:
+            return marker_match
+        title_matches = self.by_title.get(planned_issue.title, [])
+        if len(title_matches) == 1:
+            return title_matches[0]
+        return None
+
+    def closed_seed_ids(self) -> set[str]:
+        return {
+            seed_id
+            for seed_id, numbers in self.seed_numbers.items()
+            if any(str(self.by_number[number].get("state") or "").strip().lower() == "closed" for number in numbers)
+        }
+
+
+def issue_index(existing_issues: IssueIndex | list[dict[str, Any]]) -> IssueIndex:
+    if isinstance(existing_issues, IssueIndex):
+        return existing_issues
+    return IssueIndex(existing_issues)
+
+
+def closed_issue_seed_ids(existing_issues: IssueIndex | list[dict[str, Any]]) -> set[str]:
+    return issue_index(existing_issues).closed_seed_ids()
+
+
+def due_before_active(item: dict[str, Any]) -> bool:
+    due_date, active_from = item.get("due_date"), item.get("active_from")
+    if not due_date or not active_from or not is_valid_iso_date(due_date) or not is_valid_iso_date(active_from):
+        return False
+    return parse_iso_date(due_date) < parse_iso_date(active_from)
+
+
+@dataclasses.dataclass(frozen=True)
+class AuditRule:
+    severity: str
+    code: str
+    message: str
+    applies: Callable[[dict[str, Any]], bool]
+    entity_kinds: frozenset[str] | None = None
+
+
+AUDIT_ITEM_RULES = (
+    AuditRule(
+        "WARN",
+        "missing-due-date",
+        "Non-recurring item has no due_date.",
+        lambda item: not item.get("recurring") and not item.get("due_date"),
+    ),
+    AuditRule(
+        "WARN",
+        "missing-milestone",
+        "Non-recurring item has no milestone.",
+        lambda item: not item.get("recurring") and not item.get("milestone"),
+    ),
+    AuditRule(
+        "WARN",
+        "missing-phase",
+        "Item has no phase assignment.",
+        lambda item: not item.get("phase") and item.get("task_type") not in {"review", "evidence"},
+    ),
+    AuditRule("FAIL", "missing-dod", "Item has no Definition of Done.", lambda item: not item.get("dod")),
+    AuditRule("FAIL", "missing-outcome", "Item has no Outcome.", lambda item: not item.get("outcome")),
+    AuditRule("FAIL", "missing-next-action", "Item has no Next Action.", lambda item: not item.get("next_action")),
+    AuditRule(
+        "FAIL",
+        "missing-completion-check",
+        "Item has no completion_check.",
+        lambda item: not item.get("completion_check"),
+    ),
+    AuditRule(
+        "FAIL",
+        "missing-daily-execution",
+        "Item has no daily_execution.",
+        lambda item: not item.get("daily_execution"),
+    ),
+    AuditRule(
+        "FAIL",
+        "missing-evidence",
+        "Item has evidence_type but no evidence_to_keep.",
+        lambda item: bool(item.get("evidence_type")) and not item.get("evidence_to_keep"),
+    ),
+    AuditRule("WARN", "invalid-window", "Item due_date is earlier than active_from.", due_before_active),
+    AuditRule(
+        "FAIL",
+        "missing-linked-items",
+        "Layered item has no linked_issue_ids.",
+        lambda item: not item.get("linked_issue_ids"),
+        LAYERED_ENTITY_KINDS,
+    ),
+)
 
 
 def build_audit_findings(seed: dict[str, Any], *, today: dt.date) -> list[AuditFinding]:
     findings: list[AuditFinding] = []
-    validation_errors, validation_warnings = validate_seed(seed)
+    graph = DependencyGraph.from_seed(seed)
+    validation_errors, validation_warnings = validate_seed(seed, graph=graph)
     for message in validation_errors:
         findings.append(AuditFinding("FAIL", "seed-validation", "seed", message))
     for message in validation_warnings:
         findings.append(AuditFinding("WARN", "seed-validation", "seed", message))
 
+    engine = StatusEngine.from_seed(seed, graph=graph)
+    statuses = engine.evaluate(today)
+    exam_period = is_exam_priority_period(today)
+    rules_by_kind = {
+        entity_kind: [rule for rule in AUDIT_ITEM_RULES if rule.entity_kinds is None or entity_kind in rule.entity_kinds]
+        for entity_kind in ("phase_card", "win_condition", "issue")
+    }
     for entity_kind, issue in iter_seed_work_items(seed):
         issue_id = issue["id"]
-        status = compute_status(
-            today=today,
-            deferred_until=issue.get("deferred_until"),
-            active_from=issue.get("active_from"),
-            blocked_by=list(issue.get("blocked_by", [])),
-            closed_issue_seed_ids=set(),
-            exam_priority_guard=normalize_bool(issue.get("exam_priority_guard")),
-            current_phase_is_exam=is_exam_priority_period(today),
-            due_date=issue.get("due_date"),
-        )
-        if not issue.get("recurring") and not issue.get("due_date"):
-            findings.append(
-                AuditFinding("WARN", "missing-due-date", issue_id, "Non-recurring item has no due_date.")
-            )
-        if not issue.get("recurring") and not issue.get("milestone"):
-            findings.append(
-                AuditFinding("WARN", "missing-milestone", issue_id, "Non-recurring item has no milestone.")
-            )
-        if not issue.get("phase") and issue.get("task_type") not in {"review", "evidence"}:
-            findings.append(
-                AuditFinding("WARN", "missing-phase", issue_id, "Item has no phase assignment.")
-            )
-        if not issue.get("dod"):
-            findings.append(AuditFinding("FAIL", "missing-dod", issue_id, "Item has no Definition of Done."))
-        if not issue.get("outcome"):
-            findings.append(AuditFinding("FAIL", "missing-outcome", issue_id, "Item has no Outcome."))
-        if not issue.get("next_action"):
-            findings.append(AuditFinding("FAIL", "missing-next-action", issue_id, "Item has no Next Action."))
-        if not issue.get("completion_check"):
-            findings.append(
-                AuditFinding("FAIL", "missing-completion-check", issue_id, "Item has no completion_check.")
-            )
-        if not issue.get("daily_execution"):
+        for rule in rules_by_kind[entity_kind]:
+            if rule.applies(issue):
+                findings.append(AuditFinding(rule.severity, rule.code, issue_id, rule.message))
+        result = statuses[issue_id]
+        status = result.status
+        unblock_impact = 0 if status == "ブロック中" else graph.unblock_impact(issue_id)
+        if status == "ブロック中":
             findings.append(
-                AuditFinding("FAIL", "missing-daily-execution", issue_id, "Item has no daily_execution.")
+                AuditFinding(
+                    "INFO",
+                    "blocked",
+                    issue_id,
+                    f"Item is blocked by open dependencies; next to close: {', '.join(result.roots)}.",
+                )
             )
-        if issue.get("evidence_type") and not issue.get("evidence_to_keep"):
+        elif unblock_impact:
             findings.append(
-                AuditFinding("FAIL", "missing-evidence", issue_id, "Item has evidence_type but no evidence_to_keep.")
-            )
-        if issue.get("due_date") and issue.get("active_from"):
-            due_date = parse_iso_date(issue["due_date"])
-            active_date = parse_iso_date(issue["active_from"])
-            if due_date and active_date and due_date < active_date:
-                findings.append(
-                    AuditFinding(
-                        "WARN",
-                        "invalid-window",
-                        issue_id,
-                        "Item due_date is earlier than active_from.",
-                    )
+                AuditFinding(
+                    "INFO",
+                    "unblock-next",
+                    issue_id,
+                    f"Completing this item unblocks {unblock_impact} downstream item(s).",
                 )
-        if status == "ブロック中":
-            findings.append(AuditFinding("INFO", "blocked", issue_id, "Item is blocked by open dependencies."))
-        if entity_kind in {"phase_card", "win_condition"} and not issue.get("linked_issue_ids"):
-            findings.append(
-                AuditFinding("FAIL", "missing-linked-items", issue_id, "Layered item has no linked_issue_ids.")
             )
-        if is_exam_priority_period(today) and not normalize_bool(issue.get("exam_priority_guard")):
+        if exam_period and not normalize_bool(issue.get("exam_priority_guard")):
             if status not in {"バックログ", "延期"}:
                 findings.append(
                     AuditFinding(
@@ -1310,70 +2661,87 @@ def write_audit_report(
     return {"json": str(json_path), "md": str(md_path)}
 
 
-def list_repo_labels(repo: RepoTarget) -> dict[str, dict[str, Any]]:
-    labels = run_json(
-        [
-            "gh",
-            "label",
-            "list",
-            "--repo",
-            repo.full_name,
-            "--limit",
-            "200",
-            "--json",
-            "name,color,description",
-        ]
-    )
-    return {item["name"]: item for item in labels}
+def normalize_rest_issue(item: dict[str, Any]) -> dict[str, Any]:
+    milestone = item.get("milestone")
+    return {
+        "number": item["number"],
+        "node_id": item.get("node_id"),
+        "title": item.get("title"),
+        "body": item.get("body") or "",
+        "url": item.get("html_url") or item.get("url"),
+        "labels": [{"name": label["name"]} for label in item.get("labels", [])],
+        "milestone": (
+            {"number": milestone["number"], "title": milestone.get("title")} if milestone else None
+        ),
+        "state": str(item.get("state") or "").lower(),
+        "updated_at": item.get("updated_at"),
+    }
 
 
-def list_repo_milestones(repo: RepoTarget) -> dict[str, dict[str, Any]]:
-    milestones = gh_api_json(f"repos/{repo.full_name}/milestones?state=all&per_page=100")
-    return {item["title"]: item for item in milestones}
+def normalize_graphql_issue(node: dict[str, Any]) -> dict[str, Any]:
+    milestone = node.get("milestone")
+    return {
+        "number": node["number"],
+        "node_id": node.get("id"),
+        "title": node.get("title"),
+        "body": node.get("body") or "",
+        "url": node.get("url"),
+        "labels": [{"name": label["name"]} for label in (node.get("labels") or {}).get("nodes", [])],
+        "milestone": (
+            {"number": milestone["number"], "title": milestone.get("title")} if milestone else None
+        ),
+        "state": str(node.get("state") or "").lower(),
+        "updated_at": node.get("updatedAt"),
+    }
 
 
-def list_repo_issues(repo: RepoTarget) -> list[dict[str, Any]]:
-    return run_json(
-        [
-            "gh",
-            "issue",
-            "list",
-            "--repo",
-            repo.full_name,
-            "--state",
-            "all",
-            "--limit",
-            "200",
-            "--json",
-            "number,title,body,url,labels,milestone,state",
-        ]
-    )
+def normalize_graphql_milestone(node: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "number": node["number"],
+        "title": node["title"],
+        "description": node.get("description"),
+        "due_on": node.get("dueOn"),
+        "state": str(node.get("state") or "").lower(),
+    }
+
+
+def merge_issue_listing(
+    key: str,
+    entry: dict[str, Any] | None,
+    fetched: list[dict[str, Any]],
+) -> list[dict[str, Any]]:
+    if entry and entry.get("watermark"):
+        merged = {issue["number"]: issue for issue in entry["data"]}
+        for issue in fetched:
+            merged[issue["number"]] = issue
+        SYNC_CACHE.stats["since"] += 1
+        issues = sorted(merged.values(), key=lambda issue: issue["number"], reverse=True)
+    else:
+        issues = fetched
+    if SYNC_CACHE:
+        watermarks = [issue["updated_at"] for issue in issues if issue.get("updated_at")]
+        SYNC_CACHE.store(key, issues, watermark=max(watermarks) if watermarks else None)
+    return issues
 
 
-def find_existing_issue(
+def fingerprint_matches(
     planned_issue: PlannedIssue,
-    existing_issues: list[dict[str, Any]],
-) -> dict[str, Any] | None:
-    marker_match = None
-    title_matches: list[dict[str, Any]] = []
-    for existing in existing_issues:
-        marker = extract_marker(existing.get("body"))
-        if marker and marker.get("seed_id") == planned_issue.seed_id:
-            marker_match = existing
-            break
-        if existing.get("title") == planned_issue.title:
-            title_matches.append(existing)
-    if marker_match:
-        return marker_match
-    if len(title_matches) == 1:
-        return title_matches[0]
-    return None
+    existing_issue: dict[str, Any] | None,
+    index: IssueIndex | None = None,
+) -> bool:
+    if not existing_issue:
+        return False
+    marker = index.marker(existing_issue) if index else extract_marker(existing_issue.get("body"))
+    return bool(marker) and marker.get("fingerprint") == planned_issue.fingerprint
 
 
 def compare_issue_state(
     planned_issue: PlannedIssue,
     existing_issue: dict[str, Any] | None,
     milestone_numbers: dict[str, int],
+    *,
+    full: bool = True,
+    index: IssueIndex | None = None,
 ) -> dict[str, Any]:
     desired = {
         "title": planned_issue.title,
@@ -1383,6 +2751,8 @@ def compare_issue_state(
     }
     if not existing_issue:
         return {"action": "create", "desired": desired}
+    if not full and fingerprint_matches(planned_issue, existing_issue, index):
+        return {"action": "noop", "changes": {}, "desired": desired, "fingerprint_match": True}
     current_labels = sorted(label["name"] for label in existing_issue.get("labels", []))
     current_body = normalize_text(existing_issue.get("body"))
     current_title = existing_issue.get("title")
@@ -1408,10 +2778,10 @@ def compare_issue_state(
 
 
 def existing_project(owner: str, title: str) -> dict[str, Any] | None:
-    user_query = """
-    query($login:String!) {
-      user(login:$login) {
-        projectsV2(first:100) {
+    query_template = """
+    query($login:String!, $after:String) {
+      %s(login:$login) {
+        projectsV2(first:100, after:$after) {
           nodes {
             id
             number
@@ -1421,160 +2791,541 @@ def existing_project(owner: str, title: str) -> dict[str, Any] | None:
             shortDescription
             readme
             url
+            updatedAt
           }
-        }
-      }
-    }
-    """
-    org_query = """
-    query($login:String!) {
-      organization(login:$login) {
-        projectsV2(first:100) {
-          nodes {
-            id
-            number
-            title
-            closed
-            public
-            shortDescription
-            readme
-            url
+          pageInfo {
+            hasNextPage
+            endCursor
           }
         }
       }
     }
     """
-    data = gh_graphql(user_query, {"login": owner})
-    projects = (((data or {}).get("data") or {}).get("user") or {}).get("projectsV2", {}).get("nodes", [])
-    if not projects:
-        data = gh_graphql(org_query, {"login": owner})
-        projects = (((data or {}).get("data") or {}).get("organization") or {}).get("projectsV2", {}).get("nodes", [])
-    for project in projects:
-        if project["title"] == title:
-            return project
-    return None
+    for owner_kind in ("user", "organization"):
+        try:
+            for project in iter_graphql_nodes(
+                query_template % owner_kind,
+                {"login": owner},
+                (owner_kind, "projectsV2"),
+            ):
+                if project["title"] == title:
+                    return project
+        except SyncCommandError as exc:
+            # A login resolves to either a user or an organization; the other lookup errors.
+            if "could not resolve" not in str(exc).lower():
+                raise
+    return None
 
 
-def project_fields(project_number: int, owner: str) -> dict[str, ProjectFieldRef]:
-    query = """
-    query($owner: String!, $number: Int!, $after: String) {
-      repositoryOwner(login: $owner) {
-        ... on User {
-          projectV2(number: $number) {
-            fields(first: 100, after: $after) {
-              nodes {
-                __typename
-                ... on ProjectV2FieldCommon {
-                  id
-                  name
-                  dataType
-                }
-                ... on ProjectV2SingleSelectField {
-                  options {
-                    id
-                    name
-                  }
-                }
-              }
-              pageInfo {
-                hasNextPage
-                endCursor
-              }
+PROJECT_ITEM_SELECTION = """
+            id
+            content {
+              ... on Issue { url number title }
+              ... on PullRequest { url number title }
             }
-          }
-        }
-        ... on Organization {
-          projectV2(number: $number) {
-            fields(first: 100, after: $after) {
+            fieldValues(first: 50) {
               nodes {
                 __typename
-                ... on ProjectV2FieldCommon {
-                  id
-                  name
-                  dataType
-                }
-                ... on ProjectV2SingleSelectField {
-                  options {
-                    id
-                    name
-                  }
-                }
-              }
-              pageInfo {
-                hasNextPage
-                endCursor
+                ... on ProjectV2ItemFieldTextValue { text field { ... on ProjectV2FieldCommon { name } } }
+                ... on ProjectV2ItemFieldDateValue { date field { ... on ProjectV2FieldCommon { name } } }
+                ... on ProjectV2ItemFieldNumberValue { number field { ... on ProjectV2FieldCommon { name } } }
+                ... on ProjectV2ItemFieldSingleSelectValue { name field { ... on ProjectV2FieldCommon { name } } }
               }
             }
+"""
+
+PROJECT_STATE_QUERY = """
+query(
+  $owner: String!, $number: Int!,
+  $withFields: Boolean!, $fieldsAfter: String,
+  $withItems: Boolean!, $itemsAfter: String
+) {
+  repositoryOwner(login: $owner) {
+    ... on ProjectV2Owner {
+      projectV2(number: $number) {
+        fields(first: 100, after: $fieldsAfter) @include(if: $withFields) {
+          nodes {
+            __typename
+            ... on ProjectV2FieldCommon { id name dataType }
+            ... on ProjectV2SingleSelectField { options { id name } }
           }
+          pageInfo { hasNextPage endCursor }
+        }
+        items(first: 100, after: $itemsAfter) @include(if: $withItems) {
+          nodes {%s}
+          pageInfo { hasNextPage endCursor }
         }
       }
     }
-    """
-    cursor: str | None = None
-    result: dict[str, ProjectFieldRef] = {}
-    while True:
-        payload = gh_graphql(query, {"owner": owner, "number": project_number, "after": cursor})
-        project = ((payload.get("data") or {}).get("repositoryOwner") or {}).get("projectV2")
-        if not project:
-            break
-        fields = project["fields"]
-        for field in fields.get("nodes", []):
-            options = {option["name"]: option["id"] for option in field.get("options", [])}
-            result[field["name"]] = ProjectFieldRef(
-                id=field["id"],
-                name=field["name"],
-                field_type=field["__typename"],
-                options=options,
-            )
-        page_info = fields.get("pageInfo") or {}
-        if not page_info.get("hasNextPage"):
-            break
-        cursor = page_info.get("endCursor")
-    return result
+  }
+}
+""" % PROJECT_ITEM_SELECTION
+
+REPO_STATE_QUERY = """
+query(
+  $owner: String!, $name: String!, $since: DateTime,
+  $withLabels: Boolean!, $labelsAfter: String,
+  $withMilestones: Boolean!, $milestonesAfter: String,
+  $withIssues: Boolean!, $issuesAfter: String
+) {
+  repository(owner: $owner, name: $name) {
+    id
+    labels(first: 100, after: $labelsAfter) @include(if: $withLabels) {
+      nodes { name color description }
+      pageInfo { hasNextPage endCursor }
+    }
+    milestones(first: 100, after: $milestonesAfter, states: [OPEN, CLOSED]) @include(if: $withMilestones) {
+      nodes { number title description dueOn state }
+      pageInfo { hasNextPage endCursor }
+    }
+    issues(
+      first: 100
+      after: $issuesAfter
+      filterBy: {since: $since}
+      orderBy: {field: CREATED_AT, direction: DESC}
+    ) @include(if: $withIssues) {
+      nodes {
+        number
+        id
+        title
+        body
+        url
+        state
+        updatedAt
+        labels(first: 100) { nodes { name } }
+        milestone { number title }
+      }
+      pageInfo { hasNextPage endCursor }
+    }
+  }
+}
+"""
 
 
-def project_items(project_number: int, owner: str) -> dict[str, dict[str, Any]]:
-    payload = gh_project_json(
-        [
-            "item-list",
-            str(project_number),
-            "--owner",
-            owner,
-            "--limit",
-            "500",
-            "--format",
-            "json",
-        ]
+def project_field_ref(node: dict[str, Any]) -> ProjectFieldRef:
+    return ProjectFieldRef(
+        id=node["id"],
+        name=node["name"],
+        field_type=node["__typename"],
+        options={option["name"]: option["id"] for option in node.get("options") or []},
+    )
+
+
+def project_item_from_node(node: dict[str, Any]) -> dict[str, Any]:
+    item: dict[str, Any] = {"id": node["id"], "content": node.get("content") or {}}
+    for value in (node.get("fieldValues") or {}).get("nodes", []):
+        field_name = ((value or {}).get("field") or {}).get("name")
+        if not field_name:
+            continue
+        for key in ("text", "date", "number", "name"):
+            if key in value:
+                item[field_name] = value[key]
+                break
+    return item
+
+
+def fetch_project_state(
+    project: dict[str, Any],
+    owner: str,
+) -> tuple[dict[str, ProjectFieldRef], dict[str, dict[str, Any]]]:
+    key = f"project:{owner}/{project['number']}:state"
+    updated_at = project.get("updatedAt")
+    entry = SYNC_CACHE.lookup(key) if SYNC_CACHE else None
+    if entry and updated_at and entry.get("watermark") == updated_at:
+        SYNC_CACHE.stats["not_modified"] += 1
+        fields = {name: ProjectFieldRef(**ref) for name, ref in entry["data"]["fields"].items()}
+        return fields, entry["data"]["items"]
+    nodes = fetch_graphql_connections(
+        PROJECT_STATE_QUERY,
+        {"owner": owner, "number": project["number"]},
+        ("repositoryOwner", "projectV2"),
+        ("fields", "items"),
     )
-    items = {}
-    for item in payload.get("items", []):
-        content = item.get("content") or {}
-        url = content.get("url")
+    fields = {node["name"]: project_field_ref(node) for node in nodes["fields"] if node.get("id")}
+    items: dict[str, dict[str, Any]] = {}
+    for node in nodes["items"]:
+        item = project_item_from_node(node)
+        url = item["content"].get("url")
         if url:
             items[url] = item
+    if SYNC_CACHE:
+        SYNC_CACHE.store(
+            key,
+            {"fields": {name: dataclasses.asdict(ref) for name, ref in fields.items()}, "items": items},
+            watermark=updated_at,
+        )
+    return fields, items
+
+
+def fetch_repo_state(repo: RepoTarget) -> dict[str, Any]:
+    key = f"repos/{repo.full_name}/issues"
+    entry = SYNC_CACHE.lookup(key) if SYNC_CACHE else None
+    nodes = fetch_graphql_connections(
+        REPO_STATE_QUERY,
+        {"owner": repo.owner, "name": repo.repo, "since": entry.get("watermark") if entry else None},
+        ("repository",),
+        ("labels", "milestones", "issues"),
+    )
+    issues = merge_issue_listing(key, entry, [normalize_graphql_issue(node) for node in nodes["issues"]])
+    return {
+        "repository_id": nodes["repository"].get("id"),
+        "issues": issues,
+        "labels": {node["name"]: node for node in nodes["labels"]},
+        "milestones": {node["title"]: normalize_graphql_milestone(node) for node in nodes["milestones"]},
+    }
+
+
+@dataclasses.dataclass
+class RemoteSnapshot:
+    issues: IssueIndex
+    labels: dict[str, dict[str, Any]]
+    milestones: dict[str, dict[str, Any]]
+    project: dict[str, Any] | None = None
+    fields: dict[str, ProjectFieldRef] = dataclasses.field(default_factory=dict)
+    items: dict[str, dict[str, Any]] = dataclasses.field(default_factory=dict)
+    repository_id: str | None = None
+
+    def __post_init__(self) -> None:
+        self._lock = threading.Lock()
+        # Set during apply: every stored write result is acknowledged in the journal.
+        self.journal: OperationJournal | None = None
+        # Items added after the read carry no field values yet, whatever their issue's marker says.
+        self.added_items: set[str] = set()
+        # Fields whose options were replaced in this run; their values are gone from every item.
+        self.replaced_fields: set[str] = set()
+
+    def acknowledge(self, kind: str, data: Any) -> None:
+        if self.journal is not None:
+            self.journal.ack(kind, data)
+
+    def load_project(
+        self,
+        project: dict[str, Any],
+        fields: dict[str, ProjectFieldRef],
+        items: dict[str, dict[str, Any]],
+    ) -> None:
+        self.project = project
+        self.fields = fields
+        self.items = items
+        self.acknowledge(
+            "project_state",
+            {"project": project, "fields": {name: dataclasses.asdict(ref) for name, ref in fields.items()}, "items": items},
+        )
+
+    def store_project(self, project: dict[str, Any]) -> None:
+        with self._lock:
+            self.project = {**(self.project or {}), **project}
+        self.acknowledge("project", project)
+
+    def store_label(self, label: dict[str, Any]) -> None:
+        with self._lock:
+            self.labels[label["name"]] = label
+        self.acknowledge("label", label)
+
+    def store_milestone(self, milestone: dict[str, Any]) -> None:
+        with self._lock:
+            self.milestones[milestone["title"]] = milestone
+        self.acknowledge("milestone", milestone)
+
+    def store_issue(self, issue: dict[str, Any]) -> None:
+        with self._lock:
+            self.issues.upsert(issue)
+        self.acknowledge("issue", issue)
+
+    def store_field(self, field: ProjectFieldRef) -> None:
+        with self._lock:
+            self.fields[field.name] = field
+        self.acknowledge("field", dataclasses.asdict(field))
+
+    def store_item(self, item: dict[str, Any]) -> None:
+        with self._lock:
+            self.items[item["content"]["url"]] = item
+            self.added_items.add(item["content"]["url"])
+        self.acknowledge("item", item)
+
+    def store_item_value(self, item: dict[str, Any], field_name: str, value: Any) -> None:
+        with self._lock:
+            item[field_name] = value
+        self.acknowledge("item_value", {"url": item["content"].get("url"), "field": field_name, "value": value})
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "issues": self.issues.issues,
+            "labels": self.labels,
+            "milestones": self.milestones,
+            "project": self.project,
+            "fields": {name: dataclasses.asdict(ref) for name, ref in self.fields.items()},
+            "items": self.items,
+            "repository_id": self.repository_id,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> RemoteSnapshot:
+        return cls(
+            issues=IssueIndex(data["issues"]),
+            labels=data["labels"],
+            milestones=data["milestones"],
+            project=data["project"],
+            fields={name: ProjectFieldRef(**ref) for name, ref in data["fields"].items()},
+            items=data["items"],
+            repository_id=data["repository_id"],
+        )
+
+    def replay(self, kind: str, data: Any) -> None:
+        if kind == "project_state":
+            self.load_project(
+                data["project"],
+                {name: ProjectFieldRef(**ref) for name, ref in data["fields"].items()},
+                data["items"],
+            )
+        elif kind == "project":
+            self.store_project(data)
+        elif kind == "label":
+            self.store_label(data)
+        elif kind == "milestone":
+            self.store_milestone(data)
+        elif kind == "issue":
+            self.store_issue(data)
+        elif kind == "field":
+            self.store_field(ProjectFieldRef(**data))
+        elif kind == "item":
+            self.store_item(data)
+        elif kind == "item_value" and data["url"] in self.items:
+            self.store_item_value(self.items[data["url"]], data["field"], data["value"])
+
+
+JOURNAL_VERSION = 1
+
+
+def journal_path(cache_dir: pathlib.Path, repo: RepoTarget) -> pathlib.Path:
+    return cache_dir / "journal" / f"{repo.owner}__{repo.repo}.jsonl"
+
+
+class OperationJournal:
+    """Write-ahead log of an apply run, read back by `--resume`."""
+
+    def __init__(self, path: pathlib.Path) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        self._handle: Any = None
+
+    @classmethod
+    def start(cls, path: pathlib.Path, header: dict[str, Any], remote: RemoteSnapshot) -> OperationJournal:
+        journal = cls(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        journal._handle = path.open("w", encoding="utf-8")
+        journal.append({"type": "run", "version": JOURNAL_VERSION, **header})
+        journal.append({"type": "snapshot", "data": remote.to_dict()})
+        return journal
+
+    def append(self, record: dict[str, Any]) -> None:
+        line = json.dumps(record, ensure_ascii=False, default=str) + "\n"
+        with self._lock:
+            if self._handle is None:
+                return
+            self._handle.write(line)
+            self._handle.flush()
+
+    def operation(self, operation: SyncOperation) -> None:
+        self.append({"type": "operation", **dataclasses.asdict(operation)})
+
+    def ack(self, kind: str, data: Any) -> None:
+        self.append({"type": "ack", "kind": kind, "data": data})
+
+    def close(self) -> None:
+        with self._lock:
+            if self._handle is not None:
+                self._handle.close()
+                self._handle = None
+
+    def complete(self) -> None:
+        self.close()
+        self.path.unlink(missing_ok=True)
+
+    @staticmethod
+    def restore(
+        path: pathlib.Path, header: dict[str, Any]
+    ) -> tuple[RemoteSnapshot, Counter[str], set[str]] | None:
+        """Rebuild the interrupted run's snapshot with acknowledged writes applied; None for a foreign journal."""
+        if not path.exists():
+            return None
+        records: list[dict[str, Any]] = []
+        for line in path.read_text(encoding="utf-8").splitlines():
+            try:
+                records.append(json.loads(line))
+            except json.JSONDecodeError:
+                break
+        if len(records) < 2 or records[0].get("type") != "run" or records[1].get("type") != "snapshot":
+            return None
+        run = records[0]
+        if run.get("version") != JOURNAL_VERSION or any(run.get(key) != value for key, value in header.items()):
+            return None
+        remote = RemoteSnapshot.from_dict(records[1]["data"])
+        counts: Counter[str] = Counter()
+        creates: set[str] = set()
+        for record in records[2:]:
+            counts[record["type"]] += 1
+            if record["type"] == "ack":
+                remote.replay(record["kind"], record["data"])
+            elif record["category"] == "issue" and record["action"] == "create":
+                creates.add(record["target"].split(" ", 1)[0])
+        return remote, counts, creates - set(remote.issues.by_seed_id)
+
+
+def recover_in_flight_issues(remote: RemoteSnapshot, repo: RepoTarget, seed_ids: set[str]) -> int:
+    """Store issues whose create was cut off before its answer arrived but did land on GitHub."""
+    recovered = 0
+    for issue in search_managed_issues(repo, seed_ids):
+        marker = extract_marker(issue.get("body")) or {}
+        if marker.get("seed_id") in seed_ids and marker["seed_id"] not in remote.issues.by_seed_id:
+            remote.store_issue(issue)
+            recovered += 1
+    return recovered
+
+
+def fetch_remote_snapshot(repo: RepoTarget, project_owner: str, project_title: str) -> RemoteSnapshot:
+    state = fetch_repo_state(repo)
+    snapshot = RemoteSnapshot(
+        issues=IssueIndex(state["issues"]),
+        labels=state["labels"],
+        milestones=state["milestones"],
+        repository_id=state["repository_id"],
+    )
+    project = existing_project(project_owner, project_title)
+    if project:
+        snapshot.load_project(project, *fetch_project_state(project, project_owner))
+    return snapshot
+
+
+ISSUE_SEARCH_QUERY = """
+query($query: String!, $after: String) {
+  search(type: ISSUE, query: $query, first: 100, after: $after) {
+    nodes {
+      ... on Issue {
+        number
+        id
+        title
+        body
+        url
+        state
+        updatedAt
+        labels(first: 100) { nodes { name } }
+        milestone { number title }
+      }
+    }
+    pageInfo { hasNextPage endCursor }
+  }
+}
+"""
+
+ISSUE_PROJECT_ITEMS_QUERY = """
+query($ids: [ID!]!) {
+  nodes(ids: $ids) {
+    ... on Issue {
+      projectItems(first: 20) {
+        nodes {
+          project { id }%s}
+      }
+    }
+  }
+}
+""" % PROJECT_ITEM_SELECTION
+
+# GitHub search allows at most five boolean operators per query.
+SEARCH_TERMS_PER_QUERY = 5
+
+
+def search_managed_issues(repo: RepoTarget, seed_ids: set[str]) -> list[dict[str, Any]]:
+    found: dict[int, dict[str, Any]] = {}
+    ordered = sorted(seed_ids)
+    for offset in range(0, len(ordered), SEARCH_TERMS_PER_QUERY):
+        terms = " OR ".join(f'"{seed_id}"' for seed_id in ordered[offset : offset + SEARCH_TERMS_PER_QUERY])
+        query = f"repo:{repo.full_name} is:issue in:body {terms}"
+        for node in iter_graphql_nodes(ISSUE_SEARCH_QUERY, {"query": query}, ("search",)):
+            if node.get("number") is not None:
+                found[node["number"]] = normalize_graphql_issue(node)
+    return sorted(found.values(), key=lambda issue: issue["number"], reverse=True)
+
+
+def fetch_issue_project_items(project_id: str, issues: list[dict[str, Any]]) -> dict[str, dict[str, Any]]:
+    items: dict[str, dict[str, Any]] = {}
+    node_ids = [issue["node_id"] for issue in issues if issue.get("node_id")]
+    for offset in range(0, len(node_ids), 100):
+        payload = gh_graphql(ISSUE_PROJECT_ITEMS_QUERY, {"ids": node_ids[offset : offset + 100]})
+        for node in (payload.get("data") or {}).get("nodes") or []:
+            for item_node in ((node or {}).get("projectItems") or {}).get("nodes") or []:
+                if (item_node.get("project") or {}).get("id") != project_id:
+                    continue
+                item = project_item_from_node(item_node)
+                if item["content"].get("url"):
+                    items[item["content"]["url"]] = item
     return items
 
 
-def ensure_labels(ctx: SyncContext, desired_labels: list[LabelSpec]) -> None:
-    existing = list_repo_labels(ctx.repo)
+def fetch_selected_snapshot(
+    repo: RepoTarget,
+    project_owner: str,
+    project_title: str,
+    seed_ids: set[str],
+) -> RemoteSnapshot:
+    """Read only what a selective sync touches: labels, milestones, and the selected issues and items."""
+    nodes = fetch_graphql_connections(
+        REPO_STATE_QUERY,
+        {"owner": repo.owner, "name": repo.repo, "since": None, "withIssues": False, "issuesAfter": None},
+        ("repository",),
+        ("labels", "milestones"),
+    )
+    index = IssueIndex(search_managed_issues(repo, seed_ids))
+    if not seed_ids <= set(index.by_seed_id):
+        index = IssueIndex(fetch_repo_state(repo)["issues"])
+    snapshot = RemoteSnapshot(
+        issues=index,
+        labels={node["name"]: node for node in nodes["labels"]},
+        milestones={node["title"]: normalize_graphql_milestone(node) for node in nodes["milestones"]},
+        repository_id=nodes["repository"].get("id"),
+    )
+    project = existing_project(project_owner, project_title)
+    if not project:
+        return snapshot
+    entry = SYNC_CACHE.lookup(f"project:{project_owner}/{project['number']}:state") if SYNC_CACHE else None
+    if entry and project.get("updatedAt") and entry.get("watermark") == project["updatedAt"]:
+        snapshot.load_project(project, *fetch_project_state(project, project_owner))
+        return snapshot
+    project_nodes = fetch_graphql_connections(
+        PROJECT_STATE_QUERY,
+        {"owner": project_owner, "number": project["number"], "withItems": False, "itemsAfter": None},
+        ("repositoryOwner", "projectV2"),
+        ("fields",),
+    )
+    fields = {node["name"]: project_field_ref(node) for node in project_nodes["fields"] if node.get("id")}
+    selected_issues = [issue for seed_id, issue in index.by_seed_id.items() if seed_id in seed_ids]
+    snapshot.load_project(project, fields, fetch_issue_project_items(project["id"], selected_issues))
+    return snapshot
+
+
+def invalidate_project_cache(owner: str, project_number: int) -> None:
+    if SYNC_CACHE is not None:
+        SYNC_CACHE.invalidate(f"project:{owner}/{project_number}:")
+
+
+def ensure_labels(ctx: SyncContext, remote: RemoteSnapshot, desired_labels: list[LabelSpec]) -> None:
+    existing = dict(remote.labels)
+
+    def write_label(method: str, endpoint: str, body: dict[str, Any]) -> None:
+        remote.store_label(gh_api_json(endpoint, method=method, body=body))
+
     for label in desired_labels:
         current = existing.get(label.name)
         if not current:
             ctx.record("label", "create", label.name, color=label.color, description=label.description)
             if not ctx.dry_run:
-                run_command(
-                    [
-                        "gh",
-                        "label",
-                        "create",
-                        label.name,
-                        "--repo",
-                        ctx.repo.full_name,
-                        "--color",
-                        label.color,
-                        "--description",
-                        label.description,
-                    ]
+                ctx.submit(
+                    f"label create {label.name}",
+                    write_label,
+                    "POST",
+                    f"repos/{ctx.repo.full_name}/labels",
+                    dataclasses.asdict(label),
+                    serial=True,
                 )
             continue
         if current["color"].lower() != label.color.lower() or normalize_text(current.get("description")) != normalize_text(label.description):
@@ -1586,28 +3337,30 @@ def ensure_labels(ctx: SyncContext, desired_labels: list[LabelSpec]) -> None:
                 desired=dataclasses.asdict(label),
             )
             if not ctx.dry_run:
-                run_command(
-                    [
-                        "gh",
-                        "label",
-                        "create",
-                        label.name,
-                        "--repo",
-                        ctx.repo.full_name,
-                        "--color",
-                        label.color,
-                        "--description",
-                        label.description,
-                        "--force",
-                    ]
+                ctx.submit(
+                    f"label update {label.name}",
+                    write_label,
+                    "PATCH",
+                    f"repos/{ctx.repo.full_name}/labels/{urllib.parse.quote(label.name, safe='')}",
+                    {"color": label.color, "description": label.description},
                 )
         else:
             ctx.record("label", "noop", label.name)
 
 
-def ensure_milestones(ctx: SyncContext, desired_milestones: list[MilestoneSpec]) -> dict[str, int]:
-    existing = list_repo_milestones(ctx.repo)
+def ensure_milestones(
+    ctx: SyncContext,
+    remote: RemoteSnapshot,
+    desired_milestones: list[MilestoneSpec],
+) -> dict[str, int]:
+    existing = dict(remote.milestones)
     title_to_number: dict[str, int] = {}
+
+    def write_milestone(method: str, endpoint: str, body: dict[str, Any]) -> None:
+        written = gh_api_json(endpoint, method=method, body=body)
+        title_to_number[written["title"]] = written["number"]
+        remote.store_milestone(written)
+
     for milestone in desired_milestones:
         current = existing.get(milestone.title)
         desired = {
@@ -1619,12 +3372,14 @@ def ensure_milestones(ctx: SyncContext, desired_milestones: list[MilestoneSpec])
         if not current:
             ctx.record("milestone", "create", milestone.title, desired=desired)
             if not ctx.dry_run:
-                created = gh_api_json(
+                ctx.submit(
+                    f"milestone create {milestone.title}",
+                    write_milestone,
+                    "POST",
                     f"repos/{ctx.repo.full_name}/milestones",
-                    method="POST",
-                    body=desired,
+                    desired,
+                    serial=True,
                 )
-                title_to_number[milestone.title] = created["number"]
             continue
         title_to_number[milestone.title] = current["number"]
         current_desc = normalize_text(current.get("description"))
@@ -1638,10 +3393,12 @@ def ensure_milestones(ctx: SyncContext, desired_milestones: list[MilestoneSpec])
         if changes:
             ctx.record("milestone", "update", milestone.title, changes=changes)
             if not ctx.dry_run:
-                gh_api_json(
+                ctx.submit(
+                    f"milestone update {milestone.title}",
+                    write_milestone,
+                    "PATCH",
                     f"repos/{ctx.repo.full_name}/milestones/{current['number']}",
-                    method="PATCH",
-                    body=desired,
+                    desired,
                 )
         else:
             ctx.record("milestone", "noop", milestone.title)
@@ -1653,35 +3410,67 @@ def ensure_milestones(ctx: SyncContext, desired_milestones: list[MilestoneSpec])
     return title_to_number
 
 
-def ensure_project(ctx: SyncContext, seed: dict[str, Any]) -> dict[str, Any] | None:
-    project = existing_project(ctx.project_owner, ctx.project_title)
+PROJECT_OWNER_ID_QUERY = """
+query($login: String!) {
+  repositoryOwner(login: $login) {
+    id
+  }
+}
+"""
+
+PROJECT_FIELDS_SELECTION = """
+      id
+      number
+      title
+      closed
+      public
+      shortDescription
+      readme
+      url
+      updatedAt
+"""
+
+CREATE_PROJECT_MUTATION = """
+mutation($input: CreateProjectV2Input!) {
+  createProjectV2(input: $input) {
+    projectV2 {%s}
+  }
+}
+""" % PROJECT_FIELDS_SELECTION
+
+UPDATE_PROJECT_MUTATION = """
+mutation($input: UpdateProjectV2Input!) {
+  updateProjectV2(input: $input) {
+    projectV2 {%s}
+  }
+}
+""" % PROJECT_FIELDS_SELECTION
+
+LINK_PROJECT_MUTATION = """
+mutation($input: LinkProjectV2ToRepositoryInput!) {
+  linkProjectV2ToRepository(input: $input) {
+    repository {
+      id
+    }
+  }
+}
+"""
+
+
+def ensure_project(ctx: SyncContext, remote: RemoteSnapshot, seed: dict[str, Any]) -> dict[str, Any] | None:
+    project = remote.project
     desired_readme = build_project_readme(seed)
     desired_description = "24-month exam, control, AI, evidence, and career execution board."
     if not project:
         ctx.record("project", "create", ctx.project_title, owner=ctx.project_owner)
         if ctx.dry_run:
             return None
-        created = gh_project_json(
-            [
-                "create",
-                "--owner",
-                ctx.project_owner,
-                "--title",
-                ctx.project_title,
-                "--format",
-                "json",
-            ]
-        )
-        project = {
-            "id": created["id"],
-            "number": created["number"],
-            "title": created["title"],
-            "closed": created.get("closed", False),
-            "public": created.get("public", False),
-            "shortDescription": created.get("shortDescription", ""),
-            "readme": created.get("readme", ""),
-            "url": created.get("url"),
-        }
+        owner_payload = gh_graphql(PROJECT_OWNER_ID_QUERY, {"login": ctx.project_owner})
+        owner_id = owner_payload["data"]["repositoryOwner"]["id"]
+        created = gh_graphql(CREATE_PROJECT_MUTATION, {"input": {"ownerId": owner_id, "title": ctx.project_title}})
+        project = created["data"]["createProjectV2"]["projectV2"]
+        # A new project already carries built-in fields such as Status; load them once.
+        remote.load_project(project, *fetch_project_state(project, ctx.project_owner))
     if project.get("closed"):
         ctx.warn(
             f"Project '{ctx.project_title}' exists but is closed (number {project['number']}); sync will continue against it."
@@ -1696,34 +3485,28 @@ def ensure_project(ctx: SyncContext, seed: dict[str, Any]) -> dict[str, Any] | N
     if changes:
         ctx.record("project", "update", ctx.project_title, changes=changes)
         if not ctx.dry_run:
-            edit_args = [
-                "edit",
-                str(project["number"]),
-                "--owner",
-                ctx.project_owner,
-                "--description",
-                desired_description,
-                "--readme",
-                desired_readme,
-                "--visibility",
-                "PRIVATE",
-            ]
-            gh_project_json(edit_args)
+            updated = gh_graphql(
+                UPDATE_PROJECT_MUTATION,
+                {
+                    "input": {
+                        "projectId": project["id"],
+                        "shortDescription": desired_description,
+                        "readme": desired_readme,
+                        "public": False,
+                    }
+                },
+                idempotent=True,
+            )
+            remote.store_project(updated["data"]["updateProjectV2"]["projectV2"])
+            project = remote.project
     else:
         ctx.record("project", "noop", ctx.project_title)
     if not ctx.dry_run:
         try:
-            run_command(
-                [
-                    "gh",
-                    "project",
-                    "link",
-                    str(project["number"]),
-                    "--owner",
-                    ctx.project_owner,
-                    "--repo",
-                    ctx.repo.full_name,
-                ]
+            gh_graphql(
+                LINK_PROJECT_MUTATION,
+                {"input": {"projectId": project["id"], "repositoryId": remote.repository_id}},
+                idempotent=True,
             )
             ctx.record("project", "link", ctx.project_title, repo=ctx.repo.full_name)
         except SyncCommandError as exc:
@@ -1736,11 +3519,8 @@ def ensure_project(ctx: SyncContext, seed: dict[str, Any]) -> dict[str, Any] | N
     return project
 
 
-def update_single_select_field_options(
-    field: ProjectFieldRef,
-    spec: ProjectFieldSpec,
-) -> None:
-    options = [
+def single_select_options_input(spec: ProjectFieldSpec) -> list[dict[str, str]]:
+    return [
         {
             "name": option_name,
             "color": option_color(spec.name, option_name, index),
@@ -1748,39 +3528,96 @@ def update_single_select_field_options(
         }
         for index, option_name in enumerate(spec.options)
     ]
-    mutation = """
-    mutation($input: UpdateProjectV2FieldInput!) {
-      updateProjectV2Field(input: $input) {
-        projectV2Field {
-          __typename
-          ... on ProjectV2SingleSelectField {
-            id
-            name
-            options {
-              id
-              name
-            }
-          }
-        }
-      }
+
+
+PROJECT_FIELD_SELECTION = (
+    "projectV2Field { __typename ... on ProjectV2FieldCommon { id name } "
+    "... on ProjectV2SingleSelectField { options { id name } } }"
+)
+
+
+@dataclasses.dataclass
+class FieldChange:
+    spec: ProjectFieldSpec
+    current: ProjectFieldRef | None = None
+
+    @property
+    def action(self) -> str:
+        return "create" if self.current is None else "update"
+
+
+def diff_field_options(current: ProjectFieldRef, spec: ProjectFieldSpec) -> dict[str, Any] | None:
+    current_options = list(current.options)
+    if current_options == spec.options:
+        return None
+    return {
+        "current": current_options,
+        "desired": spec.options,
+        "added": [option for option in spec.options if option not in current.options],
+        "removed": [option for option in current_options if option not in spec.options],
     }
-    """
-    gh_graphql(
-        mutation,
-        {
-            "input": {
-                "fieldId": field.id,
-                "singleSelectOptions": options,
+
+
+def build_project_field_batch(project_id: str, changes: list[FieldChange]) -> tuple[str, dict[str, Any]]:
+    declarations: list[str] = []
+    selections: list[str] = []
+    variables: dict[str, Any] = {}
+    for index, change in enumerate(changes):
+        spec = change.spec
+        if change.current is None:
+            field_input: dict[str, Any] = {
+                "projectId": project_id,
+                "name": spec.name,
+                "dataType": spec.data_type.upper(),
             }
-        },
-    )
+            if spec.data_type == "single_select":
+                field_input["singleSelectOptions"] = single_select_options_input(spec)
+            declarations.append(f"$i{index}: CreateProjectV2FieldInput!")
+            selections.append(f"  f{index}: createProjectV2Field(input: $i{index}) {{ {PROJECT_FIELD_SELECTION} }}")
+        else:
+            # Options are replaced wholesale, so one update per field covers additions, removals and order.
+            field_input = {"fieldId": change.current.id, "singleSelectOptions": single_select_options_input(spec)}
+            declarations.append(f"$i{index}: UpdateProjectV2FieldInput!")
+            selections.append(f"  f{index}: updateProjectV2Field(input: $i{index}) {{ {PROJECT_FIELD_SELECTION} }}")
+        variables[f"i{index}"] = field_input
+    query = f"mutation({', '.join(declarations)}) {{\n" + "\n".join(selections) + "\n}"
+    return query, variables
+
+
+def apply_project_field_changes(remote: RemoteSnapshot, project_id: str, changes: list[FieldChange]) -> None:
+    query, variables = build_project_field_batch(project_id, changes)
+    # A retried create would collide on the field name, so only option updates are retried.
+    idempotent = all(change.current is not None for change in changes)
+    response = github_request("POST", "graphql", body={"query": query, "variables": variables}, idempotent=idempotent)
+    data = (response.data or {}).get("data") or {}
+    by_alias, unscoped = graphql_alias_errors(response.data or {})
+    failures: list[str] = []
+    for index, change in enumerate(changes):
+        node = (data.get(f"f{index}") or {}).get("projectV2Field")
+        message = by_alias.get(f"f{index}") or ("; ".join(unscoped) if unscoped else None)
+        if message or not node:
+            failures.append(f"{change.action} {change.spec.name}: {message or 'no field returned'}")
+            continue
+        returned = project_field_ref(node)
+        if change.current is None:
+            remote.store_field(returned)
+            continue
+        remote.store_field(dataclasses.replace(change.current, options=returned.options))
+        # Replaced options get new ids and GitHub drops the item values that pointed at the old ones.
+        remote.replaced_fields.add(change.spec.name)
+        for item in list(remote.items.values()):
+            if item.get(change.spec.name) not in ("", None):
+                remote.store_item_value(item, change.spec.name, None)
+    if failures:
+        raise SyncCommandError("Project field changes failed: " + "; ".join(failures))
 
 
 def ensure_project_fields(
     ctx: SyncContext,
-    project: dict[str, Any] | None,
+    remote: RemoteSnapshot,
     desired_fields: list[ProjectFieldSpec],
 ) -> dict[str, ProjectFieldRef]:
+    project = remote.project
     if ctx.dry_run and not project:
         for spec in desired_fields:
             ctx.record("project_field", "create", spec.name, type=spec.data_type, options=spec.options)
@@ -1789,46 +3626,26 @@ def ensure_project_fields(
     if not project:
         return {}
 
-    existing = project_fields(project["number"], ctx.project_owner)
+    existing = dict(remote.fields)
+    changes: list[FieldChange] = []
     for spec in desired_fields:
         current = existing.get(spec.name)
         if not current:
             ctx.record("project_field", "create", spec.name, type=spec.data_type, options=spec.options)
-            if not ctx.dry_run:
-                create_args = [
-                    "field-create",
-                    str(project["number"]),
-                    "--owner",
-                    ctx.project_owner,
-                    "--name",
-                    spec.name,
-                    "--data-type",
-                    spec.data_type.upper(),
-                    "--format",
-                    "json",
-                ]
-                if spec.data_type == "single_select":
-                    create_args.extend(["--single-select-options", ",".join(spec.options)])
-                gh_project_json(create_args)
+            changes.append(FieldChange(spec))
             continue
-        if spec.data_type == "single_select":
-            current_options = list(current.options.keys())
-            if current_options != spec.options:
-                ctx.record(
-                    "project_field",
-                    "update",
-                    spec.name,
-                    current=current_options,
-                    desired=spec.options,
-                )
-                if not ctx.dry_run:
-                    update_single_select_field_options(current, spec)
-            else:
-                ctx.record("project_field", "noop", spec.name)
+        option_diff = diff_field_options(current, spec) if spec.data_type == "single_select" else None
+        if option_diff:
+            ctx.record("project_field", "update", spec.name, **option_diff)
+            changes.append(FieldChange(spec, current))
         else:
             ctx.record("project_field", "noop", spec.name)
+    if not ctx.dry_run and changes:
+        ctx.submit("project field changes", apply_project_field_changes, remote, project["id"], changes)
+        ctx.drain("project fields")
+        invalidate_project_cache(ctx.project_owner, project["number"])
     if not ctx.dry_run:
-        return project_fields(project["number"], ctx.project_owner)
+        return remote.fields
     synthetic = dict(existing)
     for spec in desired_fields:
         if spec.name in synthetic:
@@ -1845,14 +3662,21 @@ def ensure_project_fields(
 
 def ensure_repo_issues(
     ctx: SyncContext,
+    remote: RemoteSnapshot,
     planned_issues: list[PlannedIssue],
     milestone_numbers: dict[str, int],
 ) -> dict[str, dict[str, Any]]:
-    existing = list_repo_issues(ctx.repo)
+    existing = remote.issues
     planned_by_seed_id: dict[str, dict[str, Any]] = {}
+
+    def write_issue(seed_id: str, method: str, endpoint: str, body: dict[str, Any]) -> None:
+        written = normalize_rest_issue(gh_api_json(endpoint, method=method, body=body))
+        planned_by_seed_id[seed_id] = written
+        remote.store_issue(written)
+
     for planned_issue in planned_issues:
-        current = find_existing_issue(planned_issue, existing)
-        diff = compare_issue_state(planned_issue, current, milestone_numbers)
+        current = existing.find(planned_issue)
+        diff = compare_issue_state(planned_issue, current, milestone_numbers, full=ctx.full, index=existing)
         target = f"{planned_issue.seed_id} {planned_issue.title}"
         if diff["action"] == "create":
             ctx.record(
@@ -1871,12 +3695,15 @@ def ensure_repo_issues(
                 milestone_number = diff["desired"].get("milestone_number")
                 if milestone_number:
                     body["milestone"] = milestone_number
-                created = gh_api_json(
+                ctx.submit(
+                    f"issue create {target}",
+                    write_issue,
+                    planned_issue.seed_id,
+                    "POST",
                     f"repos/{ctx.repo.full_name}/issues",
-                    method="POST",
-                    body=body,
+                    body,
+                    serial=True,
                 )
-                planned_by_seed_id[planned_issue.seed_id] = created
             continue
         if diff["action"] == "update":
             ctx.record("issue", "update", target, changes=diff["changes"])
@@ -1887,19 +3714,25 @@ def ensure_repo_issues(
                     "labels": planned_issue.labels,
                     "milestone": diff["desired"]["milestone_number"],
                 }
-                updated = gh_api_json(
+                ctx.submit(
+                    f"issue update {target}",
+                    write_issue,
+                    planned_issue.seed_id,
+                    "PATCH",
                     f"repos/{ctx.repo.full_name}/issues/{current['number']}",
-                    method="PATCH",
-                    body=body,
+                    body,
                 )
-                planned_by_seed_id[planned_issue.seed_id] = updated
             continue
-        ctx.record("issue", "noop", target)
+        if diff.get("fingerprint_match"):
+            ctx.unchanged_seed_ids.add(planned_issue.seed_id)
+            ctx.record("issue", "noop", target, fingerprint_match=True)
+        else:
+            ctx.record("issue", "noop", target)
         if current:
             planned_by_seed_id[planned_issue.seed_id] = current
-    refreshed = existing if ctx.dry_run else list_repo_issues(ctx.repo)
+    ctx.drain("issue writes")
     for planned_issue in planned_issues:
-        current = find_existing_issue(planned_issue, refreshed)
+        current = remote.issues.find(planned_issue)
         if current:
             planned_by_seed_id[planned_issue.seed_id] = current
     return planned_by_seed_id
@@ -1907,17 +3740,19 @@ def ensure_repo_issues(
 
 def ensure_project_items(
     ctx: SyncContext,
-    project: dict[str, Any] | None,
+    remote: RemoteSnapshot,
     planned_issues: list[PlannedIssue],
     repo_issue_map: dict[str, dict[str, Any]],
 ) -> dict[str, dict[str, Any]]:
+    project = remote.project
     if ctx.dry_run and not project:
         for planned_issue in planned_issues:
             ctx.record("project_item", "add", planned_issue.title)
         return {}
     if not project:
         return {}
-    existing = project_items(project["number"], ctx.project_owner)
+    existing = dict(remote.items)
+    missing: list[tuple[PlannedIssue, dict[str, Any]]] = []
     for planned_issue in planned_issues:
         issue = repo_issue_map.get(planned_issue.seed_id)
         if not issue:
@@ -1931,20 +3766,31 @@ def ensure_project_items(
             ctx.record("project_item", "noop", planned_issue.title, url=issue_url)
             continue
         ctx.record("project_item", "add", planned_issue.title, url=issue_url)
-        if not ctx.dry_run:
-            gh_project_json(
-                [
-                    "item-add",
-                    str(project["number"]),
-                    "--owner",
-                    ctx.project_owner,
-                    "--url",
-                    issue_url,
-                    "--format",
-                    "json",
-                ]
-            )
-    return project_items(project["number"], ctx.project_owner) if not ctx.dry_run else existing
+        missing.append((planned_issue, issue))
+
+    def send_batch(batch: list[tuple[PlannedIssue, dict[str, Any]]]) -> None:
+        query, variables = build_item_add_batch(project["id"], [issue for _, issue in batch])
+        response = github_request("POST", "graphql", body={"query": query, "variables": variables}, idempotent=True)
+        data = (response.data or {}).get("data") or {}
+        by_alias, unscoped = graphql_alias_errors(response.data or {})
+        for index, (planned_issue, issue) in enumerate(batch):
+            added = data.get(f"a{index}") or {}
+            message = by_alias.get(f"a{index}") or ("; ".join(unscoped) if unscoped else None)
+            if message or not added.get("item"):
+                ctx.error(f"Project item add failed for {planned_issue.seed_id}: {message or 'no item returned'}")
+                continue
+            content = {"url": issue["url"], "number": issue["number"], "title": issue["title"]}
+            remote.store_item({"id": added["item"]["id"], "content": content})
+
+    if not ctx.dry_run:
+        batch_size = max(1, ctx.item_batch_size)
+        for offset in range(0, len(missing), batch_size):
+            batch = missing[offset : offset + batch_size]
+            ctx.submit(f"project item batch {offset // batch_size + 1}", send_batch, batch)
+    ctx.drain("project item adds")
+    if not ctx.dry_run and len(remote.items) != len(existing):
+        invalidate_project_cache(ctx.project_owner, project["number"])
+    return remote.items
 
 
 def current_item_value(current_item: dict[str, Any], field_name: str) -> Any:
@@ -1973,44 +3819,138 @@ def compare_field_value(current_item: dict[str, Any], field_name: str, desired_v
     return current_value == desired_value
 
 
-def field_set_args(
-    project_id: str,
-    item_id: str,
-    field: ProjectFieldRef,
-    value: Any,
-) -> list[str]:
-    base = [
-        "item-edit",
-        "--project-id",
-        project_id,
-        "--id",
-        item_id,
-        "--field-id",
-        field.id,
-    ]
+def build_item_add_batch(project_id: str, issues: list[dict[str, Any]]) -> tuple[str, dict[str, Any]]:
+    declarations: list[str] = []
+    selections: list[str] = []
+    variables: dict[str, Any] = {}
+    for index, issue in enumerate(issues):
+        declarations.append(f"$i{index}: AddProjectV2ItemByIdInput!")
+        selections.append(f"  a{index}: addProjectV2ItemById(input: $i{index}) {{ item {{ id }} }}")
+        variables[f"i{index}"] = {"projectId": project_id, "contentId": issue["node_id"]}
+    query = f"mutation({', '.join(declarations)}) {{\n" + "\n".join(selections) + "\n}"
+    return query, variables
+
+
+def field_value_input(field: ProjectFieldRef, value: Any) -> dict[str, Any] | None:
     if value in ("", None):
-        return base + ["--clear"]
+        return None
     if field.field_type == "ProjectV2SingleSelectField":
-        option_id = field.options[value]
-        return base + ["--single-select-option-id", option_id]
+        return {"singleSelectOptionId": field.options[value]}
     if field.field_type == "ProjectV2Field":
         if isinstance(value, (int, float)):
-            return base + ["--number", str(value)]
+            return {"number": float(value)}
         if re.fullmatch(r"\d{4}-\d{2}-\d{2}", str(value)):
-            return base + ["--date", str(value)]
-        return base + ["--text", str(value)]
+            return {"date": str(value)}
+        return {"text": str(value)}
     if field.field_type == "ProjectV2IterationField":
         raise SyncCommandError(f"Iteration fields are not supported for field {field.name}")
-    return base + ["--text", str(value)]
+    return {"text": str(value)}
+
+
+@dataclasses.dataclass
+class FieldUpdate:
+    target: str
+    item_id: str
+    field: ProjectFieldRef
+    value: Any
+    item: dict[str, Any] | None = None
+
+
+def build_field_update_batch(project_id: str, updates: list[FieldUpdate]) -> tuple[str, dict[str, Any]]:
+    declarations: list[str] = []
+    selections: list[str] = []
+    variables: dict[str, Any] = {}
+    for index, update in enumerate(updates):
+        field_input = {"projectId": project_id, "itemId": update.item_id, "fieldId": update.field.id}
+        value_input = field_value_input(update.field, update.value)
+        if value_input is None:
+            declarations.append(f"$i{index}: ClearProjectV2ItemFieldValueInput!")
+            selections.append(f"  u{index}: clearProjectV2ItemFieldValue(input: $i{index}) {{ projectV2Item {{ id }} }}")
+            variables[f"i{index}"] = field_input
+        else:
+            declarations.append(f"$i{index}: UpdateProjectV2ItemFieldValueInput!")
+            selections.append(f"  u{index}: updateProjectV2ItemFieldValue(input: $i{index}) {{ projectV2Item {{ id }} }}")
+            variables[f"i{index}"] = {**field_input, "value": value_input}
+    query = f"mutation({', '.join(declarations)}) {{\n" + "\n".join(selections) + "\n}"
+    return query, variables
+
+
+def graphql_alias_errors(payload: dict[str, Any]) -> tuple[dict[str, str], list[str]]:
+    by_alias: dict[str, str] = {}
+    unscoped: list[str] = []
+    for error in payload.get("errors") or []:
+        path = error.get("path") or []
+        message = str(error.get("message", error))
+        if path and isinstance(path[0], str):
+            by_alias.setdefault(path[0], message)
+        else:
+            unscoped.append(message)
+    return by_alias, unscoped
+
+
+def apply_field_updates(
+    ctx: SyncContext,
+    project_id: str,
+    updates: list[FieldUpdate],
+    *,
+    remote: RemoteSnapshot | None = None,
+) -> None:
+    sendable: list[FieldUpdate] = []
+    for update in updates:
+        if (
+            update.field.field_type == "ProjectV2SingleSelectField"
+            and update.value not in ("", None)
+            and update.value not in update.field.options
+        ):
+            ctx.error(f"Unknown option '{update.value}' for field {update.field.name}: {update.target}")
+            continue
+        sendable.append(update)
+
+    def send_batch(batch: list[FieldUpdate]) -> None:
+        query, variables = build_field_update_batch(project_id, batch)
+        response = github_request("POST", "graphql", body={"query": query, "variables": variables}, idempotent=True)
+        by_alias, unscoped = graphql_alias_errors(response.data or {})
+        for index, update in enumerate(batch):
+            message = by_alias.get(f"u{index}") or ("; ".join(unscoped) if unscoped else None)
+            if message:
+                ctx.error(f"Field update failed for {update.target}: {message}")
+            elif update.item is not None and remote is not None:
+                remote.store_item_value(update.item, update.field.name, update.value)
+            elif update.item is not None:
+                update.item[update.field.name] = update.value
+
+    batch_size = max(1, ctx.field_batch_size)
+    for offset in range(0, len(sendable), batch_size):
+        batch = sendable[offset : offset + batch_size]
+        ctx.submit(f"field value batch {offset // batch_size + 1}", send_batch, batch)
+    ctx.drain("project field value updates")
+
+
+def field_values_settled(
+    ctx: SyncContext, remote: RemoteSnapshot, planned_issue: PlannedIssue, item: dict[str, Any]
+) -> bool:
+    """Whether a fingerprint match may skip diffing the item's field values."""
+    if not ctx.fields_settled or planned_issue.seed_id not in ctx.unchanged_seed_ids:
+        return False
+    if item["content"].get("url") in remote.added_items:
+        return False
+    if remote.replaced_fields.intersection(planned_issue.field_values):
+        return False
+    return all(
+        current_item_value(item, field_name) not in ("", None)
+        for field_name, value in planned_issue.field_values.items()
+        if value not in ("", None)
+    )
 
 
 def ensure_project_item_fields(
     ctx: SyncContext,
-    project: dict[str, Any] | None,
+    remote: RemoteSnapshot,
     planned_issues: list[PlannedIssue],
     repo_issue_map: dict[str, dict[str, Any]],
     fields: dict[str, ProjectFieldRef],
 ) -> None:
+    project = remote.project
     if ctx.dry_run and not project:
         for planned_issue in planned_issues:
             for field_name, value in planned_issue.field_values.items():
@@ -2020,7 +3960,8 @@ def ensure_project_item_fields(
         return
     if not project:
         return
-    items = project_items(project["number"], ctx.project_owner)
+    items = remote.items
+    updates: list[FieldUpdate] = []
     for planned_issue in planned_issues:
         issue = repo_issue_map.get(planned_issue.seed_id)
         if not issue:
@@ -2050,6 +3991,10 @@ def ensure_project_item_fields(
             else:
                 ctx.error(f"Project item missing for issue {planned_issue.seed_id}")
             continue
+        if field_values_settled(ctx, remote, planned_issue, item):
+            # The marker fingerprint covers field values; --full re-diffs them.
+            ctx.record("project_field_value", "noop", f"{planned_issue.title}:*", fingerprint_match=True)
+            continue
         for field_name, desired_value in planned_issue.field_values.items():
             field = fields.get(field_name)
             if not field:
@@ -2064,16 +4009,142 @@ def ensure_project_item_fields(
                 f"{planned_issue.title}:{field_name}",
                 value=desired_value,
             )
-            if not ctx.dry_run:
-                args = field_set_args(project["id"], item["id"], field, desired_value)
-                gh_project_json(args + ["--format", "json"])
-
-
-def summarize_operations(operations: list[SyncOperation]) -> dict[str, dict[str, int]]:
+            updates.append(
+                FieldUpdate(
+                    target=f"{planned_issue.title}:{field_name}",
+                    item_id=item["id"],
+                    field=field,
+                    value=desired_value,
+                    item=item,
+                )
+            )
+    if not ctx.dry_run:
+        if updates:
+            invalidate_project_cache(ctx.project_owner, project["number"])
+        apply_field_updates(ctx, project["id"], updates, remote=remote)
+
+
+def summarize_operations(ctx: SyncContext) -> dict[str, dict[str, int]]:
+    return {category: dict(counter) for category, counter in ctx.summary.items()}
+
+
+class ReportStream:
+    """JSONL sync report written line by line while the run executes."""
+
+    def __init__(self, path: pathlib.Path, handle: Any) -> None:
+        self.path = path
+        self._handle = handle
+        self._lock = threading.Lock()
+
+    @classmethod
+    def start(cls, ctx: SyncContext) -> ReportStream:
+        ctx.report_dir.mkdir(parents=True, exist_ok=True)
+        timestamp = dt.datetime.now(dt.UTC).strftime("%Y%m%dT%H%M%SZ")
+        mode = "dry-run" if ctx.dry_run else "apply"
+        path = ctx.report_dir / f"{timestamp}_{mode}.jsonl"
+        stream = cls(path, path.open("w", encoding="utf-8"))
+        stream.append(
+            {
+                "type": "run",
+                "report_version": SYNC_REPORT_VERSION,
+                "mode": mode,
+                "generated_at": timestamp,
+                "today": ctx.today.isoformat(),
+                "seed_path": str(ctx.seed_path),
+                "target_repo": ctx.repo.full_name,
+                "project_owner": ctx.project_owner,
+                "project_title": ctx.project_title,
+            }
+        )
+        for operation in ctx.operations:
+            stream.operation(operation)
+        ctx.operations.clear()
+        for warning in ctx.warnings:
+            stream.append({"type": "warning", "message": warning})
+        for error in ctx.errors:
+            stream.append({"type": "error", "message": error})
+        return stream
+
+    def append(self, record: dict[str, Any]) -> None:
+        line = json.dumps(record, ensure_ascii=False, default=str) + "\n"
+        with self._lock:
+            if self._handle is not None:
+                self._handle.write(line)
+                self._handle.flush()
+
+    def operation(self, operation: SyncOperation) -> None:
+        self.append({"type": "operation", **dataclasses.asdict(operation)})
+
+    def close(self) -> None:
+        with self._lock:
+            if self._handle is not None:
+                self._handle.close()
+                self._handle = None
+
+
+def iter_report_records(path: pathlib.Path) -> Iterator[dict[str, Any]]:
+    """Yield the records of a JSONL sync report, stopping at a line torn by a killed run."""
+    with path.open(encoding="utf-8") as handle:
+        for line in handle:
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                return
+
+
+def render_report_markdown(report_path: pathlib.Path, md_path: pathlib.Path) -> None:
+    """Write the Markdown summary of a JSONL report in two streaming passes over the file."""
+    header: dict[str, Any] = {}
+    trailer: dict[str, Any] = {}
     summary: dict[str, Counter[str]] = defaultdict(Counter)
-    for operation in operations:
-        summary[operation.category][operation.action] += 1
-    return {category: dict(counter) for category, counter in summary.items()}
+    warnings: list[str] = []
+    errors: list[str] = []
+    for record in iter_report_records(report_path):
+        if record["type"] == "run":
+            header = record
+        elif record["type"] == "operation":
+            summary[record["category"]][record["action"]] += 1
+        elif record["type"] == "warning":
+            warnings.append(record["message"])
+        elif record["type"] == "error":
+            errors.append(record["message"])
+        elif record["type"] == "summary":
+            trailer = record
+
+    project_number = trailer.get("project_number")
+    md_lines = [
+        f"# Sync Report ({header.get('mode')})",
+        "",
+        f"- Generated at: {header.get('generated_at')}",
+        f"- Today: `{header.get('today')}`",
+        f"- Seed: `{pathlib.PurePath(header.get('seed_path', '')).as_posix()}`",
+        f"- Target repo: `{header.get('target_repo')}`",
+        f"- Project owner: `{header.get('project_owner')}`",
+        f"- Project title: `{header.get('project_title')}`",
+        f"- Project number: `{project_number if project_number is not None else 'n/a'}`",
+        "",
+        "## Summary",
+    ]
+    for category, counts in summary.items():
+        count_text = ", ".join(f"{action}={count}" for action, count in sorted(counts.items()))
+        md_lines.append(f"- {category}: {count_text}")
+    if warnings:
+        md_lines.extend(["", "## Warnings", *[f"- {warning}" for warning in warnings]])
+    if errors:
+        md_lines.extend(["", "## Errors", *[f"- {error}" for error in errors]])
+    if not trailer:
+        md_lines.extend(["", "## Incomplete", "- The run stopped before writing its summary."])
+    md_lines.extend(["", "## Planned Breakdown"])
+    for status_name, count in sorted(trailer.get("planned_status_counts", {}).items()):
+        md_lines.append(f"- Status {status_name}: {count}")
+    for task_type, count in sorted(trailer.get("planned_task_type_counts", {}).items()):
+        md_lines.append(f"- Task Type {task_type}: {count}")
+    md_lines.extend(["", "## Operations"])
+    with md_path.open("w", encoding="utf-8") as handle:
+        handle.write("\n".join(md_lines))
+        for record in iter_report_records(report_path):
+            if record["type"] == "operation":
+                handle.write(f"\n- [{record['category']}] {record['action']} {record['target']}")
 
 
 def write_report(
@@ -2083,9 +4154,9 @@ def write_report(
     project: dict[str, Any] | None,
     planned_issues: list[PlannedIssue],
 ) -> dict[str, str]:
-    ctx.report_dir.mkdir(parents=True, exist_ok=True)
-    timestamp = dt.datetime.now(dt.UTC).strftime("%Y%m%dT%H%M%SZ")
-    mode = "dry-run" if ctx.dry_run else "apply"
+    """Close the run's JSONL report with the planned breakdown and render its Markdown summary."""
+    stream = ctx.report or ReportStream.start(ctx)
+    ctx.report = None
     status_counts = Counter(
         planned_issue.field_values.get("Status")
         for planned_issue in planned_issues
@@ -2096,72 +4167,300 @@ def write_report(
         for planned_issue in planned_issues
         if planned_issue.entity_kind == "issue"
     )
-    payload = {
-        "report_version": REPORT_VERSION,
-        "mode": mode,
-        "generated_at": timestamp,
-        "today": ctx.today.isoformat(),
-        "seed_path": str(ctx.seed_path),
-        "target_repo": ctx.repo.full_name,
-        "project_owner": ctx.project_owner,
-        "project_title": ctx.project_title,
-        "project_number": project.get("number") if project else None,
-        "warnings": ctx.warnings,
-        "errors": ctx.errors,
-        "summary": summarize_operations(ctx.operations),
-        "operations": [dataclasses.asdict(operation) for operation in ctx.operations],
-        "seed_counts": {
-            "phases": len(seed.get("phases", [])),
-            "epics": len(seed.get("epics", [])),
-            "milestones": len(seed.get("milestones", [])),
-            "issues": len(seed.get("issues", [])),
-        },
-        "planned_status_counts": dict(status_counts),
-        "planned_task_type_counts": dict(task_type_counts),
-    }
-    json_path = ctx.report_dir / f"{timestamp}_{mode}.json"
-    json_path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
-    latest_json = ctx.report_dir / f"latest_{mode}.json"
-    latest_json.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+    stream.append(
+        {
+            "type": "summary",
+            "project_number": project.get("number") if project else None,
+            "seed_counts": {
+                "phases": len(seed.get("phases", [])),
+                "epics": len(seed.get("epics", [])),
+                "milestones": len(seed.get("milestones", [])),
+                "issues": len(seed.get("issues", [])),
+            },
+            "planned_status_counts": dict(status_counts),
+            "planned_task_type_counts": dict(task_type_counts),
+            "render_cache": dict(RENDER_CACHE.stats),
+            "profile": PROFILER.to_dict(),
+        }
+    )
+    stream.close()
 
-    md_lines = [
-        f"# Sync Report ({mode})",
-        "",
-        f"- Generated at: {timestamp}",
-        f"- Today: `{ctx.today.isoformat()}`",
-        f"- Seed: `{ctx.seed_path.as_posix()}`",
-        f"- Target repo: `{ctx.repo.full_name}`",
-        f"- Project owner: `{ctx.project_owner}`",
-        f"- Project title: `{ctx.project_title}`",
-        f"- Project number: `{project.get('number') if project else 'n/a'}`",
-        "",
-        "## Summary",
+    mode = "dry-run" if ctx.dry_run else "apply"
+    jsonl_path = stream.path
+    md_path = jsonl_path.with_suffix(".md")
+    render_report_markdown(jsonl_path, md_path)
+    shutil.copyfile(jsonl_path, ctx.report_dir / f"latest_{mode}.jsonl")
+    shutil.copyfile(md_path, ctx.report_dir / f"latest_{mode}.md")
+    return {"jsonl": str(jsonl_path), "md": str(md_path)}
+
+
+@dataclasses.dataclass
+class ReportDiff:
+    old_summary: dict[str, Counter[str]]
+    new_summary: dict[str, Counter[str]]
+    changed: list[tuple[str, str, str, str]]
+    added: list[tuple[str, str, str]]
+    removed: list[tuple[str, str, str]]
+    old_profile: dict[str, Any] = dataclasses.field(default_factory=dict)
+    new_profile: dict[str, Any] = dataclasses.field(default_factory=dict)
+
+
+def diff_reports(old_path: pathlib.Path, new_path: pathlib.Path) -> ReportDiff:
+    """Compare two JSONL reports operation by operation, keyed by category and target."""
+    old_actions: dict[tuple[str, str], deque[str]] = defaultdict(deque)
+    old_summary: dict[str, Counter[str]] = defaultdict(Counter)
+    old_profile: dict[str, Any] = {}
+    for record in iter_report_records(old_path):
+        if record["type"] == "operation":
+            old_actions[(record["category"], record["target"])].append(record["action"])
+            old_summary[record["category"]][record["action"]] += 1
+        elif record["type"] == "summary":
+            old_profile = record.get("profile") or {}
+
+    new_summary: dict[str, Counter[str]] = defaultdict(Counter)
+    new_profile: dict[str, Any] = {}
+    changed: list[tuple[str, str, str, str]] = []
+    added: list[tuple[str, str, str]] = []
+    for record in iter_report_records(new_path):
+        if record["type"] == "summary":
+            new_profile = record.get("profile") or {}
+        if record["type"] != "operation":
+            continue
+        category, target, action = record["category"], record["target"], record["action"]
+        new_summary[category][action] += 1
+        previous = old_actions.get((category, target))
+        if not previous:
+            added.append((category, action, target))
+            continue
+        old_action = previous.popleft()
+        if old_action != action:
+            changed.append((category, old_action, action, target))
+    removed = [
+        (category, action, target)
+        for (category, target), actions in old_actions.items()
+        for action in actions
     ]
-    for category, counts in summarize_operations(ctx.operations).items():
-        count_text = ", ".join(f"{action}={count}" for action, count in sorted(counts.items()))
-        md_lines.append(f"- {category}: {count_text}")
-    if ctx.warnings:
-        md_lines.extend(["", "## Warnings", *[f"- {warning}" for warning in ctx.warnings]])
-    if ctx.errors:
-        md_lines.extend(["", "## Errors", *[f"- {error}" for error in ctx.errors]])
-    md_lines.extend(["", "## Planned Breakdown"])
-    for status_name, count in sorted(status_counts.items()):
-        md_lines.append(f"- Status {status_name}: {count}")
-    for task_type, count in sorted(task_type_counts.items()):
-        md_lines.append(f"- Task Type {task_type}: {count}")
-    md_lines.extend(["", "## Operations"])
-    for operation in ctx.operations:
-        md_lines.append(f"- [{operation.category}] {operation.action} {operation.target}")
-    md_path = ctx.report_dir / f"{timestamp}_{mode}.md"
-    md_path.write_text("\n".join(md_lines), encoding="utf-8")
-    latest_md = ctx.report_dir / f"latest_{mode}.md"
-    latest_md.write_text("\n".join(md_lines), encoding="utf-8")
-    return {"json": str(json_path), "md": str(md_path)}
+    return ReportDiff(old_summary, new_summary, changed, added, removed, old_profile, new_profile)
+
+
+def render_report_diff(diff: ReportDiff) -> list[str]:
+    lines = ["## Summary"]
+    for category in sorted(set(diff.old_summary) | set(diff.new_summary)):
+        old_counts, new_counts = diff.old_summary.get(category, Counter()), diff.new_summary.get(category, Counter())
+        rendered = ", ".join(
+            f"{action}={old_counts[action]}->{new_counts[action]}"
+            for action in sorted(set(old_counts) | set(new_counts))
+            if old_counts[action] != new_counts[action]
+        )
+        lines.append(f"- {category}: {rendered or 'unchanged'}")
+    lines.extend(["", "## Changed"])
+    lines.extend(f"- [{category}] {old} -> {new} {target}" for category, old, new, target in diff.changed)
+    lines.extend(["", "## Only in new"])
+    lines.extend(f"- [{category}] {action} {target}" for category, action, target in diff.added)
+    lines.extend(["", "## Only in old"])
+    lines.extend(f"- [{category}] {action} {target}" for category, action, target in diff.removed)
+    if diff.old_profile and diff.new_profile:
+        lines.extend(["", "## Profile"])
+        old_spans, new_spans = diff.old_profile.get("spans", {}), diff.new_profile.get("spans", {})
+        for name in [*new_spans, *(name for name in old_spans if name not in new_spans)]:
+            lines.append(f"- {name}: {old_spans.get(name, 0.0):.3f}s -> {new_spans.get(name, 0.0):.3f}s")
+        old_requests, new_requests = diff.old_profile.get("requests", {}), diff.new_profile.get("requests", {})
+        for key in sorted(set(old_requests) | set(new_requests)):
+            old_count = old_requests.get(key, {}).get("count", 0)
+            new_count = new_requests.get(key, {}).get("count", 0)
+            if old_count != new_count:
+                lines.append(f"- {key}: {old_count} -> {new_count} call(s)")
+    return lines
+
+
+@dataclasses.dataclass
+class SeedChanges:
+    labels: list[LabelSpec]
+    milestones: list[MilestoneSpec]
+    fields: list[ProjectFieldSpec]
+    planned_issues: list[PlannedIssue]
+    project: bool = False
+
+    def is_empty(self) -> bool:
+        return not (self.labels or self.milestones or self.fields or self.planned_issues or self.project)
+
+    def describe(self) -> str:
+        parts = [
+            f"{len(self.labels)} label(s)" if self.labels else "",
+            f"{len(self.milestones)} milestone(s)" if self.milestones else "",
+            f"{len(self.fields)} field(s)" if self.fields else "",
+            f"{len(self.planned_issues)} issue(s)" if self.planned_issues else "",
+            "project" if self.project else "",
+        ]
+        return ", ".join(part for part in parts if part) or "no changes"
+
+
+@dataclasses.dataclass
+class WatchState:
+    seed: dict[str, Any]
+    today: dt.date
+    planned_issues: list[PlannedIssue]
+    fields: dict[str, ProjectFieldRef]
+    milestone_numbers: dict[str, int]
+    selection: set[str] | None = None
+
+
+def changed_specs(previous: list[Any], current: list[Any], key: Callable[[Any], str]) -> list[Any]:
+    before = {key(spec): spec for spec in previous}
+    return [spec for spec in current if before.get(key(spec)) != spec]
+
+
+def diff_seed_entities(state: WatchState, seed: dict[str, Any], planned_issues: list[PlannedIssue]) -> SeedChanges:
+    """Entities of `seed` that differ from the last synced seed, compared by id."""
+    previous_fingerprints = {issue.seed_id: issue.fingerprint for issue in state.planned_issues}
+    return SeedChanges(
+        labels=changed_specs(label_specs_from_seed(state.seed), label_specs_from_seed(seed), lambda spec: spec.name),
+        milestones=changed_specs(
+            milestone_specs_from_seed(state.seed), milestone_specs_from_seed(seed), lambda spec: spec.seed_id
+        ),
+        fields=changed_specs(seed_field_specs(state.seed), seed_field_specs(seed), lambda spec: spec.name),
+        planned_issues=[
+            issue for issue in planned_issues if previous_fingerprints.get(issue.seed_id) != issue.fingerprint
+        ],
+        project=build_project_readme(state.seed) != build_project_readme(seed),
+    )
+
+
+def sync_seed_changes(
+    ctx: SyncContext,
+    remote: RemoteSnapshot,
+    state: WatchState,
+    changes: SeedChanges,
+    planned_issues: list[PlannedIssue],
+) -> None:
+    if changes.labels:
+        ensure_labels(ctx, remote, changes.labels)
+    if changes.milestones:
+        state.milestone_numbers.update(ensure_milestones(ctx, remote, changes.milestones))
+    ctx.drain("label and milestone writes")
+    if changes.project:
+        ensure_project(ctx, remote, state.seed)
+    replaced: list[str] = []
+    if changes.fields:
+        options_before = {name: field.options for name, field in remote.fields.items()}
+        state.fields = {**state.fields, **ensure_project_fields(ctx, remote, changes.fields)}
+        replaced = [name for name, options in options_before.items() if remote.fields[name].options != options]
+    if changes.planned_issues:
+        repo_issue_map = ensure_repo_issues(ctx, remote, changes.planned_issues, state.milestone_numbers)
+        ensure_project_items(ctx, remote, changes.planned_issues, repo_issue_map)
+        ensure_project_item_fields(ctx, remote, changes.planned_issues, repo_issue_map, state.fields)
+    if replaced:
+        changed = {planned_issue.seed_id for planned_issue in changes.planned_issues}
+        unchanged = [planned_issue for planned_issue in planned_issues if planned_issue.seed_id not in changed]
+        issue_map = {planned_issue.seed_id: remote.issues.find(planned_issue) for planned_issue in unchanged}
+        ensure_project_item_fields(ctx, remote, unchanged, issue_map, state.fields)
+
+
+def watch_cycle(
+    ctx: SyncContext,
+    remote: RemoteSnapshot,
+    state: WatchState,
+    seed: dict[str, Any],
+    *,
+    today: dt.date,
+) -> tuple[SeedChanges, SyncContext]:
+    """Push the entities that changed since the last cycle against the in-memory snapshot."""
+    planned_issues = build_planned_issues(
+        seed,
+        today=today,
+        closed_issue_seed_ids=remote.issues.closed_seed_ids(),
+        only=state.selection,
+    )
+    changes = diff_seed_entities(state, seed, planned_issues)
+    previous_seed = state.seed
+    state.seed = seed
+    cycle_ctx = dataclasses.replace(ctx, today=today, operations=[], warnings=[], errors=[])
+    try:
+        sync_seed_changes(cycle_ctx, remote, state, changes, planned_issues)
+    except SyncCommandError as exc:
+        cycle_ctx.error(str(exc))
+    finally:
+        cycle_ctx.executor.shutdown()
+    if cycle_ctx.errors:
+        # Keep the last synced baseline so the next save retries; remote noops cover what did land.
+        state.seed = previous_seed
+    else:
+        state.today = today
+        state.planned_issues = planned_issues
+    if SYNC_CACHE is not None:
+        SYNC_CACHE.save()
+    return changes, cycle_ctx
+
+
+def seed_stat(seed_path: pathlib.Path) -> tuple[int, int] | None:
+    try:
+        stat = seed_source(seed_path).stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def watch_seed(
+    ctx: SyncContext,
+    remote: RemoteSnapshot,
+    state: WatchState,
+    *,
+    today_override: dt.date | None,
+    interval: float,
+    cache_dir: pathlib.Path | None,
+) -> int:
+    print(f"Watching {ctx.seed_path} for changes (Ctrl+C to stop)", flush=True)
+    last_stat = seed_stat(ctx.seed_path)
+    try:
+        while True:
+            time.sleep(interval)
+            current_stat = seed_stat(ctx.seed_path)
+            today = today_override or iso_today()
+            if current_stat == last_stat and today == state.today:
+                continue
+            last_stat = current_stat
+            started = time.perf_counter()
+            try:
+                seed = load_seed(ctx.seed_path, cache_dir=cache_dir)
+            except SEED_LOAD_ERRORS as exc:
+                # Editors can expose a half-written file; the next save triggers another cycle.
+                print(f"[watch] could not load seed: {exc}", file=sys.stderr, flush=True)
+                continue
+            validation_errors, _ = validate_seed(seed)
+            if validation_errors:
+                for error in validation_errors:
+                    print(f"[watch] [FAIL] {error}", file=sys.stderr)
+                print(f"[watch] skipped: {len(validation_errors)} validation error(s)", flush=True)
+                continue
+            changes, cycle_ctx = watch_cycle(ctx, remote, state, seed, today=today)
+            elapsed = time.perf_counter() - started
+            writes = sum(1 for operation in cycle_ctx.operations if operation.action != "noop")
+            print(
+                f"[watch] {dt.datetime.now().strftime('%H:%M:%S')} {changes.describe()}: "
+                f"{writes} write(s) in {elapsed:.2f}s",
+                flush=True,
+            )
+            for operation in cycle_ctx.operations:
+                if operation.action != "noop":
+                    print(f"- [{operation.category}] {operation.action} {operation.target}")
+            for error in cycle_ctx.errors:
+                print(f"- error: {error}", file=sys.stderr)
+    except KeyboardInterrupt:
+        print("Stopped watching.")
+    return 0
+
+
+def split_ids(values: list[str]) -> list[str]:
+    return [part.strip() for value in values for part in value.split(",") if part.strip()]
 
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Sync data/project-seed.yaml into GitHub Projects.")
-    parser.add_argument("--seed-path", default="data/project-seed.yaml")
+    parser.add_argument(
+        "--seed-path",
+        default="data/project-seed.yaml",
+        help="Seed file, or a sharded seed directory written by scripts.shard_seed.",
+    )
     parser.add_argument("--owner", help="Override repository owner.")
     parser.add_argument("--repo", help="Override repository name.")
     parser.add_argument("--project-owner", help="Override project owner; defaults to repository owner.")
@@ -2181,20 +4480,159 @@ def parse_args() -> argparse.Namespace:
         help="Fail when git remote and seed meta owner/repo differ.",
     )
     parser.add_argument("--report-dir", default="data/sync-reports")
+    parser.add_argument(
+        "--transport",
+        choices=["auto", "http", "gh"],
+        default="auto",
+        help="GitHub API transport: persistent HTTP session (http), gh CLI subprocesses (gh), or http when a token is available (auto).",
+    )
+    parser.add_argument(
+        "--field-batch-size",
+        type=int,
+        default=50,
+        help="Number of project field value updates sent per GraphQL mutation.",
+    )
+    parser.add_argument(
+        "--item-batch-size",
+        type=int,
+        default=50,
+        help="Number of issues added to the project per GraphQL mutation.",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=4,
+        help="Number of independent GitHub writes run in parallel within each apply stage.",
+    )
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="Diff every issue body, label, milestone and field value even when the marker fingerprint is unchanged.",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        default=".cache/github-project-sync",
+        help="Directory for the updatedAt watermark cache of remote GitHub state and the rendered body cache.",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Do not read or write the remote state cache, the rendered body cache or the parsed seed snapshot.",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Print per-phase timings and per-endpoint request counts, latency and bytes.",
+    )
+    parser.add_argument(
+        "--report-diff",
+        nargs=2,
+        metavar=("OLD", "NEW"),
+        help="Compare the operations of two JSONL sync reports and exit.",
+    )
+    parser.add_argument("--cache-inspect", action="store_true", help="Print the cached entries and exit.")
+    parser.add_argument("--cache-clear", action="store_true", help="Delete the remote state cache and exit.")
+    parser.add_argument("--record-fixtures", help="Append every GitHub request and response to this JSONL file.")
+    parser.add_argument(
+        "--replay-fixtures",
+        help="Serve GitHub responses from a --record-fixtures file instead of the network.",
+    )
+    parser.add_argument(
+        "--only",
+        action="append",
+        default=[],
+        help="Sync only these seed ids (comma-separated; epic ids include their issues) plus their dependencies.",
+    )
+    parser.add_argument(
+        "--phase",
+        action="append",
+        default=[],
+        help="Sync only work items in these phases (comma-separated) plus their dependencies.",
+    )
+    parser.add_argument(
+        "--milestone",
+        action="append",
+        default=[],
+        help="Sync only work items in these milestone ids (comma-separated) plus their dependencies.",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue an interrupted --apply run from its journal instead of re-reading GitHub state.",
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="After the sync, keep the remote snapshot in memory and push only changed seed entities on each save.",
+    )
+    parser.add_argument(
+        "--watch-interval",
+        type=float,
+        default=0.25,
+        help="Seconds between seed file checks in --watch mode.",
+    )
     return parser.parse_args()
 
 
+def inspect_sync_cache(cache_dir: pathlib.Path) -> None:
+    paths = sorted(cache_dir.glob("*.json")) if cache_dir.exists() else []
+    render_path = cache_dir / RENDER_CACHE_FILE
+    if not paths and not render_path.exists():
+        print(f"No cache files in {cache_dir}")
+        return
+    if render_path.exists():
+        render_cache = RenderCache(render_path)
+        print(f"{render_path} ({render_path.stat().st_size} bytes, {len(render_cache.entries)} rendered bodies)")
+    for path in paths:
+        cache = SyncCache(path)
+        print(f"{path} ({path.stat().st_size} bytes, {len(cache.entries)} entries)")
+        for key, entry in sorted(cache.entries.items()):
+            data = entry.get("data")
+            size = len(data) if isinstance(data, (list, dict)) else 0
+            print(
+                f"- {key}: items={size} "
+                f"watermark={entry.get('watermark') or '-'} fetched_at={entry.get('fetched_at')}"
+            )
+
+
+def clear_sync_cache(cache_dir: pathlib.Path) -> int:
+    removed = 0
+    for path in cache_dir.glob("*.json") if cache_dir.exists() else []:
+        path.unlink()
+        removed += 1
+    render_path = cache_dir / RENDER_CACHE_FILE
+    if render_path.exists():
+        render_path.unlink()
+        removed += 1
+    return removed
+
+
 def main() -> int:
     args = parse_args()
     cwd = pathlib.Path.cwd()
+    cache_dir = pathlib.Path(args.cache_dir)
+    if args.report_diff:
+        old_path, new_path = (pathlib.Path(path) for path in args.report_diff)
+        print(f"# Report diff: {old_path.name} -> {new_path.name}")
+        print()
+        print("\n".join(render_report_diff(diff_reports(old_path, new_path))))
+        return 0
+    if args.cache_inspect:
+        inspect_sync_cache(cache_dir)
+        return 0
+    if args.cache_clear:
+        print(f"Removed {clear_sync_cache(cache_dir)} cache file(s) from {cache_dir}")
+        return 0
     seed_path = pathlib.Path(args.seed_path)
     if not seed_path.exists():
         print(f"Seed file not found: {seed_path}", file=sys.stderr)
         return 1
 
-    seed = yaml.safe_load(seed_path.read_text(encoding="utf-8"))
+    with PROFILER.span("load"):
+        seed = load_seed(seed_path, cache_dir=None if args.no_cache else SEED_CACHE_DIR)
     today = parse_iso_date(args.today) if args.today else iso_today()
-    validation_errors, validation_warnings = validate_seed(seed)
+    with PROFILER.span("validate"):
+        validation_errors, validation_warnings = validate_seed(seed)
 
     if args.validate:
         for error in validation_errors:
@@ -2203,6 +4641,8 @@ def main() -> int:
             print(f"[WARN] {warning}")
         print(f"FAIL: {len(validation_errors)}")
         print(f"WARN: {len(validation_warnings)}")
+        if args.profile:
+            print("\n".join(PROFILER.render()))
         return 1 if validation_errors else 0
 
     if validation_errors:
@@ -2211,7 +4651,8 @@ def main() -> int:
         return 1
 
     if args.audit:
-        findings = build_audit_findings(seed, today=today)
+        with PROFILER.span("audit"):
+            findings = build_audit_findings(seed, today=today)
         report_paths = write_audit_report(
             seed=seed,
             findings=findings,
@@ -2227,6 +4668,8 @@ def main() -> int:
         print(f"INFO: {summary['INFO']}")
         print(f"JSON report: {report_paths['json']}")
         print(f"Markdown report: {report_paths['md']}")
+        if args.profile:
+            print("\n".join(PROFILER.render()))
         return 1 if summary["FAIL"] else 0
 
     remote_target = parse_github_repo(git_remote_url(cwd))
@@ -2253,6 +4696,10 @@ def main() -> int:
         today=today,
         seed_path=seed_path,
         report_dir=pathlib.Path(args.report_dir),
+        field_batch_size=args.field_batch_size,
+        item_batch_size=args.item_batch_size,
+        concurrency=args.concurrency,
+        full=args.full,
     )
 
     if remote_target and seed_target and remote_target.full_name != seed_target.full_name:
@@ -2272,35 +4719,131 @@ def main() -> int:
             return 1
         ctx.warn(mismatch_message)
 
-    existing_issues = list_repo_issues(ctx.repo)
-    managed_closed_seed_ids = closed_issue_seed_ids(existing_issues)
-    planned_issues = build_planned_issues(
-        seed,
-        today=today,
-        closed_issue_seed_ids=managed_closed_seed_ids,
-    )
+    selection: set[str] | None = None
+    if args.only or args.phase or args.milestone:
+        try:
+            selection = select_seed_ids(
+                seed,
+                only=split_ids(args.only),
+                phases=split_ids(args.phase),
+                milestones=split_ids(args.milestone),
+            )
+        except SyncCommandError as exc:
+            print(str(exc), file=sys.stderr)
+            return 1
+
+    # The journal is kept with --no-cache too: it is the only record of what an interrupted apply already wrote.
+    run_journal_path = journal_path(cache_dir, ctx.repo)
+    journal_header = {
+        "repo": ctx.repo.full_name,
+        "project_owner": ctx.project_owner,
+        "project_title": ctx.project_title,
+        "selection": sorted(selection) if selection is not None else None,
+    }
+    if not args.no_cache:
+        set_sync_cache(SyncCache(sync_cache_path(cache_dir, ctx.repo), read_enabled=not args.full))
+        set_render_cache(RenderCache(cache_dir / RENDER_CACHE_FILE))
+    try:
+        transport = (
+            FixtureTransport(pathlib.Path(args.replay_fixtures))
+            if args.replay_fixtures
+            else build_transport(args.transport)
+        )
+        if args.record_fixtures:
+            transport = RecordingTransport(transport, pathlib.Path(args.record_fixtures))
+        set_transport(transport)
+        remote = None
+        if args.resume:
+            restored = OperationJournal.restore(run_journal_path, journal_header)
+            if restored is None:
+                print(f"No resumable journal at {run_journal_path}; reading GitHub state.")
+            else:
+                remote, counts, in_flight = restored
+                print(
+                    f"Resuming from {run_journal_path}: {counts['ack']} of {counts['operation']} "
+                    "logged write(s) acknowledged."
+                )
+                if in_flight:
+                    recovered = recover_in_flight_issues(remote, ctx.repo, in_flight)
+                    print(f"Checked {len(in_flight)} unacknowledged issue create(s); {recovered} had landed.")
+        with PROFILER.span("fetch"):
+            if remote is None and selection is None:
+                remote = fetch_remote_snapshot(ctx.repo, ctx.project_owner, ctx.project_title)
+            elif remote is None:
+                remote = fetch_selected_snapshot(ctx.repo, ctx.project_owner, ctx.project_title, selection)
+    except SyncCommandError as exc:
+        print(str(exc), file=sys.stderr)
+        return 1
+    # A journal left on disk (always the case for --resume) means the last field stage may not have finished.
+    ctx.fields_settled = not run_journal_path.exists()
+    if not ctx.dry_run:
+        # Started after the read so that the journal's snapshot is the state the run plans against.
+        journal = OperationJournal.start(run_journal_path, journal_header, remote)
+        remote.journal = ctx.journal = journal
+    ctx.report = ReportStream.start(ctx)
+    managed_closed_seed_ids = remote.issues.closed_seed_ids()
+    with PROFILER.span("plan"):
+        planned_issues = build_planned_issues(
+            seed,
+            today=today,
+            closed_issue_seed_ids=managed_closed_seed_ids,
+            only=selection,
+        )
+        RENDER_CACHE.save()
     label_specs = label_specs_from_seed(seed)
     milestone_specs = milestone_specs_from_seed(seed)
     field_specs = seed_field_specs(seed)
+    if selection is not None:
+        used_labels = {label for planned_issue in planned_issues for label in planned_issue.labels}
+        used_milestones = {planned_issue.milestone_title for planned_issue in planned_issues}
+        label_specs = [spec for spec in label_specs if spec.name in used_labels]
+        milestone_specs = [spec for spec in milestone_specs if spec.title in used_milestones]
 
     project: dict[str, Any] | None = None
+    milestone_numbers: dict[str, int] = {}
+    fields: dict[str, ProjectFieldRef] = {}
     try:
-        ensure_labels(ctx, label_specs)
-        milestone_numbers = ensure_milestones(ctx, milestone_specs)
-        project = ensure_project(ctx, seed)
-        fields = ensure_project_fields(ctx, project, field_specs)
-        repo_issue_map = ensure_repo_issues(ctx, planned_issues, milestone_numbers)
-        ensure_project_items(ctx, project, planned_issues, repo_issue_map)
-        ensure_project_item_fields(ctx, project, planned_issues, repo_issue_map, fields)
+        with PROFILER.span("ensure_labels_and_milestones"):
+            ensure_labels(ctx, remote, label_specs)
+            milestone_numbers = ensure_milestones(ctx, remote, milestone_specs)
+            ctx.drain("label and milestone writes")
+        if selection is None:
+            with PROFILER.span("ensure_project"):
+                project = ensure_project(ctx, remote, seed)
+        else:
+            # The project readme and repository link are whole-seed concerns; a selective sync only reads them.
+            project = remote.project
+            if not project:
+                ctx.warn(f"Project '{ctx.project_title}' not found; run a full sync to create it.")
+        with PROFILER.span("ensure_project_fields"):
+            fields = ensure_project_fields(ctx, remote, field_specs)
+        with PROFILER.span("ensure_repo_issues"):
+            repo_issue_map = ensure_repo_issues(ctx, remote, planned_issues, milestone_numbers)
+        with PROFILER.span("ensure_project_items"):
+            ensure_project_items(ctx, remote, planned_issues, repo_issue_map)
+        with PROFILER.span("ensure_project_item_fields"):
+            ensure_project_item_fields(ctx, remote, planned_issues, repo_issue_map, fields)
     except SyncCommandError as exc:
         ctx.error(str(exc))
+    finally:
+        ctx.executor.shutdown()
+    if ctx.journal is not None:
+        if ctx.errors:
+            ctx.journal.close()
+        else:
+            ctx.journal.complete()
+        remote.journal = ctx.journal = None
 
+    if SYNC_CACHE is not None:
+        SYNC_CACHE.save()
     report_paths = write_report(ctx, seed=seed, project=project, planned_issues=planned_issues)
-    summary = summarize_operations(ctx.operations)
+    summary = summarize_operations(ctx)
     print(f"Mode: {'dry-run' if ctx.dry_run else 'apply'}")
     print(f"Today: {ctx.today.isoformat()}")
     print(f"Target repo: {ctx.repo.full_name}")
     print(f"Project: {ctx.project_title}")
+    if selection is not None:
+        print(f"Selection: {len(planned_issues)} planned item(s) including dependencies")
     for category, counts in sorted(summary.items()):
         rendered = ", ".join(f"{action}={count}" for action, count in sorted(counts.items()))
         print(f"- {category}: {rendered}")
@@ -2312,8 +4855,33 @@ def main() -> int:
         print("Errors:")
         for error in ctx.errors:
             print(f"- {error}")
-    print(f"JSON report: {report_paths['json']}")
+    print(f"JSONL report: {report_paths['jsonl']}")
     print(f"Markdown report: {report_paths['md']}")
+    if args.profile:
+        print("\n".join(PROFILER.render()))
+    if not ctx.dry_run and ctx.errors:
+        print(f"Journal kept at {run_journal_path}; rerun with --resume to finish the remaining writes.")
+    if args.watch:
+        state = WatchState(
+            seed=seed,
+            today=today,
+            # After a failed run, diff every issue again on the first save; landed writes come back as noops.
+            planned_issues=[] if ctx.errors else planned_issues,
+            fields=fields,
+            milestone_numbers={
+                **{title: milestone["number"] for title, milestone in remote.milestones.items()},
+                **milestone_numbers,
+            },
+            selection=selection,
+        )
+        return watch_seed(
+            ctx,
+            remote,
+            state,
+            today_override=parse_iso_date(args.today) if args.today else None,
+            interval=args.watch_interval,
+            cache_dir=None if args.no_cache else SEED_CACHE_DIR,
+        )
     return 1 if ctx.errors else 0
 
 
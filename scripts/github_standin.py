@@ -0,0 +1,683 @@
+from __future__ import annotations
+
+import argparse
+import dataclasses
+import datetime as dt
+import http.server
+import json
+import math
+import pathlib
+import re
+import sys
+import threading
+import time
+import urllib.parse
+from collections import Counter
+from typing import Any
+
+if __package__ in {None, ""}:
+    sys.path.append(str(pathlib.Path(__file__).resolve().parents[1]))
+
+
+DEFAULT_PROJECT_FIELDS = [
+    {"__typename": "ProjectV2Field", "name": "Title", "dataType": "TITLE"},
+    {
+        "__typename": "ProjectV2SingleSelectField",
+        "name": "Status",
+        "dataType": "SINGLE_SELECT",
+        "options": ["Todo", "In Progress", "Done"],
+    },
+    {"__typename": "ProjectV2Field", "name": "Assignees", "dataType": "ASSIGNEES"},
+    {"__typename": "ProjectV2Field", "name": "Labels", "dataType": "LABELS"},
+]
+SEARCH_REPO_PATTERN = re.compile(r"repo:(\S+)/(\S+)")
+SEARCH_TERM_PATTERN = re.compile(r'"([^"]+)"')
+SEARCH_LABEL_PATTERN = re.compile(r"(-?)label:(\S+)")
+SEARCH_STATE_PATTERN = re.compile(r"\bis:(open|closed)\b")
+MUTATION_PATTERN = re.compile(r"(?:(\w+)\s*:\s*)?(\w+)\(input:\s*\$(\w+)\)")
+REST_PATTERN = re.compile(
+    r"^/repos/(?P<owner>[^/]+)/(?P<repo>[^/]+)/(?P<collection>labels|milestones|issues)(?:/(?P<key>[^/]+))?$"
+)
+
+
+class StandinError(Exception):
+    def __init__(self, status: int, message: str) -> None:
+        super().__init__(message)
+        self.status = status
+
+
+@dataclasses.dataclass
+class StandinConfig:
+    latency: float = 0.0
+    rate_limit: int | None = None
+    rate_window: float = 3600.0
+    max_page_size: int = 100
+
+
+def now_iso() -> str:
+    return dt.datetime.now(dt.UTC).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+
+class StandinState:
+    """In-memory GitHub: repositories with labels, milestones and issues, plus ProjectV2 boards."""
+
+    def __init__(self, host: str = "http://127.0.0.1", *, page_size: int = 100) -> None:
+        self.host = host
+        self.page_size = page_size
+        self.lock = threading.RLock()
+        self.sequence = 0
+        self.repos: dict[str, dict[str, Any]] = {}
+        self.projects: list[dict[str, Any]] = []
+        self.stats: Counter[str] = Counter()
+
+    def next_id(self, prefix: str) -> str:
+        self.sequence += 1
+        return f"{prefix}_{self.sequence}"
+
+    def repo(self, owner: str, name: str) -> dict[str, Any]:
+        key = f"{owner}/{name}"
+        if key not in self.repos:
+            self.repos[key] = {
+                "id": self.next_id("R"),
+                "owner": owner,
+                "name": name,
+                "labels": {},
+                "milestones": {},
+                "issues": {},
+                "next_number": 1,
+            }
+        return self.repos[key]
+
+    def find_repo(self, node_id: str) -> dict[str, Any]:
+        for repo in self.repos.values():
+            if repo["id"] == node_id:
+                return repo
+        raise StandinError(404, f"Could not resolve to a node with the global id of '{node_id}'")
+
+    def find_project(self, node_id: str) -> dict[str, Any]:
+        for project in self.projects:
+            if project["id"] == node_id:
+                return project
+        raise StandinError(404, f"Could not resolve to a ProjectV2 with the global id of '{node_id}'")
+
+    def find_issue(self, node_id: str) -> tuple[dict[str, Any], dict[str, Any]]:
+        for repo in self.repos.values():
+            for issue in repo["issues"].values():
+                if issue["node_id"] == node_id:
+                    return repo, issue
+        raise StandinError(404, f"Could not resolve to an Issue with the global id of '{node_id}'")
+
+    # REST representations
+
+    def rest_label(self, repo: dict[str, Any], label: dict[str, Any]) -> dict[str, Any]:
+        return {
+            "id": label["id"],
+            "node_id": label["id"],
+            "url": f"{self.host}/repos/{repo['owner']}/{repo['name']}/labels/{urllib.parse.quote(label['name'])}",
+            "name": label["name"],
+            "color": label["color"],
+            "description": label["description"],
+            "default": False,
+        }
+
+    def rest_milestone(self, milestone: dict[str, Any]) -> dict[str, Any]:
+        return {key: milestone[key] for key in ("number", "title", "description", "due_on", "state")} | {
+            "node_id": milestone["id"]
+        }
+
+    def rest_issue(self, repo: dict[str, Any], issue: dict[str, Any]) -> dict[str, Any]:
+        milestone = repo["milestones"].get(issue["milestone"]) if issue["milestone"] else None
+        return {
+            "number": issue["number"],
+            "node_id": issue["node_id"],
+            "title": issue["title"],
+            "body": issue["body"],
+            "html_url": f"https://github.com/{repo['owner']}/{repo['name']}/issues/{issue['number']}",
+            "labels": [{"name": name} for name in issue["labels"]],
+            "milestone": self.rest_milestone(milestone) if milestone else None,
+            "state": issue["state"],
+            "created_at": issue["created_at"],
+            "updated_at": issue["updated_at"],
+        }
+
+    def write_issue(self, repo: dict[str, Any], issue: dict[str, Any], body: dict[str, Any]) -> None:
+        for key in ("title", "body", "state"):
+            if key in body:
+                issue[key] = body[key] if body[key] is not None else ""
+        if "labels" in body:
+            for name in body["labels"]:
+                if name not in repo["labels"]:
+                    repo["labels"][name] = {"id": self.next_id("LA"), "name": name, "color": "ededed", "description": ""}
+            issue["labels"] = list(body["labels"])
+        if "milestone" in body:
+            if body["milestone"] is not None and body["milestone"] not in repo["milestones"]:
+                raise StandinError(422, f"Validation Failed: milestone {body['milestone']} does not exist")
+            issue["milestone"] = body["milestone"]
+        issue["updated_at"] = now_iso()
+
+    def rest(self, method: str, path: str, query: dict[str, str], body: Any) -> tuple[int, Any]:
+        match = REST_PATTERN.match(path)
+        if not match:
+            raise StandinError(404, f"Not Found: {path}")
+        repo = self.repo(match["owner"], match["repo"])
+        collection, key = match["collection"], match["key"]
+        if collection == "labels":
+            if method == "GET" and key is None:
+                return 200, [self.rest_label(repo, label) for label in repo["labels"].values()]
+            if method == "POST" and key is None:
+                if body["name"] in repo["labels"]:
+                    raise StandinError(422, "Validation Failed: label already_exists")
+                label = {
+                    "id": self.next_id("LA"),
+                    "name": body["name"],
+                    "color": body.get("color", "ededed"),
+                    "description": body.get("description") or "",
+                }
+                repo["labels"][label["name"]] = label
+                return 201, self.rest_label(repo, label)
+            if method == "PATCH" and key is not None:
+                label = repo["labels"].get(urllib.parse.unquote(key))
+                if label is None:
+                    raise StandinError(404, "Not Found")
+                label.update({field: body[field] for field in ("color", "description") if field in body})
+                return 200, self.rest_label(repo, label)
+        if collection == "milestones":
+            if method == "GET" and key is None:
+                return 200, [self.rest_milestone(milestone) for milestone in repo["milestones"].values()]
+            if method == "POST" and key is None:
+                if any(milestone["title"] == body["title"] for milestone in repo["milestones"].values()):
+                    raise StandinError(422, "Validation Failed: milestone already_exists")
+                number = len(repo["milestones"]) + 1
+                milestone = {
+                    "id": self.next_id("MI"),
+                    "number": number,
+                    "title": body["title"],
+                    "description": body.get("description") or "",
+                    "due_on": body.get("due_on"),
+                    "state": body.get("state", "open"),
+                }
+                repo["milestones"][number] = milestone
+                return 201, self.rest_milestone(milestone)
+            if method == "PATCH" and key is not None:
+                milestone = repo["milestones"].get(int(key))
+                if milestone is None:
+                    raise StandinError(404, "Not Found")
+                milestone.update({field: body[field] for field in ("title", "description", "due_on", "state") if field in body})
+                return 200, self.rest_milestone(milestone)
+        if collection == "issues":
+            if method == "GET" and key is None:
+                issues = sorted(repo["issues"].values(), key=lambda issue: issue["number"], reverse=True)
+                state = query.get("state", "open")
+                if state != "all":
+                    issues = [issue for issue in issues if issue["state"] == state]
+                if query.get("since"):
+                    issues = [issue for issue in issues if issue["updated_at"] >= query["since"]]
+                return 200, [self.rest_issue(repo, issue) for issue in issues]
+            if method == "POST" and key is None:
+                number = repo["next_number"]
+                repo["next_number"] += 1
+                timestamp = now_iso()
+                issue = {
+                    "number": number,
+                    "node_id": self.next_id("I"),
+                    "title": "",
+                    "body": "",
+                    "labels": [],
+                    "milestone": None,
+                    "state": "open",
+                    "created_at": timestamp,
+                    "updated_at": timestamp,
+                }
+                self.write_issue(repo, issue, body)
+                repo["issues"][number] = issue
+                return 201, self.rest_issue(repo, issue)
+            if method == "PATCH" and key is not None:
+                issue = repo["issues"].get(int(key))
+                if issue is None:
+                    raise StandinError(404, "Not Found")
+                self.write_issue(repo, issue, body)
+                return 200, self.rest_issue(repo, issue)
+        raise StandinError(404, f"Not Found: {method} {path}")
+
+    # GraphQL representations
+
+    def graphql_issue(self, repo: dict[str, Any], issue: dict[str, Any]) -> dict[str, Any]:
+        milestone = repo["milestones"].get(issue["milestone"]) if issue["milestone"] else None
+        return {
+            "number": issue["number"],
+            "id": issue["node_id"],
+            "title": issue["title"],
+            "body": issue["body"],
+            "url": f"https://github.com/{repo['owner']}/{repo['name']}/issues/{issue['number']}",
+            "state": issue["state"].upper(),
+            "updatedAt": issue["updated_at"],
+            "labels": {"nodes": [{"name": name} for name in issue["labels"]]},
+            "milestone": {"number": milestone["number"], "title": milestone["title"]} if milestone else None,
+        }
+
+    def graphql_field(self, field: dict[str, Any]) -> dict[str, Any]:
+        node = {"__typename": field["__typename"], "id": field["id"], "name": field["name"], "dataType": field["dataType"]}
+        if field["__typename"] == "ProjectV2SingleSelectField":
+            node["options"] = [{"id": option["id"], "name": option["name"]} for option in field["options"]]
+        return node
+
+    def graphql_project(self, project: dict[str, Any]) -> dict[str, Any]:
+        return {
+            key: project[key]
+            for key in ("id", "number", "title", "closed", "public", "shortDescription", "readme", "url", "updatedAt")
+        }
+
+    def graphql_item(self, project: dict[str, Any], item: dict[str, Any]) -> dict[str, Any]:
+        repo, issue = self.find_issue(item["content_id"])
+        values = []
+        for field in project["fields"]:
+            value = item["values"].get(field["id"])
+            if value is None:
+                continue
+            if "singleSelectOptionId" in value:
+                option = next(
+                    (option for option in field["options"] if option["id"] == value["singleSelectOptionId"]),
+                    None,
+                )
+                if option is None:
+                    continue
+                node = {"__typename": "ProjectV2ItemFieldSingleSelectValue", "name": option["name"]}
+            elif "date" in value:
+                node = {"__typename": "ProjectV2ItemFieldDateValue", "date": value["date"]}
+            elif "number" in value:
+                node = {"__typename": "ProjectV2ItemFieldNumberValue", "number": value["number"]}
+            else:
+                node = {"__typename": "ProjectV2ItemFieldTextValue", "text": value.get("text")}
+            values.append({**node, "field": {"name": field["name"]}})
+        content = self.graphql_issue(repo, issue)
+        return {
+            "id": item["id"],
+            "content": {key: content[key] for key in ("url", "number", "title")},
+            "fieldValues": {"nodes": values},
+        }
+
+    def page(self, nodes: list[Any], after: str | None, first: int) -> dict[str, Any]:
+        offset = int(after) if after else 0
+        end = offset + first
+        return {
+            "nodes": nodes[offset:end],
+            "pageInfo": {"hasNextPage": end < len(nodes), "endCursor": str(end) if end < len(nodes) else None},
+        }
+
+    def new_field(self, typename: str, name: str, data_type: str, options: list[str]) -> dict[str, Any]:
+        field = {"id": self.next_id("PVTF"), "__typename": typename, "name": name, "dataType": data_type}
+        if typename == "ProjectV2SingleSelectField":
+            field["options"] = [{"id": self.next_id("OPT"), "name": option} for option in options]
+        return field
+
+    def create_project(self, owner: str, title: str) -> dict[str, Any]:
+        number = len(self.projects) + 1
+        project = {
+            "id": self.next_id("PVT"),
+            "owner": owner,
+            "number": number,
+            "title": title,
+            "closed": False,
+            "public": False,
+            "shortDescription": "",
+            "readme": "",
+            "url": f"https://github.com/users/{owner}/projects/{number}",
+            "updatedAt": now_iso(),
+            "fields": [
+                self.new_field(field["__typename"], field["name"], field["dataType"], field.get("options", []))
+                for field in DEFAULT_PROJECT_FIELDS
+            ],
+            "items": [],
+            "repositories": set(),
+        }
+        self.projects.append(project)
+        return project
+
+    def graphql(self, query: str, variables: dict[str, Any]) -> dict[str, Any]:
+        first = self.page_size
+        if query.lstrip().startswith("mutation"):
+            return self.graphql_mutation(query, variables)
+        if "repository(owner: $owner, name: $name)" in query:
+            self.stats["graphql:repository"] += 1
+            repo = self.repo(variables["owner"], variables["name"])
+            result: dict[str, Any] = {"id": repo["id"]}
+            if variables.get("withLabels"):
+                labels = [
+                    {"name": label["name"], "color": label["color"], "description": label["description"]}
+                    for label in repo["labels"].values()
+                ]
+                result["labels"] = self.page(labels, variables.get("labelsAfter"), first)
+            if variables.get("withMilestones"):
+                milestones = [
+                    {
+                        "number": milestone["number"],
+                        "title": milestone["title"],
+                        "description": milestone["description"],
+                        "dueOn": milestone["due_on"],
+                        "state": milestone["state"].upper(),
+                    }
+                    for milestone in repo["milestones"].values()
+                ]
+                result["milestones"] = self.page(milestones, variables.get("milestonesAfter"), first)
+            if variables.get("withIssues"):
+                issues = sorted(repo["issues"].values(), key=lambda issue: issue["number"], reverse=True)
+                if variables.get("since"):
+                    issues = [issue for issue in issues if issue["updated_at"] >= variables["since"]]
+                if variables.get("labels"):
+                    issues = [issue for issue in issues if set(variables["labels"]) & set(issue["labels"])]
+                if variables.get("states"):
+                    issues = [issue for issue in issues if issue["state"].upper() in variables["states"]]
+                nodes = [self.graphql_issue(repo, issue) for issue in issues]
+                result["issues"] = self.page(nodes, variables.get("issuesAfter"), first)
+            return {"data": {"repository": result}}
+        if "projectsV2(first:100" in query:
+            self.stats["graphql:projects"] += 1
+            owner_kind = "organization" if "organization(login" in query else "user"
+            if owner_kind == "organization":
+                return {
+                    "data": {"organization": None},
+                    "errors": [{"message": f"Could not resolve to an Organization with the login of '{variables['login']}'."}],
+                }
+            projects = [self.graphql_project(project) for project in self.projects if project["owner"] == variables["login"]]
+            return {"data": {"user": {"projectsV2": self.page(projects, variables.get("after"), first)}}}
+        if "projectV2(number: $number)" in query:
+            self.stats["graphql:project"] += 1
+            project = next(
+                (
+                    project
+                    for project in self.projects
+                    if project["owner"] == variables["owner"] and project["number"] == variables["number"]
+                ),
+                None,
+            )
+            if project is None:
+                return {"data": {"repositoryOwner": {"projectV2": None}}}
+            result = {}
+            if variables.get("withFields"):
+                fields = [self.graphql_field(field) for field in project["fields"]]
+                result["fields"] = self.page(fields, variables.get("fieldsAfter"), first)
+            if variables.get("withItems"):
+                items = [self.graphql_item(project, item) for item in project["items"]]
+                result["items"] = self.page(items, variables.get("itemsAfter"), first)
+            return {"data": {"repositoryOwner": {"projectV2": result}}}
+        if "search(type: ISSUE" in query:
+            self.stats["graphql:search"] += 1
+            # Only the qualifiers the scripts send: repo:, is:issue, is:open/closed, [-]label:, in:body
+            # and OR-ed quoted terms.
+            match = SEARCH_REPO_PATTERN.search(variables["query"])
+            repo = self.repo(match.group(1), match.group(2)) if match else None
+            terms = SEARCH_TERM_PATTERN.findall(variables["query"])
+            labels = SEARCH_LABEL_PATTERN.findall(variables["query"])
+            state = SEARCH_STATE_PATTERN.search(variables["query"])
+            issues = sorted(repo["issues"].values(), key=lambda issue: issue["number"], reverse=True) if repo else []
+            nodes = [
+                self.graphql_issue(repo, issue)
+                for issue in issues
+                if (not terms or any(term in issue["body"] for term in terms))
+                and all((name in issue["labels"]) != bool(negated) for negated, name in labels)
+                and (state is None or issue["state"] == state.group(1))
+            ]
+            return {"data": {"search": self.page(nodes, variables.get("after"), first)}}
+        if "nodes(ids: $ids)" in query:
+            self.stats["graphql:nodes"] += 1
+            results = []
+            for node_id in variables["ids"]:
+                _, issue = self.find_issue(node_id)
+                items = [
+                    {**self.graphql_item(project, item), "project": {"id": project["id"]}}
+                    for project in self.projects
+                    for item in project["items"]
+                    if item["content_id"] == issue["node_id"]
+                ]
+                results.append({"projectItems": {"nodes": items}})
+            return {"data": {"nodes": results}}
+        if "repositoryOwner(login: $login)" in query:
+            return {"data": {"repositoryOwner": {"id": f"U_{variables['login']}"}}}
+        raise StandinError(400, "Unsupported GraphQL query for the stand-in server")
+
+    def graphql_mutation(self, query: str, variables: dict[str, Any]) -> dict[str, Any]:
+        data: dict[str, Any] = {}
+        errors: list[dict[str, Any]] = []
+        for alias, mutation, variable in MUTATION_PATTERN.findall(query):
+            alias = alias or mutation
+            self.stats[f"graphql:{mutation}"] += 1
+            try:
+                data[alias] = self.apply_mutation(mutation, variables[variable])
+            except StandinError as exc:
+                data[alias] = None
+                errors.append({"message": str(exc), "path": [alias]})
+        payload: dict[str, Any] = {"data": data}
+        if errors:
+            payload["errors"] = errors
+        return payload
+
+    def apply_mutation(self, mutation: str, payload: dict[str, Any]) -> dict[str, Any]:
+        if mutation == "createProjectV2":
+            owner = payload["ownerId"].removeprefix("U_")
+            return {"projectV2": self.graphql_project(self.create_project(owner, payload["title"]))}
+        if mutation == "linkProjectV2ToRepository":
+            project = self.find_project(payload["projectId"])
+            repo = self.find_repo(payload["repositoryId"])
+            project["repositories"].add(repo["id"])
+            return {"repository": {"id": repo["id"]}}
+        project = self.find_project(payload["projectId"]) if "projectId" in payload else None
+        if mutation == "updateProjectV2":
+            for key in ("title", "shortDescription", "readme", "public", "closed"):
+                if key in payload:
+                    project[key] = payload[key]
+            project["updatedAt"] = now_iso()
+            return {"projectV2": self.graphql_project(project)}
+        if mutation == "createProjectV2Field":
+            if any(field["name"] == payload["name"] for field in project["fields"]):
+                raise StandinError(422, f"Name has already been taken: {payload['name']}")
+            data_type = payload["dataType"]
+            typename = "ProjectV2SingleSelectField" if data_type == "SINGLE_SELECT" else "ProjectV2Field"
+            options = [option["name"] for option in payload.get("singleSelectOptions") or []]
+            field = self.new_field(typename, payload["name"], data_type, options)
+            project["fields"].append(field)
+            project["updatedAt"] = now_iso()
+            return {"projectV2Field": self.graphql_field(field)}
+        if mutation == "updateProjectV2Field":
+            for candidate in self.projects:
+                field = next((field for field in candidate["fields"] if field["id"] == payload["fieldId"]), None)
+                if field is None:
+                    continue
+                if "singleSelectOptions" in payload:
+                    # Like GitHub, options are replaced wholesale and receive new ids.
+                    field["options"] = [
+                        {"id": self.next_id("OPT"), "name": option["name"]} for option in payload["singleSelectOptions"]
+                    ]
+                candidate["updatedAt"] = now_iso()
+                return {"projectV2Field": self.graphql_field(field)}
+            raise StandinError(404, f"Could not resolve to a field with the global id of '{payload['fieldId']}'")
+        if mutation == "addProjectV2ItemById":
+            existing = next((item for item in project["items"] if item["content_id"] == payload["contentId"]), None)
+            if existing is None:
+                self.find_issue(payload["contentId"])
+                existing = {"id": self.next_id("PVTI"), "content_id": payload["contentId"], "values": {}}
+                project["items"].append(existing)
+                project["updatedAt"] = now_iso()
+            return {"item": {"id": existing["id"]}}
+        if mutation in {"updateProjectV2ItemFieldValue", "clearProjectV2ItemFieldValue"}:
+            item = next((item for item in project["items"] if item["id"] == payload["itemId"]), None)
+            if item is None:
+                raise StandinError(404, f"Could not resolve to a ProjectV2Item with the global id of '{payload['itemId']}'")
+            field = next((field for field in project["fields"] if field["id"] == payload["fieldId"]), None)
+            if field is None:
+                raise StandinError(404, f"Could not resolve to a field with the global id of '{payload['fieldId']}'")
+            if mutation == "clearProjectV2ItemFieldValue":
+                item["values"].pop(field["id"], None)
+            else:
+                value = payload["value"]
+                option_id = value.get("singleSelectOptionId")
+                if option_id and not any(option["id"] == option_id for option in field.get("options", [])):
+                    raise StandinError(422, f"The single select option Id does not belong to the field: {option_id}")
+                item["values"][field["id"]] = value
+            project["updatedAt"] = now_iso()
+            return {"projectV2Item": {"id": item["id"]}}
+        raise StandinError(400, f"Unsupported mutation for the stand-in server: {mutation}")
+
+
+class RateLimitWindow:
+    def __init__(self, limit: int | None, window: float) -> None:
+        self.limit = limit
+        self.window = window
+        self.lock = threading.Lock()
+        self.reset_at = time.time() + window
+        self.used = 0
+
+    def take(self) -> tuple[bool, dict[str, str]]:
+        if self.limit is None:
+            return True, {}
+        with self.lock:
+            now = time.time()
+            if now >= self.reset_at:
+                self.reset_at = now + self.window
+                self.used = 0
+            allowed = self.used < self.limit
+            if allowed:
+                self.used += 1
+            headers = {
+                "X-RateLimit-Limit": str(self.limit),
+                "X-RateLimit-Remaining": str(self.limit - self.used),
+                "X-RateLimit-Used": str(self.used),
+                "X-RateLimit-Reset": str(math.ceil(self.reset_at)),
+            }
+        return allowed, headers
+
+
+class StandinServer:
+    """Local GitHub stand-in serving the REST and GraphQL subset used by github_project_sync."""
+
+    def __init__(self, config: StandinConfig | None = None, *, host: str = "127.0.0.1", port: int = 0) -> None:
+        self.config = config or StandinConfig()
+        self.traffic: Counter[str] = Counter()
+        self.traffic_lock = threading.Lock()
+        self.rate_limit = RateLimitWindow(self.config.rate_limit, self.config.rate_window)
+        self.httpd = http.server.ThreadingHTTPServer((host, port), self.handler_class())
+        self.httpd.daemon_threads = True
+        self.url = f"http://{host}:{self.httpd.server_port}"
+        self.state = StandinState(self.url, page_size=self.config.max_page_size)
+        self.thread: threading.Thread | None = None
+
+    def handler_class(self) -> type[http.server.BaseHTTPRequestHandler]:
+        server = self
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self) -> None:
+                server.handle(self, "GET")
+
+            def do_POST(self) -> None:
+                server.handle(self, "POST")
+
+            def do_PATCH(self) -> None:
+                server.handle(self, "PATCH")
+
+            def log_message(self, *args: Any) -> None:
+                pass
+
+        return Handler
+
+    def count(self, **values: int) -> None:
+        with self.traffic_lock:
+            self.traffic.update(values)
+
+    def handle(self, handler: http.server.BaseHTTPRequestHandler, method: str) -> None:
+        length = int(handler.headers.get("Content-Length") or 0)
+        raw = handler.rfile.read(length) if length else b""
+        if self.config.latency:
+            time.sleep(self.config.latency)
+        parsed = urllib.parse.urlsplit(handler.path)
+        query = dict(urllib.parse.parse_qsl(parsed.query))
+        is_graphql = parsed.path == "/graphql"
+        self.count(requests=1, graphql=int(is_graphql), rest=int(not is_graphql), request_bytes=len(raw))
+        allowed, headers = self.rate_limit.take()
+        link = None
+        if not allowed:
+            self.count(rate_limited=1)
+            status, payload = 403, {"message": "API rate limit exceeded for user."}
+        else:
+            try:
+                body = json.loads(raw) if raw else None
+                with self.state.lock:
+                    if is_graphql:
+                        status, payload = 200, self.state.graphql(body["query"], body.get("variables") or {})
+                    else:
+                        status, payload = self.state.rest(method, parsed.path, query, body)
+                if method == "GET" and isinstance(payload, list):
+                    payload, link = self.paginate(parsed.path, query, payload)
+            except StandinError as exc:
+                status, payload = exc.status, {"message": str(exc)}
+        encoded = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.count(response_bytes=len(encoded))
+        handler.send_response(status)
+        handler.send_header("Content-Type", "application/json; charset=utf-8")
+        handler.send_header("Content-Length", str(len(encoded)))
+        for key, value in headers.items():
+            handler.send_header(key, value)
+        if link:
+            handler.send_header("Link", link)
+        handler.end_headers()
+        handler.wfile.write(encoded)
+
+    def paginate(self, path: str, query: dict[str, str], items: list[Any]) -> tuple[list[Any], str | None]:
+        per_page = min(int(query.get("per_page", 30)), self.config.max_page_size)
+        page = int(query.get("page", 1))
+        start = (page - 1) * per_page
+        if start + per_page >= len(items):
+            return items[start:], None
+        next_query = urllib.parse.urlencode({**query, "page": page + 1})
+        return items[start : start + per_page], f'<{self.url}{path}?{next_query}>; rel="next"'
+
+    def start(self) -> StandinServer:
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def environment(self, token: str = "standin-token") -> dict[str, str]:
+        return {
+            "GH_TOKEN": token,
+            "GITHUB_API_URL": self.url,
+            "GITHUB_GRAPHQL_URL": f"{self.url}/graphql",
+        }
+
+    def __enter__(self) -> StandinServer:
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Run a local GitHub stand-in for github_project_sync.")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Delay added to every response.")
+    parser.add_argument("--rate-limit", type=int, help="Requests allowed per rate-limit window.")
+    parser.add_argument("--rate-window", type=float, default=3600.0, help="Rate-limit window in seconds.")
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    config = StandinConfig(latency=args.latency_ms / 1000, rate_limit=args.rate_limit, rate_window=args.rate_window)
+    server = StandinServer(config, port=args.port)
+    print(f"GitHub stand-in listening on {server.url}")
+    for key, value in server.environment().items():
+        print(f"export {key}={value}")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
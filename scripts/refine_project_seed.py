@@ -2,8 +2,12 @@ from __future__ import annotations
 
 import datetime as dt
 import pathlib
+import sys
 
-import yaml
+if __package__ in {None, ""}:
+    sys.path.append(str(pathlib.Path(__file__).resolve().parents[1]))
+
+from scripts.seed_editor import edit_seed
 
 
 PHASE_LABEL_BY_ID = {
@@ -441,20 +445,16 @@ def build_win_conditions(seed: dict) -> list[dict]:
 
 
 def main() -> int:
-    seed_path = pathlib.Path("data/project-seed.yaml")
-    seed = yaml.safe_load(seed_path.read_text(encoding="utf-8"))
-
-    seed["meta"]["owner"] = "foru1215"
-    seed["meta"]["repo"] = "shared-auto-sync"
-
-    update_project_fields(seed)
-    for issue in seed["issues"]:
-        enrich_issue(issue)
-    seed["phase_cards"] = build_phase_cards(seed)
-    seed["win_conditions"] = build_win_conditions(seed)
-
-    rendered = yaml.safe_dump(seed, allow_unicode=True, sort_keys=False, width=120)
-    seed_path.write_text(rendered, encoding="utf-8")
+    with edit_seed(pathlib.Path("data/project-seed.yaml")) as editor:
+        seed = editor.data
+        seed["meta"]["owner"] = "foru1215"
+        seed["meta"]["repo"] = "shared-auto-sync"
+
+        update_project_fields(seed)
+        for issue in seed["issues"]:
+            enrich_issue(issue)
+        seed["phase_cards"] = build_phase_cards(seed)
+        seed["win_conditions"] = build_win_conditions(seed)
     return 0
 
 
@@ -0,0 +1,540 @@
+from __future__ import annotations
+
+import os
+import pathlib
+import re
+import tempfile
+from dataclasses import dataclass
+from collections.abc import Mapping
+from typing import Any
+
+import yaml
+
+from scripts.seed_loader import (
+    ENTITY_SHARD_SECTIONS,
+    MANIFEST_VERSION,
+    SEED_MANIFEST,
+    SHARD_NAME_PATTERN,
+    SafeLoader,
+    SeedShardError,
+    entity_shard_path,
+    read_manifest,
+    sha256_hex,
+)
+
+
+class SeedEditError(ValueError):
+    """A seed edit could not be written back safely."""
+
+
+MISSING = object()
+ANCHOR_PATTERN = re.compile(r"&([^\s,\[\]{}]+)")
+
+
+@dataclass(frozen=True)
+class Patch:
+    """Replace lines [start, end) of the text as read; start == end inserts before `start`."""
+
+    start: int
+    end: int
+    lines: tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class AliasSite:
+    """A mapping entry whose value is an alias, e.g. `dod: *id008` under an issue."""
+
+    path: tuple[Any, ...]
+    anchor_path: tuple[Any, ...]
+    anchor: yaml.Node
+    key: yaml.Node
+    name: Any
+
+
+def render_block(value: Any, *, indent: int, prefix: str | None = None) -> tuple[str, ...]:
+    """Dump `value` the way the seed scripts always have, indented by `indent` columns."""
+    rendered = yaml.safe_dump(value, allow_unicode=True, sort_keys=False, width=120).splitlines(keepends=True)
+    padding = " " * indent
+    lines = [padding + line if line.strip() else line for line in rendered]
+    if prefix is not None and lines:
+        lines[0] = prefix + lines[0][indent:]
+    return tuple(lines)
+
+
+def is_alias(node: yaml.Node, site: yaml.Mark) -> bool:
+    """True when `node` was composed from an alias: its marks point back at the anchor, before `site`."""
+    return (node.start_mark.line, node.start_mark.column) < (site.line, site.column)
+
+
+def resolve(data: Any, path: tuple[Any, ...]) -> Any:
+    """Follow a path of mapping keys, list positions and entity ids; MISSING if it no longer exists."""
+    for step in path:
+        if isinstance(data, dict):
+            data = data.get(step, MISSING)
+        elif isinstance(data, list) and isinstance(step, int):
+            data = data[step] if step < len(data) else MISSING
+        elif isinstance(data, list):
+            data = next((item for item in data if isinstance(item, dict) and item.get("id") == step), MISSING)
+        else:
+            return MISSING
+        if data is MISSING:
+            return MISSING
+    return data
+
+
+def is_block(node: yaml.Node, kind: type[yaml.Node]) -> bool:
+    return isinstance(node, kind) and not node.flow_style
+
+
+def entity_ids(items: Any) -> list[str] | None:
+    """Ids of a list of id-keyed mappings (issues, epics, ...); None for any other value."""
+    if not isinstance(items, list) or not items:
+        return None
+    if not all(isinstance(item, dict) and isinstance(item.get("id"), str) for item in items):
+        return None
+    ids = [item["id"] for item in items]
+    return ids if len(set(ids)) == len(ids) else None
+
+
+def entity_index(seed: Any) -> dict[str, tuple[str, int]]:
+    """Entity id -> (section, position) for the top-level id-keyed lists."""
+    index: dict[str, tuple[str, int]] = {}
+    if isinstance(seed, Mapping):
+        for section, items in seed.items():
+            for position, entity_id in enumerate(entity_ids(items) or []):
+                index.setdefault(entity_id, (section, position))
+    return index
+
+
+def write_atomic(path: pathlib.Path, text: str) -> None:
+    handle, temp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(handle, "w", encoding="utf-8", newline="") as temp_file:
+            temp_file.write(text)
+            temp_file.flush()
+            os.fsync(temp_file.fileno())
+        os.replace(temp_name, path)
+    except BaseException:
+        pathlib.Path(temp_name).unlink(missing_ok=True)
+        raise
+
+
+def compose_seed(text: str) -> tuple[yaml.Node, Any, Any]:
+    """Parse once into the node tree plus two independent constructed copies of the seed."""
+    loader = SafeLoader(text)
+    try:
+        root = loader.get_single_node()
+        if root is None:
+            raise SeedEditError("the seed file is empty")
+        # construct_document forgets what it built, so the second call returns a fresh copy.
+        return root, loader.construct_document(root), loader.construct_document(root)
+    finally:
+        loader.dispose()
+
+
+class SeedEditor:
+    """Round-trip editor for the seed file: one read, targeted line patches, one atomic write."""
+
+    def __init__(self, path: pathlib.Path, text: str, stat: os.stat_result) -> None:
+        self.path = path
+        self.load(text, stat)
+
+    @classmethod
+    def open(cls, path: pathlib.Path | str) -> SeedEditor:
+        path = pathlib.Path(path)
+        return cls(path, path.read_bytes().decode("utf-8"), path.stat())
+
+    def load(self, text: str, stat: os.stat_result, composed: tuple[yaml.Node, Any, Any] | None = None) -> None:
+        self.text = text
+        self.lines = text.splitlines(keepends=True)
+        self.root, self.original, self.data = composed or compose_seed(text)
+        self.signature = (stat.st_mtime_ns, stat.st_size)
+        self.index = entity_index(self.original)
+
+    def __enter__(self) -> SeedEditor:
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        if exc_type is None:
+            self.commit()
+
+    def entity(self, entity_id: str) -> dict[str, Any]:
+        section, position = self.index[entity_id]
+        return self.data[section][position]
+
+    def entity_span(self, entity_id: str) -> tuple[int, int]:
+        """Line range [start, end) of an entity in the file as read."""
+        section, position = self.index[entity_id]
+        sequence = next(value for key, value in self.root.value if key.value == section)
+        item = sequence.value[position]
+        return item.start_mark.line, self.end_line(item)
+
+    def end_line(self, node: yaml.Node) -> int:
+        """Exclusive end line of `node`; trailing blank and comment lines stay with what follows."""
+        mark = node.end_mark
+        if mark.line >= len(self.lines):
+            end = len(self.lines)
+        elif self.lines[mark.line][: mark.column].strip():
+            end = mark.line + 1
+        else:
+            end = mark.line
+        while end > node.start_mark.line + 1 and self.lines[end - 1].strip()[:1] in {"", "#"}:
+            end -= 1
+        return end
+
+    def entry_end(self, key: yaml.Node, value: yaml.Node) -> int:
+        # An alias (`key: *id003`) is one line; its node's marks point at the anchor instead.
+        return key.start_mark.line + 1 if is_alias(value, key.end_mark) else self.end_line(value)
+
+    def anchor_name(self, node: yaml.Node) -> str | None:
+        match = ANCHOR_PATTERN.match(self.lines[node.start_mark.line], node.start_mark.column)
+        return match.group(1) if match else None
+
+    def replace_entry(self, key: yaml.Node, value: yaml.Node, name: Any, new: Any) -> Patch:
+        line = self.lines[key.start_mark.line]
+        rendered = list(render_block({name: new}, indent=key.start_mark.column, prefix=line[: key.start_mark.column]))
+        anchor = self.anchor_name(value)
+        if anchor:
+            # Keep the anchor so aliases of an unchanged value still resolve; mismatches are fixed in patches().
+            head, _, tail = rendered[0].partition(":")
+            rendered[0] = f"{head}: &{anchor}{tail}"
+        end = self.end_line(value)
+        if isinstance(value, yaml.ScalarNode) and value.end_mark.line == end - 1:
+            # Keep a trailing comment on the replaced scalar's line.
+            comment = self.lines[end - 1][value.end_mark.column :]
+            if comment.strip().startswith("#"):
+                rendered[-1] = rendered[-1].rstrip("\n") + comment
+        return Patch(key.start_mark.line, end, tuple(rendered))
+
+    def diff_value(self, node: yaml.Node, old: Any, new: Any, patches: list[Patch]) -> bool:
+        """Append patches turning `old` into `new` inside `node`; False if `node` must be re-rendered whole."""
+        if isinstance(old, dict) and isinstance(new, dict) and is_block(node, yaml.MappingNode):
+            return self.diff_mapping(node, old, new, patches)
+        if isinstance(old, list) and isinstance(new, list) and is_block(node, yaml.SequenceNode):
+            return self.diff_sequence(node, old, new, patches)
+        return False
+
+    def diff_mapping(self, node: yaml.MappingNode, old: dict, new: dict, patches: list[Patch]) -> bool:
+        if len(node.value) != len(old) or not new:
+            # Merge keys or duplicates do not line up with the data; an emptied mapping becomes `{}`.
+            return False
+        kept = [name for name in new if name in old]
+        if kept != [name for name in old if name in new]:
+            return False
+        entries = dict(zip(old, node.value))
+        first_line = node.value[0][0].start_mark.line
+        column = node.value[0][0].start_mark.column
+        # Removing or inserting before the first key would have to move a sequence dash.
+        leads_item = bool(self.lines[first_line][:column].strip())
+        if leads_item and (not kept or kept[0] != next(iter(old)) or next(iter(new)) != kept[0]):
+            return False
+
+        inserts: dict[Any, dict[Any, Any]] = {}
+        anchor = None
+        for name, value in new.items():
+            if name in old:
+                anchor = name
+                continue
+            inserts.setdefault(anchor, {})[name] = value
+        for anchor, added in inserts.items():
+            at = first_line if anchor is None else self.entry_end(*entries[anchor])
+            patches.append(Patch(at, at, render_block(added, indent=column)))
+        for name, (key, value) in entries.items():
+            if name not in new:
+                patches.append(Patch(key.start_mark.line, self.entry_end(key, value), ()))
+            elif is_alias(value, key.end_mark) or old[name] == new[name]:
+                continue  # aliases are reconciled against their anchor in patches()
+            elif not self.diff_value(value, old[name], new[name], patches):
+                patches.append(self.replace_entry(key, value, name, new[name]))
+        return True
+
+    def diff_sequence(self, node: yaml.SequenceNode, old: list, new: list, patches: list[Patch]) -> bool:
+        if not new:
+            return False  # an emptied list is rendered as `[]` by the caller
+        column = node.start_mark.column
+        boundary = node.start_mark
+        for item in node.value:
+            line = self.lines[item.start_mark.line]
+            if is_alias(item, boundary) or line[column : column + 1] != "-" or line[:column].strip():
+                return False
+            boundary = item.end_mark
+        starts = [item.start_mark.line for item in node.value]
+        old_ids, new_ids = entity_ids(old), entity_ids(new)
+        if old_ids is None or new_ids is None:
+            # Plain lists line up by position: equal lengths edit in place, longer ones append.
+            old_ids, new_ids = list(range(len(old))), list(range(len(new)))
+        new_set, old_set = set(new_ids), set(old_ids)
+        if [key for key in new_ids if key in old_set] != [key for key in old_ids if key in new_set]:
+            return False
+        items = dict(zip(old_ids, zip(node.value, old)))
+        new_items = dict(zip(new_ids, new))
+
+        inserts: dict[Any, list[Any]] = {}
+        anchor = None
+        for key in new_ids:
+            if key in old_set:
+                anchor = key
+                continue
+            inserts.setdefault(anchor, []).append(new_items[key])
+        for anchor, added in inserts.items():
+            at = starts[0] if anchor is None else self.end_line(items[anchor][0])
+            patches.append(Patch(at, at, render_block(added, indent=column)))
+        for key, (item, value) in items.items():
+            start = item.start_mark.line
+            if key not in new_set:
+                patches.append(Patch(start, self.end_line(item), ()))
+            elif value != new_items[key] and not self.diff_value(item, value, new_items[key], patches):
+                patches.append(Patch(start, self.end_line(item), render_block([new_items[key]], indent=column)))
+        return True
+
+    def alias_sites(self) -> list[AliasSite]:
+        """Every `key: *anchor` in the document as read, with the paths of the alias and its anchor."""
+        anchors: dict[int, tuple[tuple[Any, ...], yaml.Node]] = {}
+        sites: list[AliasSite] = []
+
+        def visit(node: yaml.Node, value: Any, path: tuple[Any, ...]) -> None:
+            if isinstance(node, yaml.MappingNode) and isinstance(value, dict) and len(node.value) == len(value):
+                for name, (key, child) in zip(value, node.value):
+                    if id(child) in anchors:
+                        anchor_path, anchor_node = anchors[id(child)]
+                        sites.append(AliasSite(path + (name,), anchor_path, anchor_node, key, name))
+                    else:
+                        anchors[id(child)] = (path + (name,), child)
+                        visit(child, value[name], path + (name,))
+            elif isinstance(node, yaml.SequenceNode) and isinstance(value, list):
+                ids = entity_ids(value) or range(len(value))
+                for step, child, item in zip(ids, node.value, value):
+                    # Aliased sequence items are rare enough to leave to the round-trip check in commit().
+                    if id(child) not in anchors:
+                        anchors[id(child)] = (path + (step,), child)
+                        visit(child, item, path + (step,))
+
+        visit(self.root, self.original, ())
+        return sites
+
+    def patches(self) -> list[Patch]:
+        patches: list[Patch] = []
+        if not self.diff_value(self.root, self.original, self.data, patches):
+            return [Patch(0, len(self.lines), render_block(self.data, indent=0))]
+
+        def covering(line: int) -> Patch | None:
+            return next((patch for patch in patches if patch.start <= line < patch.end), None)
+
+        for site in self.alias_sites():
+            line = site.key.start_mark.line
+            value = resolve(self.data, site.path)
+            if covering(line) or value is MISSING:
+                continue  # re-rendered or removed together with its parent
+            anchor_line = site.anchor.start_mark.line
+            rewritten = covering(anchor_line)
+            name = self.anchor_name(site.anchor)
+            lost = rewritten is not None and not any(f"&{name}" in text for text in rewritten.lines)
+            if lost or resolve(self.data, site.anchor_path) != value:
+                column = site.key.start_mark.column
+                rendered = render_block({site.name: value}, indent=column, prefix=self.lines[line][:column])
+                patches.append(Patch(line, line + 1, rendered))
+        # Inserts sort ahead of a replacement starting on the same line; ties keep diff order.
+        return sorted(patches, key=lambda patch: (patch.start, patch.end))
+
+    def render(self) -> str:
+        out: list[str] = []
+        position = 0
+        for patch in self.patches():
+            if patch.start < position:
+                raise SeedEditError(f"overlapping seed patches at line {patch.start + 1}")
+            out.extend(self.lines[position : patch.start])
+            out.extend(patch.lines)
+            position = max(position, patch.end)
+        out.extend(self.lines[position:])
+        return "".join(out)
+
+    def prepare(self) -> tuple[str, tuple[yaml.Node, Any, Any]] | None:
+        """Render and check the edit without writing it; None when there is nothing to write."""
+        if self.data == self.original:
+            return None
+        text = self.render()
+        try:
+            composed = compose_seed(text)
+        except yaml.YAMLError as exc:
+            raise SeedEditError(f"patched {self.path} is not valid YAML: {exc}") from exc
+        if composed[1] != self.data:
+            raise SeedEditError(f"patched {self.path} would not read back as the edited seed")
+        stat = self.path.stat()
+        if (stat.st_mtime_ns, stat.st_size) != self.signature:
+            raise SeedEditError(f"{self.path} changed on disk after it was read")
+        return text, composed
+
+    def write(self, text: str, composed: tuple[yaml.Node, Any, Any]) -> None:
+        write_atomic(self.path, text)
+        self.load(text, self.path.stat(), composed)
+
+    def commit(self) -> bool:
+        """Atomically write the edited seed; returns False when there was nothing to write."""
+        prepared = self.prepare()
+        if prepared is None:
+            return False
+        self.write(*prepared)
+        return True
+
+
+def render_document(value: Any) -> str:
+    return "".join(render_block(value, indent=0))
+
+
+def shard_layout(seed: Mapping[str, Any]) -> tuple[list[dict[str, Any]], dict[str, Any]]:
+    """Manifest sections (without hashes) and the document of every shard path for `seed`."""
+    sections: list[dict[str, Any]] = []
+    documents: dict[str, Any] = {}
+    for section, value in seed.items():
+        if not isinstance(section, str) or not SHARD_NAME_PATTERN.match(section):
+            raise SeedShardError(f"seed section {section!r} cannot be used as a shard path")
+        if section in ENTITY_SHARD_SECTIONS and entity_ids(value) is not None:
+            shards = []
+            for item in value:
+                path = entity_shard_path(section, item)
+                shards.append({"id": item["id"], "phase": item.get("phase") or None, "path": path})
+                documents[path] = item
+            sections.append({"name": section, "shards": shards})
+        else:
+            path = f"{section}.yaml"
+            sections.append({"name": section, "path": path})
+            documents[path] = {section: value}
+    return sections, documents
+
+
+def build_manifest(sections: list[dict[str, Any]], hashes: dict[str, str]) -> dict[str, Any]:
+    for entry in sections:
+        for shard in entry.get("shards", [entry]):
+            shard["sha256"] = hashes[shard["path"]]
+    return {"version": MANIFEST_VERSION, "sections": sections}
+
+
+def manifest_hashes(manifest: dict[str, Any]) -> dict[str, str]:
+    return {
+        shard["path"]: shard["sha256"]
+        for entry in manifest.get("sections", [])
+        for shard in entry.get("shards", [entry])
+    }
+
+
+def write_sharded_seed(seed: Mapping[str, Any], root: pathlib.Path) -> dict[str, Any]:
+    """Write `seed` as a sharded directory; the manifest goes last so a partial write never validates."""
+    sections, documents = shard_layout(seed)
+    hashes: dict[str, str] = {}
+    for path, document in documents.items():
+        text = render_document(document)
+        target = root / path
+        target.parent.mkdir(parents=True, exist_ok=True)
+        write_atomic(target, text)
+        hashes[path] = sha256_hex(text.encode("utf-8"))
+    manifest = build_manifest(sections, hashes)
+    write_atomic(root / SEED_MANIFEST, render_document(manifest))
+    return manifest
+
+
+def rehash_shards(root: pathlib.Path) -> list[str]:
+    """Refresh the manifest hashes after shards were edited by hand; returns the refreshed paths."""
+    manifest = read_manifest(root)
+    refreshed: list[str] = []
+    for entry in manifest["sections"]:
+        for shard in entry.get("shards", [entry]):
+            digest = sha256_hex((root / shard["path"]).read_bytes())
+            if digest != shard["sha256"]:
+                shard["sha256"] = digest
+                refreshed.append(shard["path"])
+    if refreshed:
+        write_atomic(root / SEED_MANIFEST, render_document(manifest))
+    return refreshed
+
+
+class ShardedSeedEditor:
+    """`SeedEditor` for a sharded seed directory: one read per shard, one atomic write per changed shard."""
+
+    def __init__(self, root: pathlib.Path, manifest: dict[str, Any], editors: dict[str, SeedEditor]) -> None:
+        self.root = root
+        self.manifest = manifest
+        self.editors = editors
+        self.data: dict[str, Any] = {}
+        for entry in manifest["sections"]:
+            if "shards" in entry:
+                self.data[entry["name"]] = [editors[shard["path"]].data for shard in entry["shards"]]
+            else:
+                self.data[entry["name"]] = editors[entry["path"]].data[entry["name"]]
+        self.index = entity_index(self.data)
+        stat = (root / SEED_MANIFEST).stat()
+        self.signature = (stat.st_mtime_ns, stat.st_size)
+
+    @classmethod
+    def open(cls, root: pathlib.Path | str) -> ShardedSeedEditor:
+        root = pathlib.Path(root)
+        manifest = read_manifest(root)
+        editors: dict[str, SeedEditor] = {}
+        for path, digest in manifest_hashes(manifest).items():
+            editor = editors[path] = SeedEditor.open(root / path)
+            if sha256_hex(editor.text.encode("utf-8")) != digest:
+                raise SeedShardError(f"{root / path} does not match {SEED_MANIFEST}")
+        return cls(root, manifest, editors)
+
+    def __enter__(self) -> ShardedSeedEditor:
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        if exc_type is None:
+            self.commit()
+
+    def entity(self, entity_id: str) -> dict[str, Any]:
+        section, position = self.index[entity_id]
+        return self.data[section][position]
+
+    def commit(self) -> bool:
+        sections, documents = shard_layout(self.data)
+        hashes = manifest_hashes(self.manifest)
+        prepared: dict[str, tuple[str, tuple[yaml.Node, Any, Any]] | None] = {}
+        for path, document in documents.items():
+            editor = self.editors.get(path)
+            if editor is None:
+                prepared[path] = None
+                continue
+            editor.data = document
+            result = editor.prepare()
+            if result is not None:
+                prepared[path] = result
+        removed = [path for path in self.editors if path not in documents]
+        manifest = build_manifest(sections, {path: hashes.get(path, "") for path in documents})
+        if not prepared and not removed and manifest == self.manifest:
+            return False
+        stat = (self.root / SEED_MANIFEST).stat()
+        if (stat.st_mtime_ns, stat.st_size) != self.signature:
+            raise SeedEditError(f"{self.root / SEED_MANIFEST} changed on disk after it was read")
+
+        for path, result in prepared.items():
+            target = self.root / path
+            if result is None:
+                text = render_document(documents[path])
+                target.parent.mkdir(parents=True, exist_ok=True)
+                write_atomic(target, text)
+                self.editors[path] = SeedEditor.open(target)
+            else:
+                text = result[0]
+                self.editors[path].write(*result)
+            hashes[path] = sha256_hex(text.encode("utf-8"))
+        manifest = build_manifest(sections, hashes)
+        write_atomic(self.root / SEED_MANIFEST, render_document(manifest))
+        for path in removed:
+            (self.root / path).unlink(missing_ok=True)
+            del self.editors[path]
+            parent = (self.root / path).parent
+            while parent != self.root and not any(parent.iterdir()):
+                parent.rmdir()
+                parent = parent.parent
+        self.manifest = manifest
+        self.index = entity_index(self.data)
+        stat = (self.root / SEED_MANIFEST).stat()
+        self.signature = (stat.st_mtime_ns, stat.st_size)
+        return True
+
+
+def edit_seed(path: pathlib.Path | str) -> SeedEditor | ShardedSeedEditor:
+    """Open the seed at `path` for editing, whether it is a single file or a sharded directory."""
+    path = pathlib.Path(path)
+    return ShardedSeedEditor.open(path) if path.is_dir() else SeedEditor.open(path)
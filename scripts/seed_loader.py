@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+import hashlib
+import pathlib
+import pickle
+import re
+from collections.abc import Callable, Iterator, Mapping
+from typing import Any
+
+import yaml
+
+
+SEED_CACHE_DIR = pathlib.Path(".cache/seed")
+SNAPSHOT_VERSION = 1
+# libyaml is 5-10x faster than the pure-Python scanner; fall back when PyYAML was built without it.
+SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+# A sharded seed is a directory: this manifest lists every shard with its SHA-256.
+SEED_MANIFEST = "manifest.yaml"
+MANIFEST_VERSION = 1
+# Id-keyed lists stored as one shard per entity under <section>/<phase>/<id>.yaml.
+ENTITY_SHARD_SECTIONS = ("issues", "phase_cards", "win_conditions")
+UNPHASED_DIR = "unphased"
+SHARD_NAME_PATTERN = re.compile(r"^[A-Za-z0-9][A-Za-z0-9._-]*$")
+
+
+class SeedShardError(ValueError):
+    """A sharded seed directory is inconsistent with its manifest."""
+
+
+# What load_seed can raise for a missing, unreadable or half-written seed file or directory.
+SEED_LOAD_ERRORS = (OSError, yaml.YAMLError, SeedShardError)
+
+
+def parse_seed_text(text: str | bytes) -> Any:
+    return yaml.load(text, Loader=SafeLoader)
+
+
+def snapshot_path(cache_dir: pathlib.Path, seed_path: pathlib.Path, raw: bytes) -> pathlib.Path:
+    source_key = hashlib.sha256(str(seed_path.resolve()).encode("utf-8")).hexdigest()[:16]
+    content_key = hashlib.sha256(raw).hexdigest()
+    return cache_dir / f"{source_key}-{content_key}-v{SNAPSHOT_VERSION}.pickle"
+
+
+def cached_parse(
+    cache_dir: pathlib.Path | None, source: pathlib.Path, raw: bytes, parse: Callable[[], Any]
+) -> Any:
+    """Return `parse()`, reusing a pickled snapshot keyed by `source` and the SHA-256 of `raw`."""
+    if cache_dir is None:
+        return parse()
+    cached = snapshot_path(cache_dir, source, raw)
+    if cached.exists():
+        try:
+            return pickle.loads(cached.read_bytes())
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ValueError):
+            pass
+    value = parse()
+    try:
+        cached.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = cached.with_suffix(".tmp")
+        temp_path.write_bytes(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+        temp_path.replace(cached)
+        # Snapshots of earlier revisions of the same source are never read again.
+        for stale in cached.parent.glob(f"{cached.name.split('-', 1)[0]}-*.pickle"):
+            if stale != cached:
+                stale.unlink(missing_ok=True)
+    except OSError:
+        pass
+    return value
+
+
+def sha256_hex(raw: bytes) -> str:
+    return hashlib.sha256(raw).hexdigest()
+
+
+def seed_source(seed_path: pathlib.Path) -> pathlib.Path:
+    """The file whose bytes change whenever the seed does: the seed itself or a sharded seed's manifest."""
+    return seed_path / SEED_MANIFEST if seed_path.is_dir() else seed_path
+
+
+def seed_digest(seed_path: pathlib.Path) -> str:
+    # The manifest carries every shard's hash, so hashing it covers the whole sharded seed.
+    return sha256_hex(seed_source(seed_path).read_bytes())
+
+
+def entity_shard_path(section: str, item: dict[str, Any]) -> str:
+    phase = item.get("phase") or UNPHASED_DIR
+    for part in (phase, item["id"]):
+        if not isinstance(part, str) or not SHARD_NAME_PATTERN.match(part):
+            raise SeedShardError(f"{section} entry {item['id']!r} cannot be used as a shard path ({part!r})")
+    return f"{section}/{phase}/{item['id']}.yaml"
+
+
+def read_manifest(root: pathlib.Path) -> dict[str, Any]:
+    manifest = parse_seed_text((root / SEED_MANIFEST).read_bytes())
+    if not isinstance(manifest, dict) or manifest.get("version") != MANIFEST_VERSION:
+        raise SeedShardError(f"{root / SEED_MANIFEST} is not a version {MANIFEST_VERSION} seed manifest")
+    return manifest
+
+
+class ShardedSeed(Mapping):
+    """Read-only view of a sharded seed directory that parses shards on first access."""
+
+    def __init__(
+        self, root: pathlib.Path, manifest: dict[str, Any], *, cache_dir: pathlib.Path | None = None
+    ) -> None:
+        self.root = root
+        self.manifest = manifest
+        self.cache_dir = cache_dir
+        self.sections = {entry["name"]: entry for entry in manifest.get("sections", [])}
+        self.entity_shards = {
+            shard["id"]: shard for entry in self.sections.values() for shard in entry.get("shards", [])
+        }
+        self.loaded: dict[str, Any] = {}
+        self.shards: dict[str, Any] = {}
+
+    @classmethod
+    def open(cls, root: pathlib.Path, *, cache_dir: pathlib.Path | None = None) -> ShardedSeed:
+        return cls(root, read_manifest(root), cache_dir=cache_dir)
+
+    def __getitem__(self, section: str) -> Any:
+        if section not in self.loaded:
+            entry = self.sections[section]
+            if "shards" in entry:
+                self.loaded[section] = self.load_section(section, entry["shards"])
+            else:
+                self.loaded[section] = self.load_shard(entry)[section]
+        return self.loaded[section]
+
+    def __contains__(self, section: object) -> bool:
+        return section in self.sections
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.sections)
+
+    def __len__(self) -> int:
+        return len(self.sections)
+
+    def read_shard(self, shard: dict[str, Any]) -> bytes:
+        path = self.root / shard["path"]
+        raw = path.read_bytes()
+        if sha256_hex(raw) != shard["sha256"]:
+            raise SeedShardError(
+                f"{path} does not match {SEED_MANIFEST}; refresh it with `python -m scripts.shard_seed --rehash`"
+            )
+        return raw
+
+    def load_shard(self, shard: dict[str, Any]) -> Any:
+        if shard["path"] not in self.shards:
+            self.shards[shard["path"]] = parse_seed_text(self.read_shard(shard))
+        return self.shards[shard["path"]]
+
+    def load_section(self, section: str, shards: list[dict[str, Any]]) -> list[Any]:
+        if self.cache_dir is None or any(shard["path"] in self.shards for shard in shards):
+            return [self.load_shard(shard) for shard in shards]
+        raws = [self.read_shard(shard) for shard in shards]
+        # Paths are part of the key so that reordering or renaming shards re-parses.
+        key = b"".join(shard["path"].encode("utf-8") + b"\0" + raw + b"\0" for shard, raw in zip(shards, raws))
+        values = cached_parse(self.cache_dir, self.root / section, key, lambda: [parse_seed_text(raw) for raw in raws])
+        self.shards.update((shard["path"], value) for shard, value in zip(shards, values))
+        return values
+
+    def entity_ids(self, section: str) -> list[str]:
+        return [shard["id"] for shard in self.sections[section].get("shards", [])]
+
+    def entity(self, entity_id: str) -> dict[str, Any]:
+        """One sharded entity, parsing only its own shard."""
+        return self.load_shard(self.entity_shards[entity_id])
+
+    def phase_entities(self, section: str, phase: str | None) -> list[dict[str, Any]]:
+        shards = self.sections[section].get("shards", [])
+        return [self.load_shard(shard) for shard in shards if shard.get("phase") == (phase or None)]
+
+    def to_dict(self) -> dict[str, Any]:
+        return {section: self[section] for section in self.sections}
+
+
+def load_seed(
+    seed_path: pathlib.Path, *, cache_dir: pathlib.Path | None = SEED_CACHE_DIR, lazy: bool = True
+) -> Any:
+    """Parse a seed file, reusing a pickled snapshot while the file content is unchanged."""
+    if seed_path.is_dir():
+        seed = ShardedSeed.open(seed_path, cache_dir=cache_dir)
+        return seed if lazy else seed.to_dict()
+    raw = seed_path.read_bytes()
+    return cached_parse(cache_dir, seed_path, raw, lambda: parse_seed_text(raw))
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import argparse
+import pathlib
+import sys
+
+if __package__ in {None, ""}:
+    sys.path.append(str(pathlib.Path(__file__).resolve().parents[1]))
+
+from scripts.seed_editor import rehash_shards, write_sharded_seed
+from scripts.seed_loader import SEED_MANIFEST, load_seed
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Split a single-file seed into a sharded seed directory.")
+    parser.add_argument("--seed-path", default="data/project-seed.yaml", help="Single-file seed to convert.")
+    parser.add_argument("--out", default="data/seed", help="Directory to write the shards and manifest to.")
+    parser.add_argument(
+        "--rehash",
+        metavar="DIR",
+        help="Instead of converting, refresh the manifest hashes of a sharded seed after hand edits.",
+    )
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    if args.rehash:
+        refreshed = rehash_shards(pathlib.Path(args.rehash))
+        for path in refreshed:
+            print(f"Refreshed {path}")
+        print(f"{len(refreshed)} shard hash(es) refreshed in {pathlib.Path(args.rehash) / SEED_MANIFEST}")
+        return 0
+
+    seed_path = pathlib.Path(args.seed_path)
+    out = pathlib.Path(args.out)
+    if seed_path.is_dir():
+        print(f"{seed_path} is already a sharded seed", file=sys.stderr)
+        return 1
+    if out.exists() and any(out.iterdir()):
+        print(f"{out} is not empty; refusing to overwrite it", file=sys.stderr)
+        return 1
+    seed = load_seed(seed_path, cache_dir=None)
+    manifest = write_sharded_seed(seed, out)
+    if load_seed(out, lazy=False) != seed:
+        print(f"{out} does not read back as {seed_path}", file=sys.stderr)
+        return 1
+    shard_count = sum(len(entry.get("shards", [entry])) for entry in manifest["sections"])
+    print(f"Wrote {shard_count} shards for {len(manifest['sections'])} sections to {out}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -4,8 +4,13 @@
 Time blocks:
   朝 (6-7時 60分) / 昼 (30分) / 夕 (帰宅後 2h)
 """
+import pathlib
 import sys
-import yaml
+
+if __package__ in {None, ""}:
+    sys.path.append(str(pathlib.Path(__file__).resolve().parents[1]))
+
+from scripts.seed_editor import edit_seed
 
 SEED_PATH = 'data/project-seed.yaml'
 
@@ -118,84 +123,30 @@ def get_template(issue_id: str, task_type: str, energy: str) -> list:
     # fallback
     return TEMPLATES['study_medium']
 
-def format_de_lines(items: list) -> list:
-    """Convert a list of strings to YAML list lines with 2-space indent."""
-    result = []
-    for item in items:
-        # Quote if item contains special characters that need quoting
-        # Always use single-quoted style for consistency
-        result.append(f"  - '{item}'\n")
-    return result
-
-def replace_daily_execution(lines: list, start_idx: int, new_items: list) -> list:
-    """Replace the daily_execution block starting at start_idx.
-    start_idx points to the '  daily_execution:' line.
-    Returns updated lines list."""
-    # Find the end of the daily_execution block (first non-'  - ' line after it)
-    i = start_idx + 1
-    while i < len(lines) and lines[i].startswith('  - '):
-        i += 1
-    # Replace lines[start_idx+1 : i] with new items
-    new_de_lines = format_de_lines(new_items)
-    return lines[:start_idx + 1] + new_de_lines + lines[i:]
-
 # ---------------------------------------------------------------------------
 # Main
 # ---------------------------------------------------------------------------
-with open(SEED_PATH, encoding='utf-8') as f:
-    lines = f.readlines()
-
-# Load YAML to get task_type and energy for each issue
-seed = yaml.safe_load(open(SEED_PATH, encoding='utf-8'))
-issue_meta = {}
-for iss in seed['issues']:
-    if not iss['id'].startswith('ISS-R'):
-        issue_meta[iss['id']] = {
-            'task_type': iss.get('task_type', 'study'),
-            'energy': iss.get('energy', 'Medium'),
-        }
-
-print(f"Total non-recurring issues to update: {len(issue_meta)}")
-
-# Process issues — iterate and do replacements one by one
-# We must re-scan after each replacement because line indices shift
-updated = list(lines)
-total_replaced = 0
-
-for issue_id, meta in issue_meta.items():
-    task_type = meta['task_type']
-    energy = meta['energy']
-    new_items = get_template(issue_id, task_type, energy)
-
-    # Find issue block and its daily_execution line
-    in_issue = False
-    de_line_idx = None
-    for i, line in enumerate(updated):
-        if line.strip() == f'- id: {issue_id}':
-            in_issue = True
-        elif line.strip().startswith('- id: ISS') and issue_id not in line and in_issue:
-            in_issue = False
-            break
-        if in_issue and line.strip() == 'daily_execution:':
-            de_line_idx = i
-            break
-
-    if de_line_idx is None:
-        print(f"  WARNING: daily_execution not found for {issue_id}")
-        continue
-
-    updated = replace_daily_execution(updated, de_line_idx, new_items)
-    total_replaced += 1
-
-print(f"Replaced daily_execution for {total_replaced} issues")
-
-with open(SEED_PATH, 'w', encoding='utf-8') as f:
-    f.writelines(updated)
+with edit_seed(SEED_PATH) as editor:
+    issues = [iss for iss in editor.data['issues'] if not iss['id'].startswith('ISS-R')]
+    print(f"Total non-recurring issues to update: {len(issues)}")
+
+    total_replaced = 0
+    for iss in issues:
+        if 'daily_execution' not in iss:
+            print(f"  WARNING: daily_execution not found for {iss['id']}")
+            continue
+        iss['daily_execution'] = list(
+            get_template(iss['id'], iss.get('task_type', 'study'), iss.get('energy', 'Medium'))
+        )
+        total_replaced += 1
+
+    print(f"Replaced daily_execution for {total_replaced} issues")
 
 print("File written successfully.")
 
 # Quick verify
-with open(SEED_PATH, encoding='utf-8') as f:
-    content = f.read()
-block_count = content.count('朝 (6-7時')
-print(f"'朝 (6-7時' occurrences: {block_count} (expected: {len(issue_meta)})")
+block_count = sum(
+    any(line.startswith('朝 (6-7時') for line in iss.get('daily_execution', []))
+    for iss in editor.data['issues']
+)
+print(f"'朝 (6-7時' occurrences: {block_count} (expected: {len(issues)})")
@@ -9,9 +9,14 @@ Rules:
   - Weekend issues  → 土日 セッション 形式 (when time_block contains 週末 or 休日)
   - Exam day issues → special 受験当日 format (ISS-006, ISS-009, ISS-031)
 """
+import pathlib
 import sys
 import re
-import yaml
+
+if __package__ in {None, ""}:
+    sys.path.append(str(pathlib.Path(__file__).resolve().parents[1]))
+
+from scripts.seed_editor import edit_seed
 
 SEED_PATH = 'data/project-seed.yaml'
 
@@ -189,64 +194,25 @@ def build_daily_execution(issue: dict) -> list:
     ]
 
 # ---------------------------------------------------------------------------
-def format_de_lines(items: list) -> list:
-    result = []
-    for item in items:
-        result.append(f"  - '{item}'\n")
-    return result
-
-def replace_daily_execution(lines: list, start_idx: int, new_items: list) -> list:
-    i = start_idx + 1
-    while i < len(lines) and lines[i].startswith('  - '):
-        i += 1
-    new_de_lines = format_de_lines(new_items)
-    return lines[:start_idx + 1] + new_de_lines + lines[i:]
-
-# ---------------------------------------------------------------------------
-with open(SEED_PATH, encoding='utf-8') as f:
-    lines = f.readlines()
-
-seed = yaml.safe_load(open(SEED_PATH, encoding='utf-8'))
-
-issue_map = {i['id']: i for i in seed['issues'] if not i['id'].startswith('ISS-R')}
-print(f"Issues to update: {len(issue_map)}")
-
-updated = list(lines)
-total = 0
-
-for issue_id, issue in issue_map.items():
-    new_de = build_daily_execution(issue)
-
-    in_issue = False
-    de_idx = None
-    for i, line in enumerate(updated):
-        if line.strip() == f'- id: {issue_id}':
-            in_issue = True
-        elif line.strip().startswith('- id: ISS') and issue_id not in line and in_issue:
-            in_issue = False
-            break
-        if in_issue and line.strip() == 'daily_execution:':
-            de_idx = i
-            break
-
-    if de_idx is None:
-        print(f"  WARN: no daily_execution found for {issue_id}")
-        continue
-
-    updated = replace_daily_execution(updated, de_idx, new_de)
-    total += 1
+with edit_seed(SEED_PATH) as editor:
+    issue_map = {i['id']: i for i in editor.data['issues'] if not i['id'].startswith('ISS-R')}
+    print(f"Issues to update: {len(issue_map)}")
 
-print(f"Updated: {total} issues")
+    total = 0
+    for issue_id, issue in issue_map.items():
+        if 'daily_execution' not in issue:
+            print(f"  WARN: no daily_execution found for {issue_id}")
+            continue
+        issue['daily_execution'] = build_daily_execution(issue)
+        total += 1
 
-with open(SEED_PATH, 'w', encoding='utf-8') as f:
-    f.writelines(updated)
+    print(f"Updated: {total} issues")
 
 print("Saved.")
 
 # ── spot check ──
-seed2 = yaml.safe_load(open(SEED_PATH, encoding='utf-8'))
 check_ids = ['ISS-001', 'ISS-020', 'ISS-034', 'ISS-047', 'ISS-048']
-for iss in seed2['issues']:
+for iss in editor.data['issues']:
     if iss['id'] in check_ids:
         print(f"\n=== {iss['id']} ({iss.get('task_type')} / {iss.get('energy')}) ===")
         for line in iss.get('daily_execution', []):
@@ -10,8 +10,13 @@ daily_execution v3 - 勉強集中版
   5. 試験当日 (ISS-006/009/031) は専用フォーマット
   6. 平日あり → 3ブロック、週末/休日のみ → セッション形式（work_steps を直接使用）
 """
+import pathlib
 import sys
-import yaml
+
+if __package__ in {None, ""}:
+    sys.path.append(str(pathlib.Path(__file__).resolve().parents[1]))
+
+from scripts.seed_editor import edit_seed
 
 SEED_PATH = 'data/project-seed.yaml'
 
@@ -200,52 +205,24 @@ def build(issue: dict) -> list:
 
 # ── 適用 ──────────────────────────────────────────────────────────────
 
-def format_lines(items):
-    return [f"  - '{item}'\n" for item in items]
-
-
-def replace_de(lines, start_idx, new_items):
-    i = start_idx + 1
-    while i < len(lines) and lines[i].startswith('  - '):
-        i += 1
-    return lines[:start_idx + 1] + format_lines(new_items) + lines[i:]
-
-
-with open(SEED_PATH, encoding='utf-8') as f:
-    raw = f.readlines()
-
-seed = yaml.safe_load(open(SEED_PATH, encoding='utf-8'))
-issue_map = {i['id']: i for i in seed['issues'] if not i['id'].startswith('ISS-R')}
-
-updated = list(raw)
-n = 0
-for iid, issue in issue_map.items():
-    new_de = build(issue)
-    in_i, de_idx = False, None
-    for idx, line in enumerate(updated):
-        if line.strip() == f'- id: {iid}':
-            in_i = True
-        elif line.strip().startswith('- id: ISS') and iid not in line and in_i:
-            break
-        if in_i and line.strip() == 'daily_execution:':
-            de_idx = idx
-            break
-    if de_idx is None:
-        print(f'WARN: no daily_execution for {iid}')
-        continue
-    updated = replace_de(updated, de_idx, new_de)
-    n += 1
-
-with open(SEED_PATH, 'w', encoding='utf-8') as f:
-    f.writelines(updated)
+with edit_seed(SEED_PATH) as editor:
+    n = 0
+    for issue in editor.data['issues']:
+        iid = issue['id']
+        if iid.startswith('ISS-R'):
+            continue
+        if 'daily_execution' not in issue:
+            print(f'WARN: no daily_execution for {iid}')
+            continue
+        issue['daily_execution'] = build(issue)
+        n += 1
 
 print(f'Updated {n} issues. File saved.')
 
 # ── スポット確認 ──────────────────────────────────────────────────────
 import json
-seed2 = yaml.safe_load(open(SEED_PATH, encoding='utf-8'))
 spot = {i['id']: i.get('daily_execution', [])
-        for i in seed2['issues']
+        for i in editor.data['issues']
         if i['id'] in ('ISS-001','ISS-006','ISS-011','ISS-020',
                        'ISS-034','ISS-037','ISS-045','ISS-047','ISS-048')}
 with open('debug_v3_spot.json', 'w', encoding='utf-8') as f:
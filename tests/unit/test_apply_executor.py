@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import datetime as dt
+import pathlib
+import threading
+
+import pytest
+
+from scripts import github_project_sync as sync
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1_000.0
+        self.sleeps: list[float] = []
+
+    def time(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def make_ctx(concurrency: int) -> sync.SyncContext:
+    return sync.SyncContext(
+        dry_run=False,
+        repo=sync.RepoTarget(owner="octo", repo="plan"),
+        project_owner="octo",
+        project_title="plan",
+        today=dt.date(2026, 3, 14),
+        seed_path=pathlib.Path("data/project-seed.yaml"),
+        report_dir=pathlib.Path("data/sync-reports"),
+        concurrency=concurrency,
+    )
+
+
+def test_rate_limiter_pauses_until_reset_when_remaining_is_low() -> None:
+    clock = FakeClock()
+    limiter = sync.RateLimiter(reserve=10, clock=clock.time, sleep=clock.sleep)
+    response = sync.GitHubResponse(
+        200, {"x-ratelimit-remaining": "5", "x-ratelimit-reset": str(int(clock.now) + 30)}, {}
+    )
+    assert limiter.observe(response) is None
+    limiter.wait()
+    assert clock.sleeps == [30.0]
+
+
+def test_rate_limiter_retries_secondary_limit_with_retry_after() -> None:
+    clock = FakeClock()
+    limiter = sync.RateLimiter(clock=clock.time, sleep=clock.sleep)
+    response = sync.GitHubResponse(
+        403, {"retry-after": "7"}, {"message": "You have exceeded a secondary rate limit."}
+    )
+    assert limiter.observe(response) == 7.0
+    forbidden = sync.GitHubResponse(403, {}, {"message": "Resource not accessible by integration"})
+    assert limiter.observe(forbidden) is None
+
+
+def test_apply_executor_runs_stage_in_parallel_and_reports_failures() -> None:
+    ctx = make_ctx(concurrency=4)
+    barrier = threading.Barrier(3, timeout=5)
+
+    def write(index: int) -> None:
+        barrier.wait()
+        if index == 1:
+            raise sync.SyncCommandError("HTTP 422")
+
+    for index in range(3):
+        ctx.submit(f"write {index}", write, index)
+    with pytest.raises(sync.SyncCommandError, match="1 write"):
+        ctx.drain("test stage")
+    ctx.executor.shutdown()
+    assert ctx.errors == ["write 1: HTTP 422"]
+
+
+def test_serial_writes_run_in_order_on_the_calling_thread() -> None:
+    ctx = make_ctx(concurrency=4)
+    threads: list[tuple[str, str]] = []
+
+    def write(name: str) -> None:
+        threads.append((name, threading.current_thread().name))
+
+    for index in range(3):
+        ctx.submit(f"create {index}", write, f"create {index}", serial=True)
+        ctx.submit(f"update {index}", write, f"update {index}")
+    ctx.drain("test stage")
+    ctx.executor.shutdown()
+    creates = [(name, thread) for name, thread in threads if name.startswith("create")]
+    assert creates == [(f"create {index}", threading.current_thread().name) for index in range(3)]
+    assert sum(thread.startswith("sync-apply") for _, thread in threads) == 3
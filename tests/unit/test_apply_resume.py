@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import datetime as dt
+import pathlib
+import sys
+from collections import Counter
+
+import pytest
+import yaml
+
+from scripts import github_project_sync as sync
+from scripts.github_standin import StandinConfig, StandinServer
+
+
+REPO = sync.RepoTarget(owner="bench", repo="plan")
+TODAY = dt.date(2026, 3, 14)
+HEADER = {"repo": REPO.full_name, "project_owner": "bench", "project_title": "plan", "selection": None}
+
+
+class FlakyTransport:
+    name = "flaky"
+
+    def __init__(self, failures: int) -> None:
+        self.failures = failures
+        self.calls: list[tuple[str, str]] = []
+
+    def request(self, method, endpoint, *, body=None, headers=None):
+        self.calls.append((method, endpoint))
+        if len(self.calls) <= self.failures:
+            return sync.GitHubResponse(503, {}, {"message": "Service Unavailable"})
+        return sync.GitHubResponse(200, {}, {"number": 1})
+
+
+def make_ctx() -> sync.SyncContext:
+    return sync.SyncContext(
+        dry_run=False,
+        repo=REPO,
+        project_owner="bench",
+        project_title="plan",
+        today=TODAY,
+        seed_path=pathlib.Path("data/project-seed.yaml"),
+        report_dir=pathlib.Path("data/sync-reports"),
+    )
+
+
+@pytest.fixture
+def sleeps(monkeypatch) -> list[float]:
+    recorded: list[float] = []
+    monkeypatch.setattr(sync, "RATE_LIMITER", sync.RateLimiter(sleep=recorded.append, jitter=lambda: 0.5))
+    return recorded
+
+
+def test_server_errors_are_retried_with_backoff_only_when_idempotent(sleeps) -> None:
+    transport = FlakyTransport(failures=2)
+    sync.set_transport(transport)
+    try:
+        assert sync.gh_api_json("repos/bench/plan/issues/1") == {"number": 1}
+        assert sleeps == [0.5, 1.0]
+
+        transport.calls.clear()
+        with pytest.raises(sync.SyncCommandError, match="HTTP 503"):
+            sync.gh_api_json("repos/bench/plan/issues", method="POST", body={"title": "New"})
+        assert len(transport.calls) == 1
+    finally:
+        sync.set_transport(None)
+
+
+def test_resume_replays_only_unacknowledged_writes(tmp_path: pathlib.Path) -> None:
+    seed = yaml.safe_load(pathlib.Path("data/project-seed.yaml").read_text(encoding="utf-8"))
+    planned = sync.build_planned_issues(seed, today=TODAY, closed_issue_seed_ids=set())[:3]
+    labels = [spec for spec in sync.label_specs_from_seed(seed) if any(spec.name in issue.labels for issue in planned)]
+    path = sync.journal_path(tmp_path, REPO)
+
+    with StandinServer(StandinConfig()) as server:
+        sync.set_transport(sync.HttpTransport("token", base_url=server.url))
+        try:
+            # The first run writes the labels and two issues, then dies without completing the journal.
+            ctx = make_ctx()
+            remote = sync.fetch_remote_snapshot(REPO, "bench", "plan")
+            remote.journal = ctx.journal = sync.OperationJournal.start(path, HEADER, remote)
+            sync.ensure_labels(ctx, remote, labels)
+            ctx.drain("labels")
+            sync.ensure_repo_issues(ctx, remote, planned[:2], {})
+            ctx.executor.shutdown()
+            ctx.journal.close()
+
+            assert sync.OperationJournal.restore(path, {**HEADER, "selection": ["ISS-001"]}) is None
+            restored, counts, in_flight = sync.OperationJournal.restore(path, HEADER)
+            assert counts["ack"] == counts["operation"] == len(labels) + 2
+            assert in_flight == set()
+            assert sorted(restored.labels) == sorted(spec.name for spec in labels)
+
+            before = server.traffic["requests"]
+            ctx = make_ctx()
+            sync.ensure_labels(ctx, restored, labels)
+            ctx.drain("labels")
+            sync.ensure_repo_issues(ctx, restored, planned, {})
+            ctx.executor.shutdown()
+            assert ctx.errors == []
+            writes = [operation for operation in ctx.operations if operation.action != "noop"]
+            assert [operation.action for operation in writes] == ["create"]
+            assert writes[0].target.startswith(planned[2].seed_id)
+            assert server.traffic["requests"] - before == 1
+
+            refetched = sync.fetch_remote_snapshot(REPO, "bench", "plan")
+            assert len(refetched.issues.issues) == 3
+        finally:
+            sync.set_transport(None)
+
+
+class CrashingTransport:
+    """Dies like a killed process on the first field value write."""
+
+    name = "crashing"
+
+    def __init__(self, inner) -> None:
+        self.inner = inner
+
+    def request(self, method, endpoint, *, body=None, headers=None):
+        if "updateProjectV2ItemFieldValue" in str((body or {}).get("query", "")):
+            raise KeyboardInterrupt
+        return self.inner.request(method, endpoint, body=body, headers=headers)
+
+
+def test_resume_after_a_crash_in_the_field_stage_writes_the_field_values(tmp_path: pathlib.Path, monkeypatch) -> None:
+    seed = yaml.safe_load(pathlib.Path("data/project-seed.yaml").read_text(encoding="utf-8"))
+    seed["phase_cards"], seed["win_conditions"] = [], []
+    seed["issues"] = seed["issues"][:3]
+    seed["epics"] = [epic for epic in seed["epics"] if epic["id"] in {issue["epic"] for issue in seed["issues"]}]
+    for issue in seed["issues"]:
+        issue["blocked_by"], issue["dependencies"] = [], []
+    seed_path = tmp_path / "project-seed.yaml"
+    seed_path.write_text(yaml.safe_dump(seed, allow_unicode=True, sort_keys=False), encoding="utf-8")
+    argv = ["github_project_sync", "--apply", "--seed-path", str(seed_path), "--transport", "http"]
+    argv += ["--owner", "bench", "--repo", "plan", "--project-owner", "bench", "--project-title", "plan"]
+    argv += ["--today", TODAY.isoformat(), "--no-cache", "--cache-dir", str(tmp_path / "cache")]
+    argv += ["--report-dir", str(tmp_path / "reports")]
+
+    with StandinServer(StandinConfig()) as server:
+        for key, value in server.environment().items():
+            monkeypatch.setenv(key, value)
+        build_transport = sync.build_transport
+        try:
+            monkeypatch.setattr(sync, "build_transport", lambda kind: CrashingTransport(build_transport(kind)))
+            monkeypatch.setattr(sys, "argv", argv)
+            with pytest.raises(KeyboardInterrupt):
+                sync.main()
+            project = server.state.projects[0]
+            assert len(project["items"]) == 5
+            assert all(not item["values"] for item in project["items"])
+
+            monkeypatch.setattr(sync, "build_transport", build_transport)
+            monkeypatch.setattr(sys, "argv", [*argv, "--resume"])
+            assert sync.main() == 0
+        finally:
+            sync.set_transport(None)
+
+        nodes = [server.state.graphql_item(project, item)["fieldValues"]["nodes"] for item in project["items"]]
+        priorities = Counter(value["field"]["name"] for values in nodes for value in values)["優先度"]
+        assert priorities == len(project["items"]) == 5
+        assert not sync.journal_path(tmp_path / "cache", REPO).exists()
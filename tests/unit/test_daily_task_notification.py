@@ -8,6 +8,7 @@ import yaml
 
 from scripts import github_project_sync as sync
 from scripts import daily_task_notification as notify
+from scripts.github_standin import StandinConfig, StandinServer
 
 
 TODAY = dt.date(2026, 3, 26)
@@ -98,3 +99,128 @@ def test_render_issue_body_shows_one_focus_and_not_all_parallel_tasks() -> None:
     assert "[26/03/14-04/27] [PHASE] 直前対策期" not in body
     assert "GitHub Projects 初期セットアップ" in body
     assert "必要なツール、設定、権限を洗い出す" not in body
+
+
+def test_focus_order_ignores_how_much_work_a_task_unblocks() -> None:
+    def seed_issue(seed_id: str, active_from: str, blocked_by: list[str]) -> dict:
+        return {
+            "id": seed_id,
+            "title": seed_id,
+            "priority": "p1",
+            "due_date": "2026-04-30",
+            "active_from": active_from,
+            "blocked_by": blocked_by,
+            "exam_priority_guard": True,
+        }
+
+    seed = {
+        "issues": [
+            seed_issue("ISS-A", "2026-03-01", []),
+            seed_issue("ISS-B", "2026-03-10", []),
+            seed_issue("ISS-C", "2026-03-01", ["ISS-B"]),
+            seed_issue("ISS-D", "2026-03-01", ["ISS-B"]),
+        ]
+    }
+    snapshot = [
+        managed_issue(issue["id"], issue["title"], number=number) for number, issue in enumerate(seed["issues"], 1)
+    ]
+    plan = notify.build_plan(seed, snapshot, today=TODAY)
+
+    # ISS-B unblocks two tasks, but ties still break on active_from alone.
+    assert plan.focus is not None and plan.focus.seed_id == "ISS-A"
+
+
+def test_issue_index_resolves_markers_titles_and_closed_ids_in_one_pass() -> None:
+    snapshot = existing_issue_snapshot() + [
+        managed_issue("ISS-007", "[資格] 完了済み", number=30, state="CLOSED"),
+        {"number": 31, "title": "手動で作成", "body": "", "state": "OPEN", "labels": []},
+    ]
+    index = sync.IssueIndex(snapshot)
+    planned = {item.seed_id: item for item in sync.build_planned_issues(load_seed(), today=TODAY, closed_issue_seed_ids=set())}
+
+    assert index.find(planned["ISS-002"])["number"] == 20
+    assert index.closed_seed_ids() == {"ISS-007"} == notify.closed_issue_seed_ids(snapshot)
+    assert set(notify.parse_marker_issue_map(index)) == set(index.by_seed_id)
+    assert index.by_title["手動で作成"][0]["number"] == 31
+
+
+def test_publish_fetches_only_managed_issues_and_replaces_the_open_notice() -> None:
+    synced_ids = {sync.marker_seed_id(sync.extract_marker(issue["body"])) for issue in existing_issue_snapshot()}
+    with StandinServer(StandinConfig(max_page_size=4)) as server:
+        sync.set_transport(sync.HttpTransport("token", base_url=server.url))
+        try:
+            for issue in existing_issue_snapshot():
+                body = f"{issue['body']}\n\n## 概要\n本文"
+                sync.gh_api_json("repos/octo/plan/issues", method="POST", body={"title": issue["title"], "body": body})
+            sync.gh_api_json("repos/octo/plan/issues", method="POST", body={"title": "手動で作成", "body": "メモ"})
+            old = sync.gh_api_json(
+                "repos/octo/plan/issues",
+                method="POST",
+                body={"title": "[今日の主タスク] 昨日", "body": "", "labels": [notify.NOTIFY_LABEL]},
+            )
+
+            before = server.traffic["requests"]
+            fetched = notify.fetch_existing_issues("octo/plan", synced_ids)
+            fetch_requests = server.traffic["requests"] - before
+            listings = server.state.stats["graphql:repository"]
+            # The full seed has ids without an issue yet, so search falls back to the issue listing.
+            fallback = notify.fetch_existing_issues("octo/plan", notify.seed_work_item_ids(load_seed()))
+            payload = notify.build_payload(
+                Path("data/project-seed.yaml"), repo="octo/plan", today=TODAY, recipient="foru1215"
+            )
+            before = server.traffic["requests"]
+            created = notify.publish_notification("octo/plan", payload, recipient="foru1215")
+            publish_requests = server.traffic["requests"] - before
+            issues = {issue["number"]: issue for issue in sync.gh_api_json("repos/octo/plan/issues?state=all")}
+        finally:
+            sync.set_transport(None)
+
+    assert len(fetched) == len(existing_issue_snapshot())
+    assert all(issue["body"].startswith(f"<!-- {sync.MARKER_PREFIX}:") for issue in fetched)
+    assert not any("概要" in issue["body"] for issue in fetched)
+    # three search pages of managed issues and no listing
+    assert (fetch_requests, listings) == (3, 0)
+    assert fallback == fetched
+    assert "#1 [資格] 2026-03: 第一種電気工事士 過去問入手・1年分着手" in payload["body"]
+    # one open-notice listing page, create, close
+    assert publish_requests == 3
+    assert issues[old["number"]]["state"] == "closed"
+    assert issues[created["number"]]["state"] == "open"
+    assert issues[created["number"]]["labels"] == [{"name": notify.NOTIFY_LABEL}]
+
+
+def test_calendar_rows_match_daily_plans_across_status_transitions() -> None:
+    seed = load_seed()
+    snapshot = existing_issue_snapshot()
+    for start in (TODAY, dt.date(2026, 6, 20)):
+        calendar = notify.build_calendar(seed, snapshot, start=start, horizon=30, seed_hash="seed")
+        assert len(calendar["days"]) == 30
+        for offset in range(30):
+            day = start + dt.timedelta(days=offset)
+            planned = notify.plan_from_calendar(calendar, seed, snapshot, today=day, seed_hash="seed")
+            assert planned == notify.build_plan(seed, snapshot, today=day)
+    # 2026-07-05 leaves the exam window, so deferred items change on that day.
+    assert calendar["days"]["2026-07-04"] != calendar["days"]["2026-07-05"]
+
+
+def test_calendar_applies_closed_issue_delta_or_declines() -> None:
+    seed = load_seed()
+    calendar = notify.build_calendar(seed, existing_issue_snapshot(), start=TODAY, horizon=7, seed_hash="seed")
+    calendar = json.loads(json.dumps(calendar))
+
+    # Closing a task nothing waits on just drops it from the row.
+    snapshot = existing_issue_snapshot()
+    snapshot[1]["state"] = "CLOSED"
+    plan = notify.plan_from_calendar(calendar, seed, snapshot, today=TODAY, seed_hash="seed")
+    assert plan == notify.build_plan(seed, snapshot, today=TODAY)
+    assert all(item.seed_id != "ISS-002" for item in plan.deferred)
+
+    # Closing a blocker unblocks ISS-005, which only a re-plan can place.
+    snapshot = existing_issue_snapshot()
+    snapshot[0]["state"] = "CLOSED"
+    assert notify.plan_from_calendar(calendar, seed, snapshot, today=TODAY, seed_hash="seed") is None
+
+    snapshot = existing_issue_snapshot()
+    assert notify.plan_from_calendar(calendar, seed, snapshot, today=TODAY, seed_hash="edited") is None
+    past_horizon = TODAY + dt.timedelta(days=7)
+    assert notify.plan_from_calendar(calendar, seed, snapshot, today=past_horizon, seed_hash="seed") is None
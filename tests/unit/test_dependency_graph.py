@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import copy
+import datetime as dt
+import pathlib
+
+import yaml
+
+from scripts import daily_task_notification as notify
+from scripts import github_project_sync as sync
+
+
+def load_seed() -> dict:
+    return yaml.safe_load(pathlib.Path("data/project-seed.yaml").read_text(encoding="utf-8"))
+
+
+def item(item_id: str, *blocked_by: str) -> dict:
+    return {"id": item_id, "blocked_by": list(blocked_by)}
+
+
+def test_chain_orders_blockers_first_and_memoizes_transitive_sets() -> None:
+    graph = sync.DependencyGraph([item("A", "B"), item("B", "C"), item("C"), item("D", "A", "C")])
+
+    assert graph.order.index("C") < graph.order.index("B") < graph.order.index("A") < graph.order.index("D")
+    assert graph.transitive_blockers("D") == {"A", "B", "C"}
+    assert graph.transitive_dependents("C") == {"A", "B", "D"}
+    assert graph.unblock_impact("C") == 3
+    assert graph.cycles() == []
+
+
+def test_root_blockers_skip_blockers_that_are_blocked_themselves() -> None:
+    graph = sync.DependencyGraph([item("A", "B"), item("B", "C"), item("C"), item("D", "A")])
+
+    assert graph.root_blockers(set()) == {"A": ["C"], "B": ["C"], "D": ["C"]}
+    assert graph.root_blockers({"C"}) == {"A": ["B"], "D": ["B"]}
+
+
+def test_cycles_are_reported_as_closed_paths_and_fail_validation() -> None:
+    graph = sync.DependencyGraph([item("A", "B"), item("B", "A"), item("C", "A"), item("D")])
+
+    assert graph.cycles() == [["A", "B", "A"]]
+    assert graph.cyclic == {"A", "B", "C"}
+    assert graph.transitive_blockers("C") == {"A", "B"}
+
+    seed = copy.deepcopy(load_seed())
+    first, second = seed["issues"][0], seed["issues"][1]
+    first["blocked_by"] = first["dependencies"] = [second["id"]]
+    second["blocked_by"] = second["dependencies"] = [first["id"]]
+    errors, _ = sync.validate_seed(seed)
+    assert any(message.startswith("Seed dependency cycle:") for message in errors)
+
+
+def test_real_seed_graph_is_acyclic_and_audit_names_next_blockers() -> None:
+    seed = load_seed()
+    graph = sync.DependencyGraph.from_seed(seed)
+    assert graph.cycles() == []
+
+    findings = sync.build_audit_findings(seed, today=dt.date(2026, 3, 14))
+    assert any(finding.code == "unblock-next" for finding in findings)
+    assert all("next to close" in finding.message for finding in findings if finding.code == "blocked")
+
+
+def test_daily_reason_points_at_the_root_of_a_chain() -> None:
+    issue = {"id": "A", "blocked_by": ["B"]}
+    status, reason = notify.status_reason(
+        issue,
+        today=dt.date(2026, 3, 26),
+        closed_issue_seed_ids=set(),
+        root_blockers=["C"],
+    )
+    assert status == "ブロック中"
+    assert reason == "C 完了待ち (B 経由)"
+
+    # A direct blocker that is itself the root keeps the original wording.
+    _, reason = notify.status_reason(
+        issue,
+        today=dt.date(2026, 3, 26),
+        closed_issue_seed_ids=set(),
+        root_blockers=["B"],
+    )
+    assert reason == "B 完了待ち"
@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+import datetime as dt
+import pathlib
+
+import yaml
+
+from scripts import github_project_sync as sync
+from scripts.github_standin import StandinConfig, StandinServer
+
+
+STATUS_FIELD = sync.ProjectFieldRef(
+    id="F_status",
+    name="Status",
+    field_type="ProjectV2SingleSelectField",
+    options={"未着手": "OPT_todo", "完了": "OPT_done"},
+)
+DUE_FIELD = sync.ProjectFieldRef(id="F_due", name="期日", field_type="ProjectV2Field", options={})
+
+
+class RecordingTransport:
+    name = "recording"
+
+    def __init__(self, responder) -> None:
+        self.responder = responder
+        self.bodies: list[dict] = []
+
+    def request(self, method, endpoint, *, body=None, headers=None):
+        self.bodies.append(body)
+        return sync.GitHubResponse(200, {}, self.responder(body))
+
+
+def make_ctx(batch_size: int) -> sync.SyncContext:
+    return sync.SyncContext(
+        dry_run=False,
+        repo=sync.RepoTarget(owner="octo", repo="plan"),
+        project_owner="octo",
+        project_title="plan",
+        today=dt.date(2026, 3, 14),
+        seed_path=pathlib.Path("data/project-seed.yaml"),
+        report_dir=pathlib.Path("data/sync-reports"),
+        field_batch_size=batch_size,
+    )
+
+
+def test_build_field_update_batch_uses_one_alias_per_update() -> None:
+    query, variables = sync.build_field_update_batch(
+        "P_1",
+        [
+            sync.FieldUpdate("A:Status", "ITEM_1", STATUS_FIELD, "完了"),
+            sync.FieldUpdate("A:期日", "ITEM_1", DUE_FIELD, "2026-03-31"),
+            sync.FieldUpdate("B:期日", "ITEM_2", DUE_FIELD, None),
+        ],
+    )
+    assert "u0: updateProjectV2ItemFieldValue(input: $i0)" in query
+    assert "u2: clearProjectV2ItemFieldValue(input: $i2)" in query
+    assert variables["i0"]["value"] == {"singleSelectOptionId": "OPT_done"}
+    assert variables["i1"]["value"] == {"date": "2026-03-31"}
+    assert "value" not in variables["i2"]
+
+
+def test_apply_field_updates_splits_batches_and_reports_failed_aliases() -> None:
+    def responder(body):
+        aliases = [key.replace("i", "u") for key in body["variables"]]
+        data = {alias: {"projectV2Item": {"id": "x"}} for alias in aliases}
+        if "u1" in data:
+            data["u1"] = None
+            return {"data": data, "errors": [{"path": ["u1"], "message": "invalid option"}]}
+        return {"data": data}
+
+    transport = RecordingTransport(responder)
+    sync.set_transport(transport)
+    try:
+        ctx = make_ctx(batch_size=2)
+        updates = [
+            sync.FieldUpdate(f"T{index}:Status", f"ITEM_{index}", STATUS_FIELD, "未着手") for index in range(5)
+        ]
+        updates.append(sync.FieldUpdate("T5:Status", "ITEM_5", STATUS_FIELD, "存在しない"))
+        sync.apply_field_updates(ctx, "P_1", updates)
+    finally:
+        sync.set_transport(None)
+
+    assert len(transport.bodies) == 3
+    assert ctx.errors == [
+        "Unknown option '存在しない' for field Status: T5:Status",
+        "Field update failed for T1:Status: invalid option",
+        "Field update failed for T3:Status: invalid option",
+    ]
+
+
+def test_ensure_project_items_adds_missing_issues_in_batches_without_refetch() -> None:
+    def responder(body):
+        data = {
+            key.replace("i", "a"): {"item": {"id": f"PVTI_{value['contentId']}"}}
+            for key, value in body["variables"].items()
+        }
+        if "a1" in data:
+            data["a1"] = None
+            return {"data": data, "errors": [{"path": ["a1"], "message": "content not found"}]}
+        return {"data": data}
+
+    planned = [
+        sync.PlannedIssue(f"ISS-{index}", "task", f"Issue {index}", "", [], None, {}, "") for index in range(4)
+    ]
+    issues = {
+        issue.seed_id: {
+            "url": f"https://github.com/octo/plan/issues/{index}",
+            "number": index,
+            "title": issue.title,
+            "node_id": f"I_{index}",
+        }
+        for index, issue in enumerate(planned)
+    }
+    existing = {"id": "PVTI_existing", "content": {"url": issues["ISS-0"]["url"], "number": 0, "title": "Issue 0"}}
+    remote = sync.RemoteSnapshot(
+        issues=sync.IssueIndex([]),
+        labels={},
+        milestones={},
+        project={"id": "P_1", "number": 3},
+        items={existing["content"]["url"]: existing},
+    )
+
+    transport = RecordingTransport(responder)
+    sync.set_transport(transport)
+    try:
+        ctx = make_ctx(batch_size=50)
+        ctx.item_batch_size = 2
+        items = sync.ensure_project_items(ctx, remote, planned, issues)
+    finally:
+        sync.set_transport(None)
+
+    assert len(transport.bodies) == 2
+    assert "a0: addProjectV2ItemById(input: $i0)" in transport.bodies[0]["query"]
+    assert ctx.errors == ["Project item add failed for ISS-2: content not found"]
+    assert items[issues["ISS-1"]["url"]]["id"] == "PVTI_I_1"
+    assert items[issues["ISS-3"]["url"]]["id"] == "PVTI_I_3"
+    assert issues["ISS-2"]["url"] not in items
+
+
+def set_values(items: dict[str, dict]) -> dict[str, dict]:
+    return {url: {key: value for key, value in item.items() if value is not None} for url, item in items.items()}
+
+
+def test_field_options_are_reconciled_in_one_request_without_refetch() -> None:
+    seed = yaml.safe_load(pathlib.Path("data/project-seed.yaml").read_text(encoding="utf-8"))
+    seed["meta"] = {**seed["meta"], "owner": "bench", "repo": "plan"}
+    repo = sync.RepoTarget(owner="bench", repo="plan")
+    specs = sync.seed_field_specs(seed)
+    planned = sync.build_planned_issues(seed, today=dt.date(2026, 3, 14))
+    planned = [issue for issue in planned if issue.entity_kind == "issue"][:2]
+    ctx = make_ctx(batch_size=50)
+    ctx.repo, ctx.project_owner = repo, "bench"
+    with StandinServer(StandinConfig()) as server:
+        sync.set_transport(sync.HttpTransport("token", base_url=server.url))
+        try:
+            remote = sync.fetch_remote_snapshot(repo, "bench", "plan")
+            sync.ensure_project(ctx, remote, seed)
+            before = server.traffic["graphql"]
+            fields = sync.ensure_project_fields(ctx, remote, specs)
+            assert server.traffic["graphql"] - before == 1
+            issue_map = sync.ensure_repo_issues(ctx, remote, planned, {})
+            sync.ensure_project_items(ctx, remote, planned, issue_map)
+            sync.ensure_project_item_fields(ctx, remote, planned, issue_map, fields)
+
+            status = next(spec for spec in specs if spec.name == "Status")
+            status.options = [*reversed(status.options), "保留"]
+            ctx.operations.clear()
+            before = server.traffic["graphql"]
+            fields = sync.ensure_project_fields(ctx, remote, specs)
+            assert server.traffic["graphql"] - before == 1
+            update = next(operation for operation in ctx.operations if operation.action == "update")
+            assert update.details["added"] == ["保留"]
+            assert update.details["removed"] == []
+
+            refetched = sync.fetch_remote_snapshot(repo, "bench", "plan")
+            assert remote.fields == refetched.fields
+            assert set_values(remote.items) == set_values(refetched.items)
+            sync.ensure_project_item_fields(ctx, remote, planned, issue_map, fields)
+            ctx.executor.shutdown()
+            assert ctx.errors == []
+            assert sync.fetch_remote_snapshot(repo, "bench", "plan").items == remote.items
+        finally:
+            sync.set_transport(None)
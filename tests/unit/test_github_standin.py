@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import datetime as dt
+import pathlib
+
+import pytest
+import yaml
+
+from scripts import github_project_sync as sync
+from scripts.benchmark_sync import synthetic_seed
+from scripts.github_standin import StandinConfig, StandinServer
+
+
+REPO = sync.RepoTarget(owner="bench", repo="plan")
+
+
+def load_seed() -> dict:
+    return yaml.safe_load(pathlib.Path("data/project-seed.yaml").read_text(encoding="utf-8"))
+
+
+def make_ctx() -> sync.SyncContext:
+    return sync.SyncContext(
+        dry_run=False,
+        repo=REPO,
+        project_owner="bench",
+        project_title="plan",
+        today=dt.date(2026, 3, 14),
+        seed_path=pathlib.Path("data/project-seed.yaml"),
+        report_dir=pathlib.Path("data/sync-reports"),
+        concurrency=2,
+    )
+
+
+@pytest.fixture
+def standin():
+    with StandinServer(StandinConfig(max_page_size=2)) as server:
+        sync.set_transport(sync.HttpTransport("token", base_url=server.url))
+        try:
+            yield server
+        finally:
+            sync.set_transport(None)
+
+
+def test_issue_writes_against_standin_are_noop_on_resync(standin, tmp_path: pathlib.Path) -> None:
+    seed = load_seed()
+    planned = sync.build_planned_issues(seed, today=dt.date(2026, 3, 14), closed_issue_seed_ids=set())[:3]
+    labels = [spec for spec in sync.label_specs_from_seed(seed) if any(spec.name in issue.labels for issue in planned)]
+
+    ctx = make_ctx()
+    remote = sync.fetch_remote_snapshot(REPO, "bench", "plan")
+    sync.ensure_labels(ctx, remote, labels)
+    ctx.drain("labels")
+    issue_map = sync.ensure_repo_issues(ctx, remote, planned, {})
+    ctx.executor.shutdown()
+    assert ctx.errors == []
+    assert sorted(issue_map) == sorted(issue.seed_id for issue in planned)
+    numbers = [issue_map[issue.seed_id]["number"] for issue in planned]
+    assert numbers == sorted(numbers)
+
+    fixture_path = tmp_path / "fixtures.jsonl"
+    sync.set_transport(sync.RecordingTransport(sync.get_transport(), fixture_path))
+    refetched = sync.fetch_remote_snapshot(REPO, "bench", "plan")
+    for issue in planned:
+        diff = sync.compare_issue_state(issue, refetched.issues.find(issue), {}, full=True)
+        assert diff["action"] == "noop"
+    assert standin.traffic["rate_limited"] == 0
+
+    sync.set_transport(sync.FixtureTransport(fixture_path))
+    replayed = sync.fetch_remote_snapshot(REPO, "bench", "plan")
+    assert replayed.issues.issues == refetched.issues.issues
+    assert replayed.labels == refetched.labels
+
+
+def test_standin_rate_limit_is_retried_after_reset(monkeypatch) -> None:
+    # A negative reserve disables the pre-emptive pause, so the stand-in has to answer 403.
+    monkeypatch.setattr(sync, "RATE_LIMITER", sync.RateLimiter(reserve=-1))
+    with StandinServer(StandinConfig(rate_limit=1, rate_window=0.5)) as server:
+        sync.set_transport(sync.HttpTransport("token", base_url=server.url))
+        try:
+            remote = sync.fetch_remote_snapshot(REPO, "bench", "plan")
+        finally:
+            sync.set_transport(None)
+    assert remote.project is None
+    assert server.traffic["rate_limited"] >= 1
+
+
+def test_synthetic_seed_scales_issues_and_stays_valid() -> None:
+    seed = synthetic_seed(load_seed(), 130, repo="plan-130")
+    errors, _ = sync.validate_seed(seed)
+    assert errors == []
+    assert len(seed["issues"]) == 130
+    assert len({issue["id"] for issue in seed["issues"]}) == 130
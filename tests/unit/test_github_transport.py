@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+import http.server
+import json
+import threading
+
+import pytest
+
+from scripts import github_project_sync as sync
+
+
+class FakeTransport:
+    name = "fake"
+
+    def __init__(self, responses: dict[tuple[str, str], sync.GitHubResponse]) -> None:
+        self.responses = responses
+        self.calls: list[tuple[str, str, object]] = []
+
+    def request(self, method, endpoint, *, body=None, headers=None):
+        self.calls.append((method, endpoint, body))
+        return self.responses[(method, endpoint)]
+
+
+@pytest.fixture
+def fake_transport():
+    def install(responses):
+        transport = FakeTransport(responses)
+        sync.set_transport(transport)
+        return transport
+
+    yield install
+    sync.set_transport(None)
+
+
+def test_parse_gh_include_output_reads_status_headers_and_body() -> None:
+    output = 'HTTP/2.0 200 OK\r\nEtag: "abc"\r\nX-Ratelimit-Remaining: 4999\r\n\r\n[{"name": "area:ai"}]'
+    response = sync.parse_gh_include_output(output)
+    assert response.status == 200
+    assert response.headers["etag"] == '"abc"'
+    assert response.headers["x-ratelimit-remaining"] == "4999"
+    assert response.data == [{"name": "area:ai"}]
+
+
+def test_issue_write_responses_normalize_like_graphql_issues() -> None:
+    written = sync.normalize_rest_issue(
+        {
+            "number": 3,
+            "node_id": "I_3",
+            "title": "Issue",
+            "body": None,
+            "html_url": "https://github.com/octo/plan/issues/3",
+            "url": "https://api.github.com/repos/octo/plan/issues/3",
+            "labels": [{"name": "area:ai", "color": "fff"}],
+            "milestone": {"number": 1, "title": "M1"},
+            "state": "closed",
+            "updated_at": "2026-03-01T00:00:00Z",
+        }
+    )
+    read = sync.normalize_graphql_issue(
+        {
+            "number": 3,
+            "id": "I_3",
+            "title": "Issue",
+            "body": "",
+            "url": "https://github.com/octo/plan/issues/3",
+            "state": "CLOSED",
+            "updatedAt": "2026-03-01T00:00:00Z",
+            "labels": {"nodes": [{"name": "area:ai"}]},
+            "milestone": {"number": 1, "title": "M1"},
+        }
+    )
+    assert written == read
+
+
+def test_gh_graphql_raises_on_graphql_errors(fake_transport) -> None:
+    fake_transport(
+        {("POST", "graphql"): sync.GitHubResponse(200, {}, {"errors": [{"message": "bad option"}]})}
+    )
+    with pytest.raises(sync.SyncCommandError, match="bad option"):
+        sync.gh_graphql("query { viewer { login } }", {})
+
+
+def test_http_transport_reuses_one_keep_alive_connection() -> None:
+    peers: list[tuple[str, int]] = []
+
+    class Handler(http.server.BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self) -> None:
+            peers.append(self.client_address)
+            payload = json.dumps({"path": self.path, "auth": self.headers["Authorization"]}).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, *args) -> None:
+            pass
+
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        transport = sync.HttpTransport("token-123", base_url=f"http://127.0.0.1:{server.server_port}")
+        transport._client = None
+        responses = [transport.request("GET", f"repos/octo/plan/labels?page={page}") for page in range(3)]
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert [response.data["path"] for response in responses] == [
+        f"/repos/octo/plan/labels?page={page}" for page in range(3)
+    ]
+    assert responses[0].data["auth"] == "Bearer token-123"
+    assert len(set(peers)) == 1
+
+
+def test_iter_graphql_nodes_follows_end_cursor() -> None:
+    pages = {
+        None: {"nodes": [{"id": 1}], "pageInfo": {"hasNextPage": True, "endCursor": "c1"}},
+        "c1": {"nodes": [{"id": 2}], "pageInfo": {"hasNextPage": False, "endCursor": None}},
+    }
+
+    class CursorTransport:
+        name = "cursor"
+
+        def request(self, method, endpoint, *, body=None, headers=None):
+            page = pages[body["variables"]["after"]]
+            return sync.GitHubResponse(200, {}, {"data": {"viewer": {"things": page}}})
+
+    sync.set_transport(CursorTransport())
+    try:
+        nodes = sync.iter_graphql_nodes("query", {}, ("viewer", "things"))
+        assert next(nodes) == {"id": 1}
+        assert list(nodes) == [{"id": 2}]
+    finally:
+        sync.set_transport(None)
+
+
+def test_non_json_bodies_are_retried_or_reported(monkeypatch) -> None:
+    bodies = [
+        (502, b"<html><body><h1>502 Bad Gateway</h1></body></html>"),
+        (200, b'{"labels": []}'),
+        (200, b'{"data": {"createIssue": {"iss'),
+    ]
+    requests: list[str] = []
+
+    class Handler(http.server.BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self) -> None:
+            self.reply()
+
+        def do_POST(self) -> None:
+            self.rfile.read(int(self.headers["Content-Length"]))
+            self.reply()
+
+        def reply(self) -> None:
+            requests.append(f"{self.command} {self.path}")
+            status, payload = bodies.pop(0)
+            self.send_response(status)
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, *args) -> None:
+            pass
+
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    monkeypatch.setattr(sync, "RATE_LIMITER", sync.RateLimiter(sleep=lambda seconds: None))
+    transport = sync.HttpTransport("token", base_url=f"http://127.0.0.1:{server.server_port}")
+    transport._client = None
+    sync.set_transport(transport)
+    try:
+        assert sync.gh_api_json("repos/octo/plan/labels") == {"labels": []}
+        with pytest.raises(sync.SyncCommandError, match="HTTP 200 with a non-JSON body"):
+            sync.gh_graphql("mutation { createIssue(input: {}) { issue { id } } }", {})
+    finally:
+        sync.set_transport(None)
+        server.shutdown()
+        server.server_close()
+    assert requests == ["GET /repos/octo/plan/labels", "GET /repos/octo/plan/labels", "POST /graphql"]
+
+    response = sync.parse_gh_include_output("HTTP/1.1 503 Service Unavailable\r\n\r\n<html>down</html>")
+    assert (response.status, response.data) == (503, "<html>down</html>")
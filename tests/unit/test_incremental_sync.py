@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import copy
+import datetime as dt
+import pathlib
+import sys
+from collections import Counter
+
+import yaml
+
+from scripts import github_project_sync as sync
+from scripts.github_standin import StandinConfig, StandinServer
+
+
+TODAY = dt.date(2026, 3, 14)
+
+
+def load_seed() -> dict:
+    return yaml.safe_load(pathlib.Path("data/project-seed.yaml").read_text(encoding="utf-8"))
+
+
+def planned_by_id(seed: dict) -> dict[str, sync.PlannedIssue]:
+    planned = sync.build_planned_issues(seed, today=TODAY, closed_issue_seed_ids=set())
+    return {item.seed_id: item for item in planned}
+
+
+def remote_issue(planned: sync.PlannedIssue, *, body: str | None = None) -> dict:
+    return {
+        "number": 1,
+        "title": planned.title,
+        "body": planned.body if body is None else body,
+        "labels": [{"name": "stale-label"}],
+        "milestone": None,
+        "state": "open",
+    }
+
+
+def test_fingerprint_covers_rendered_body_inputs() -> None:
+    seed = load_seed()
+    before = planned_by_id(seed)["ISS-001"]
+    edited = copy.deepcopy(seed)
+    edited["issues"][0]["dod"] = edited["issues"][0]["dod"] + ["追加の完了条件"]
+    after = planned_by_id(edited)["ISS-001"]
+    assert before.body != after.body
+    assert before.fingerprint != after.fingerprint
+
+
+def test_matching_marker_fingerprint_skips_the_exhaustive_diff() -> None:
+    planned = planned_by_id(load_seed())["ISS-001"]
+    existing = remote_issue(planned)
+
+    fast = sync.compare_issue_state(planned, existing, {}, full=False)
+    assert fast["action"] == "noop"
+    assert fast["fingerprint_match"] is True
+
+    exhaustive = sync.compare_issue_state(planned, existing, {}, full=True)
+    assert exhaustive["action"] == "update"
+    assert "labels" in exhaustive["changes"]
+
+
+def test_stale_marker_fingerprint_falls_back_to_full_diff() -> None:
+    planned = planned_by_id(load_seed())["ISS-001"]
+    stale_body = planned.body.replace(planned.fingerprint, "0" * 64)
+    diff = sync.compare_issue_state(planned, remote_issue(planned, body=stale_body), {}, full=False)
+    assert diff["action"] == "update"
+    assert "body" in diff["changes"]
+
+
+def small_seed() -> dict:
+    seed = load_seed()
+    seed["phase_cards"], seed["win_conditions"] = [], []
+    seed["issues"] = seed["issues"][:3]
+    seed["epics"] = [epic for epic in seed["epics"] if epic["id"] in {issue["epic"] for issue in seed["issues"]}]
+    for issue in seed["issues"]:
+        issue["blocked_by"], issue["dependencies"] = [], []
+    return seed
+
+
+def run_apply(server: StandinServer, seed: dict, tmp_path: pathlib.Path, monkeypatch, *extra: str) -> int:
+    seed_path = tmp_path / "project-seed.yaml"
+    seed_path.write_text(yaml.safe_dump(seed, allow_unicode=True, sort_keys=False), encoding="utf-8")
+    for key, value in server.environment().items():
+        monkeypatch.setenv(key, value)
+    argv = ["github_project_sync", "--apply", "--seed-path", str(seed_path), "--transport", "http"]
+    argv += ["--owner", "bench", "--repo", "plan", "--project-owner", "bench", "--project-title", "plan"]
+    argv += ["--today", TODAY.isoformat(), "--no-cache", "--cache-dir", str(tmp_path / "cache")]
+    argv += ["--report-dir", str(tmp_path / "reports"), *extra]
+    monkeypatch.setattr(sys, "argv", argv)
+    try:
+        return sync.main()
+    finally:
+        sync.set_transport(None)
+
+
+def item_values(server: StandinServer) -> Counter[str]:
+    """How many project items hold a value, per field, as GitHub would report them."""
+    project = server.state.projects[0]
+    nodes = [server.state.graphql_item(project, item) for item in project["items"]]
+    return Counter(value["field"]["name"] for node in nodes for value in node["fieldValues"]["nodes"])
+
+
+def test_items_added_after_the_read_get_their_field_values(tmp_path: pathlib.Path, monkeypatch) -> None:
+    seed = small_seed()
+    with StandinServer(StandinConfig()) as server:
+        assert run_apply(server, seed, tmp_path, monkeypatch) == 0
+        synced = item_values(server)
+        assert synced["優先度"] == len(server.state.projects[0]["items"]) == 5
+
+        # Someone removes an item from the board; its issue and marker are untouched.
+        server.state.projects[0]["items"].pop(0)
+        assert run_apply(server, seed, tmp_path, monkeypatch) == 0
+        assert item_values(server) == synced
+
+
+def test_field_values_survive_an_option_change(tmp_path: pathlib.Path, monkeypatch) -> None:
+    seed = small_seed()
+    with StandinServer(StandinConfig()) as server:
+        assert run_apply(server, seed, tmp_path, monkeypatch) == 0
+        synced = item_values(server)
+
+        # Adding an option replaces the field's option ids and GitHub clears its value on every item.
+        field = next(field for field in seed["project_fields"] if field["name"] == "優先度")
+        field["options"].append("P3")
+        assert run_apply(server, seed, tmp_path, monkeypatch) == 0
+        assert item_values(server) == synced
+        assert run_apply(server, seed, tmp_path, monkeypatch) == 0
+        assert item_values(server) == synced
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import json
+
+from scripts import github_project_sync as sync
+
+
+def graphql_issue(number: int, seed_id: str, title: str) -> dict:
+    marker = json.dumps({"seed_id": seed_id, "entity_kind": "issue", "fingerprint": "f"})
+    return {
+        "number": number,
+        "id": f"I_{number}",
+        "title": title,
+        "body": f"<!-- {sync.MARKER_PREFIX}: {marker} -->",
+        "url": f"https://github.com/octo/plan/issues/{number}",
+        "state": "OPEN",
+        "updatedAt": "2026-03-01T00:00:00Z",
+        "labels": {"nodes": [{"name": "area:ai"}]},
+        "milestone": None,
+    }
+
+
+def page(nodes: list, cursor: str | None = None) -> dict:
+    return {"nodes": nodes, "pageInfo": {"hasNextPage": cursor is not None, "endCursor": cursor}}
+
+
+class SnapshotTransport:
+    name = "snapshot"
+
+    def __init__(self) -> None:
+        self.variables: list[dict] = []
+
+    def request(self, method, endpoint, *, body=None, headers=None):
+        query, variables = body["query"], body["variables"]
+        self.variables.append(variables)
+        if "repository(owner: $owner, name: $name)" in query:
+            repository = {}
+            if variables["withLabels"]:
+                repository["labels"] = page([{"name": "area:ai", "color": "fff", "description": ""}])
+            if variables["withMilestones"]:
+                repository["milestones"] = page(
+                    [{"number": 1, "title": "M1", "description": None, "dueOn": None, "state": "OPEN"}]
+                )
+            if variables["withIssues"]:
+                if variables["issuesAfter"] is None:
+                    repository["issues"] = page([graphql_issue(2, "ISS-002", "Second")], cursor="c1")
+                else:
+                    repository["issues"] = page([graphql_issue(1, "ISS-001", "First")])
+            return sync.GitHubResponse(200, {}, {"data": {"repository": repository}})
+        if "projectsV2(first:100" in query:
+            project = {"id": "P_1", "number": 7, "title": "plan", "updatedAt": "2026-03-02T00:00:00Z"}
+            return sync.GitHubResponse(200, {}, {"data": {"user": {"projectsV2": page([project])}}})
+        item = {
+            "id": "ITEM_1",
+            "content": {"url": "https://github.com/octo/plan/issues/1", "number": 1, "title": "First"},
+            "fieldValues": {"nodes": [{"name": "未着手", "field": {"name": "Status"}}]},
+        }
+        field = {
+            "__typename": "ProjectV2SingleSelectField",
+            "id": "F_status",
+            "name": "Status",
+            "dataType": "SINGLE_SELECT",
+            "options": [{"id": "OPT_todo", "name": "未着手"}],
+        }
+        project_state = {"fields": page([field]), "items": page([item])}
+        return sync.GitHubResponse(200, {}, {"data": {"repositoryOwner": {"projectV2": project_state}}})
+
+
+def test_fetch_remote_snapshot_pages_connections_together() -> None:
+    transport = SnapshotTransport()
+    sync.set_transport(transport)
+    try:
+        remote = sync.fetch_remote_snapshot(sync.RepoTarget("octo", "plan"), "octo", "plan")
+    finally:
+        sync.set_transport(None)
+
+    assert len(transport.variables) == 4
+    assert transport.variables[1]["withLabels"] is False
+    assert transport.variables[1]["issuesAfter"] == "c1"
+    assert [issue["number"] for issue in remote.issues.issues] == [2, 1]
+    assert remote.issues.by_seed_id["ISS-001"]["state"] == "open"
+    assert remote.labels["area:ai"]["color"] == "fff"
+    assert remote.milestones["M1"]["state"] == "open"
+    assert remote.fields["Status"].options == {"未着手": "OPT_todo"}
+    assert remote.items["https://github.com/octo/plan/issues/1"]["Status"] == "未着手"
+
+
+def test_snapshot_store_issue_replaces_the_indexed_issue() -> None:
+    first = sync.normalize_graphql_issue(graphql_issue(1, "ISS-001", "First"))
+    remote = sync.RemoteSnapshot(issues=sync.IssueIndex([first]), labels={}, milestones={})
+
+    renamed = dict(first, title="Renamed", state="closed")
+    remote.store_issue(renamed)
+    remote.store_issue(sync.normalize_graphql_issue(graphql_issue(3, "ISS-003", "Third")))
+
+    assert remote.issues.by_seed_id["ISS-001"] is renamed
+    assert remote.issues.by_title["First"] == []
+    assert [issue["number"] for issue in remote.issues.issues] == [3, 1]
+    assert remote.issues.closed_seed_ids() == {"ISS-001"}
+
+
+def test_issue_index_keeps_duplicate_markers_and_matches_copies_by_number() -> None:
+    newer = sync.normalize_graphql_issue(graphql_issue(5, "ISS-001", "Duplicate"))
+    older = dict(sync.normalize_graphql_issue(graphql_issue(2, "ISS-001", "Original")), state="closed")
+    index = sync.IssueIndex([newer, older])
+
+    assert index.by_seed_id["ISS-001"] is newer
+    # As before the index: a seed id is closed when any issue carrying its marker is closed.
+    assert index.closed_seed_ids() == {"ISS-001"}
+    assert index.marker(dict(older)) == {"seed_id": "ISS-001", "entity_kind": "issue", "fingerprint": "f"}
+
+    moved = dict(newer, body=newer["body"].replace("ISS-001", "ISS-009"))
+    index.upsert(moved)
+    assert index.by_seed_id == {"ISS-001": older, "ISS-009": moved}
+    assert index.seed_numbers == {"ISS-001": [2], "ISS-009": [5]}
+    assert [issue["number"] for issue in index.issues] == [5, 2]
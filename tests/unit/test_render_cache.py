@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import datetime as dt
+import pathlib
+import pickle
+
+import yaml
+
+from scripts import github_project_sync as sync
+
+
+def load_seed() -> dict:
+    return yaml.safe_load(pathlib.Path("data/project-seed.yaml").read_text(encoding="utf-8"))
+
+
+def plan(seed: dict, today: dt.date, cache: sync.RenderCache) -> list[sync.PlannedIssue]:
+    sync.set_render_cache(cache)
+    try:
+        return sync.build_planned_issues(seed, today=today)
+    finally:
+        sync.set_render_cache(sync.RenderCache())
+
+
+def test_cached_bodies_match_fresh_renders_when_only_the_marker_changes() -> None:
+    seed = load_seed()
+    cache = sync.RenderCache()
+    plan(seed, dt.date(2026, 3, 14), cache)
+
+    later = dt.date(2026, 5, 14)
+    cached = plan(seed, later, cache)
+    fresh = plan(seed, later, sync.RenderCache())
+
+    assert cache.stats["miss"] == len(fresh)
+    assert cache.stats["hit"] == len(fresh)
+    assert [issue.body for issue in cached] == [issue.body for issue in fresh]
+    assert [issue.fingerprint for issue in cached] == [issue.fingerprint for issue in fresh]
+
+
+def test_disk_cache_round_trips_and_drops_unused_or_stale_entries(tmp_path: pathlib.Path) -> None:
+    seed = load_seed()
+    path = tmp_path / sync.RENDER_CACHE_FILE
+    first = sync.RenderCache(path)
+    planned = plan(seed, dt.date(2026, 3, 14), first)
+    first.entries["issue:unused"] = "stale body"
+    first.save()
+
+    second = sync.RenderCache(path)
+    assert "issue:unused" not in second.entries
+    assert [issue.body for issue in plan(seed, dt.date(2026, 3, 14), second)] == [issue.body for issue in planned]
+    assert second.stats["miss"] == 0
+
+    payload = pickle.loads(path.read_bytes())
+    path.write_bytes(pickle.dumps({**payload, "template_version": sync.BODY_TEMPLATE_VERSION + 1}))
+    assert sync.RenderCache(path).entries == {}
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import pathlib
+
+import pytest
+import yaml
+
+from scripts.seed_editor import SeedEditError, SeedEditor, edit_seed, write_sharded_seed
+from scripts.seed_loader import SEED_MANIFEST, load_seed
+
+
+SEED_TEXT = """\
+# Hand-written header comment.
+meta:
+  owner: octo  # kept
+  repo: plan
+issue_blueprints:
+  dod_setup: &id001
+  - Setup works
+issues:
+- id: ISS-001
+  title: First
+  labels: [area:ai]
+  dod: *id001
+  # Note that belongs to ISS-002.
+- id: ISS-002
+  title: Second
+  dod: *id001
+  daily_execution:
+  - 'old: step'
+"""
+
+
+def write_seed(tmp_path: pathlib.Path) -> pathlib.Path:
+    path = tmp_path / "project-seed.yaml"
+    path.write_text(SEED_TEXT, encoding="utf-8")
+    return path
+
+
+def test_edits_patch_only_the_changed_entries(tmp_path: pathlib.Path) -> None:
+    path = write_seed(tmp_path)
+    with SeedEditor.open(path) as editor:
+        assert editor.entity_span("ISS-001") == (8, 12)
+        editor.entity("ISS-002")["daily_execution"] = ["new: step"]
+        editor.entity("ISS-001")["labels"].append("area:plc")
+        editor.data["issues"].insert(1, {"id": "ISS-003", "title": "Third", "dod": []})
+        editor.data["meta"]["repo"] = "shared"
+
+    assert path.read_text(encoding="utf-8") == SEED_TEXT.replace("repo: plan", "repo: shared").replace(
+        "  labels: [area:ai]\n", "  labels:\n  - area:ai\n  - area:plc\n"
+    ).replace("  # Note", "- id: ISS-003\n  title: Third\n  dod: []\n  # Note").replace("'old: step'", "'new: step'")
+    assert editor.index["ISS-003"] == ("issues", 1)
+
+
+def test_aliases_follow_or_detach_from_their_anchor(tmp_path: pathlib.Path) -> None:
+    path = write_seed(tmp_path)
+    with SeedEditor.open(path) as editor:
+        editor.data["issue_blueprints"]["dod_setup"].append("Documented")  # shared by both issues
+        editor.entity("ISS-002")["dod"] = ["Own check"]
+
+    text = path.read_text(encoding="utf-8")
+    assert "  dod_setup: &id001\n  - Setup works\n  - Documented\n" in text
+    assert "  dod: *id001\n" in text
+    assert "  dod:\n  - Own check\n" in text
+
+    with SeedEditor.open(path) as editor:
+        del editor.data["issue_blueprints"]["dod_setup"]
+    seed = yaml.safe_load(path.read_text(encoding="utf-8"))
+    assert seed["issue_blueprints"] == {}
+    assert seed["issues"][0]["dod"] == ["Setup works", "Documented"]
+
+
+def test_failed_or_conflicting_edits_leave_the_file_alone(tmp_path: pathlib.Path) -> None:
+    path = write_seed(tmp_path)
+    with pytest.raises(RuntimeError):
+        with SeedEditor.open(path) as editor:
+            editor.data["meta"]["owner"] = "someone"
+            raise RuntimeError("abort")
+    assert path.read_text(encoding="utf-8") == SEED_TEXT
+
+    editor = SeedEditor.open(path)
+    editor.data["meta"]["owner"] = "someone"
+    path.write_text(SEED_TEXT + "extra: true\n", encoding="utf-8")
+    with pytest.raises(SeedEditError, match="changed on disk"):
+        editor.commit()
+    assert path.read_text(encoding="utf-8") == SEED_TEXT + "extra: true\n"
+    assert list(tmp_path.iterdir()) == [path]
+
+
+def test_sharded_edits_rewrite_only_the_touched_shards(tmp_path: pathlib.Path) -> None:
+    root = tmp_path / "seed"
+    write_sharded_seed(yaml.safe_load(SEED_TEXT), root)
+    before = {path: path.read_bytes() for path in root.rglob("*.yaml")}
+
+    with edit_seed(root) as editor:
+        editor.entity("ISS-002")["title"] = "Second (revised)"
+        editor.data["issues"].append({"id": "ISS-003", "title": "Third", "phase": "P1"})
+        del editor.data["issues"][0]
+
+    after = {path: path.read_bytes() for path in root.rglob("*.yaml")}
+    changed = {path.relative_to(root).as_posix() for path in before | after if before.get(path) != after.get(path)}
+    assert changed == {
+        SEED_MANIFEST,
+        "issues/unphased/ISS-001.yaml",
+        "issues/unphased/ISS-002.yaml",
+        "issues/P1/ISS-003.yaml",
+    }
+    assert load_seed(root, cache_dir=None, lazy=False) == editor.data
+    assert [issue["id"] for issue in editor.data["issues"]] == ["ISS-002", "ISS-003"]
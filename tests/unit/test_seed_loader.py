@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import pathlib
+
+import pytest
+import yaml
+
+from scripts import seed_loader
+from scripts.seed_editor import write_sharded_seed
+
+
+SEED_PATH = pathlib.Path("data/project-seed.yaml")
+
+
+def test_c_loader_matches_pure_python_safe_load() -> None:
+    text = SEED_PATH.read_text(encoding="utf-8")
+    assert seed_loader.parse_seed_text(text) == yaml.safe_load(text)
+
+
+def test_snapshot_is_reused_until_the_seed_changes(tmp_path: pathlib.Path, monkeypatch) -> None:
+    seed_path = tmp_path / "seed.yaml"
+    seed_path.write_text("meta:\n  owner: octo\nissues: []\n", encoding="utf-8")
+    cache_dir = tmp_path / "cache"
+    first = seed_loader.load_seed(seed_path, cache_dir=cache_dir)
+
+    def fail_parse(text):
+        raise AssertionError("snapshot should have been used")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(seed_loader, "parse_seed_text", fail_parse)
+        assert seed_loader.load_seed(seed_path, cache_dir=cache_dir) == first
+
+    seed_path.write_text("meta:\n  owner: octo\nissues:\n  - id: ISS-001\n", encoding="utf-8")
+    edited = seed_loader.load_seed(seed_path, cache_dir=cache_dir)
+    assert edited["issues"] == [{"id": "ISS-001"}]
+    assert len(list(cache_dir.glob("*.pickle"))) == 1
+
+
+def test_corrupt_snapshot_falls_back_to_parsing(tmp_path: pathlib.Path) -> None:
+    seed_path = tmp_path / "seed.yaml"
+    seed_path.write_text("meta: {owner: octo}\n", encoding="utf-8")
+    cache_dir = tmp_path / "cache"
+    seed_loader.load_seed(seed_path, cache_dir=cache_dir)
+    for snapshot in cache_dir.glob("*.pickle"):
+        snapshot.write_bytes(b"not a pickle")
+    assert seed_loader.load_seed(seed_path, cache_dir=cache_dir) == {"meta": {"owner": "octo"}}
+
+
+def test_sharded_seed_reads_back_lazily_and_rejects_stale_shards(tmp_path: pathlib.Path) -> None:
+    seed = seed_loader.load_seed(SEED_PATH, cache_dir=None)
+    root = tmp_path / "seed"
+    write_sharded_seed(seed, root)
+    assert seed_loader.load_seed(root, cache_dir=None, lazy=False) == seed
+
+    sharded = seed_loader.load_seed(root, cache_dir=None)
+    assert list(sharded) == list(seed)
+    assert sharded["meta"] == seed["meta"]
+    assert sharded.entity_ids("issues") == [issue["id"] for issue in seed["issues"]]
+    assert list(sharded.shards) == ["meta.yaml"]
+
+    first = seed["issues"][0]
+    shard = root / seed_loader.entity_shard_path("issues", first)
+    shard.write_text(shard.read_text(encoding="utf-8") + "extra: true\n", encoding="utf-8")
+    with pytest.raises(seed_loader.SeedShardError, match="--rehash"):
+        seed_loader.load_seed(root, cache_dir=None).entity(first["id"])
+
+
+def test_sharded_sections_share_the_snapshot_cache(tmp_path: pathlib.Path, monkeypatch) -> None:
+    root = tmp_path / "seed"
+    write_sharded_seed({"meta": {"owner": "octo"}, "issues": [{"id": "ISS-001", "phase": "P1"}]}, root)
+    cache_dir = tmp_path / "cache"
+    first = seed_loader.load_seed(root, cache_dir=cache_dir)["issues"]
+    reopened = seed_loader.load_seed(root, cache_dir=cache_dir)  # the manifest itself is always parsed
+
+    with monkeypatch.context() as patch:
+        patch.setattr(seed_loader, "parse_seed_text", lambda text: pytest.fail("snapshot should have been used"))
+        assert reopened["issues"] == first
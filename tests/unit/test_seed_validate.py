@@ -3,6 +3,7 @@ from __future__ import annotations
 import copy
 import pathlib
 
+import pytest
 import yaml
 
 from scripts import github_project_sync as sync
@@ -34,3 +35,41 @@ def test_validate_seed_fails_when_phase_cards_are_missing() -> None:
     broken.pop("phase_cards")
     errors, _warnings = sync.validate_seed(broken)
     assert "Missing top-level section: phase_cards" in errors
+
+
+def test_validate_seed_reports_item_messages_in_schema_order() -> None:
+    broken = copy.deepcopy(load_seed())
+    issue = broken["issues"][0]
+    issue_id = issue["id"]
+    issue.update(
+        phase="P-NOPE",
+        dod="not a list",
+        outcome="  ",
+        due_date="2026-02-30",
+        evidence_type="log",
+        evidence_to_keep=[],
+        blocked_by=["GHOST"],
+        dependencies=[],
+    )
+    issue.pop("focus")
+    errors, warnings = sync.validate_seed(broken)
+    assert errors == [
+        f"Issue {issue_id} references unknown phase: P-NOPE",
+        f"Issue {issue_id} has non-list dod",
+        f"Issue {issue_id} is missing outcome",
+        f"Issue {issue_id} is missing focus",
+        f"Issue {issue_id} has invalid due_date: 2026-02-30",
+        f"Issue {issue_id} references unknown blocked_by: GHOST",
+    ]
+    assert warnings == [
+        f"Issue {issue_id} has evidence_type but no evidence_to_keep",
+        f"Issue {issue_id} blocked_by does not match dependencies",
+    ]
+
+
+def test_cached_date_parsing_keeps_iso_semantics() -> None:
+    assert sync.parse_iso_date("2026-03-14") is sync.parse_iso_date("2026-03-14")
+    assert sync.is_valid_iso_date(None) and sync.is_valid_iso_date("")
+    assert not sync.is_valid_iso_date("2026-13-01")
+    with pytest.raises(ValueError, match="2026-13-01"):
+        sync.parse_iso_date("2026-13-01")
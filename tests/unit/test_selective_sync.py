@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import datetime as dt
+import pathlib
+
+import pytest
+import yaml
+
+from scripts import github_project_sync as sync
+from scripts.github_standin import StandinConfig, StandinServer
+
+
+REPO = sync.RepoTarget(owner="bench", repo="plan")
+TODAY = dt.date(2026, 3, 14)
+
+
+def load_seed() -> dict:
+    return yaml.safe_load(pathlib.Path("data/project-seed.yaml").read_text(encoding="utf-8"))
+
+
+def test_selection_closes_over_blockers_and_parent_epic() -> None:
+    seed = load_seed()
+    blocked = next(issue for issue in seed["issues"] if issue.get("blocked_by") and issue.get("epic"))
+    selected = sync.select_seed_ids(seed, only=[blocked["id"]])
+
+    assert blocked["id"] in selected
+    assert set(blocked["blocked_by"]) <= selected
+    assert blocked["epic"] in selected
+    planned = sync.build_planned_issues(seed, today=TODAY, only=selected)
+    assert {issue.seed_id for issue in planned} == selected
+
+
+def test_selection_by_epic_phase_and_milestone() -> None:
+    seed = load_seed()
+    epic_id = seed["epics"][0]["id"]
+    assert {issue["id"] for issue in seed["issues"] if issue.get("epic") == epic_id} <= sync.select_seed_ids(
+        seed, only=[epic_id]
+    )
+    assert "PC-phase-0" in sync.select_seed_ids(seed, phases=["phase-0"])
+    milestone_id = seed["milestones"][0]["id"]
+    assert any(
+        issue["id"] in sync.select_seed_ids(seed, milestones=[milestone_id])
+        for issue in seed["issues"]
+        if issue.get("milestone") == milestone_id
+    )
+    with pytest.raises(sync.SyncCommandError, match="ISS-999"):
+        sync.select_seed_ids(seed, only=["ISS-999"])
+
+
+def test_selected_snapshot_matches_full_snapshot_for_the_subset() -> None:
+    seed = load_seed()
+    planned = [issue for issue in sync.build_planned_issues(seed, today=TODAY) if issue.entity_kind == "issue"][:4]
+    ctx = sync.SyncContext(
+        dry_run=False,
+        repo=REPO,
+        project_owner="bench",
+        project_title="plan",
+        today=TODAY,
+        seed_path=pathlib.Path("data/project-seed.yaml"),
+        report_dir=pathlib.Path("data/sync-reports"),
+    )
+    with StandinServer(StandinConfig()) as server:
+        sync.set_transport(sync.HttpTransport("token", base_url=server.url))
+        try:
+            remote = sync.fetch_remote_snapshot(REPO, "bench", "plan")
+            sync.ensure_project(ctx, remote, seed)
+            fields = sync.ensure_project_fields(ctx, remote, sync.seed_field_specs(seed))
+            issue_map = sync.ensure_repo_issues(ctx, remote, planned, {})
+            sync.ensure_project_items(ctx, remote, planned, issue_map)
+            sync.ensure_project_item_fields(ctx, remote, planned, issue_map, fields)
+            ctx.executor.shutdown()
+            assert ctx.errors == []
+
+            full = sync.fetch_remote_snapshot(REPO, "bench", "plan")
+            target = planned[2].seed_id
+            before = server.traffic["requests"]
+            selected = sync.fetch_selected_snapshot(REPO, "bench", "plan", {target})
+            requests = server.traffic["requests"] - before
+        finally:
+            sync.set_transport(None)
+
+    # labels and milestones, search, project lookup, project fields, and the issue's project items
+    assert requests == 5
+    issue = full.issues.by_seed_id[target]
+    assert selected.issues.by_seed_id[target] == issue
+    assert selected.items == {issue["url"]: full.items[issue["url"]]}
+    assert selected.fields == full.fields
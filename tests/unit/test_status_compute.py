@@ -1,6 +1,9 @@
 from __future__ import annotations
 
 import datetime as dt
+import pathlib
+
+import yaml
 
 from scripts import github_project_sync as sync
 
@@ -90,3 +93,39 @@ def test_outside_window_returns_backlog() -> None:
         due_date="2026-12-31",
     )
     assert status == "Backlog"
+
+
+def test_status_engine_matches_compute_status_for_every_seed_item() -> None:
+    seed = yaml.safe_load(pathlib.Path("data/project-seed.yaml").read_text(encoding="utf-8"))
+    closed = {"ISS-001"}
+    engine = sync.StatusEngine.from_seed(seed, closed_issue_seed_ids=closed)
+    graph = sync.DependencyGraph.from_seed(seed)
+    statuses = engine.evaluate_range(TODAY, 120)
+    for day in (TODAY, dt.date(2026, 5, 1), dt.date(2026, 7, 5)):
+        for item_id, result in statuses[day].items():
+            item = graph.items[item_id]
+            assert result.status == sync.compute_status(
+                today=day,
+                deferred_until=item.get("deferred_until"),
+                active_from=item.get("active_from"),
+                blocked_by=item.get("blocked_by", []),
+                closed_issue_seed_ids=closed,
+                exam_priority_guard=sync.normalize_bool(item.get("exam_priority_guard")),
+                current_phase_is_exam=sync.is_exam_priority_period(day),
+                due_date=item.get("due_date"),
+            )
+    blocked = [result for result in statuses[TODAY].values() if result.reason == "blocked"]
+    assert blocked and all(result.blockers and result.roots for result in blocked)
+    reasons = {"deferred", "not-active", "blocked", "exam-priority", "due-soon", "not-due"}
+    assert {result.reason for result in statuses[TODAY].values()} <= reasons
+
+
+def test_status_engine_range_only_reevaluates_on_transition_days() -> None:
+    item = {"id": "A", "active_from": "2026-07-10", "due_date": "2026-08-01", "exam_priority_guard": True}
+    engine = sync.StatusEngine([item])
+    statuses = engine.evaluate_range(dt.date(2026, 7, 1), 15)
+    # 2026-07-05 is the day after the exam window closes, 2026-07-10 the active_from date.
+    assert statuses[dt.date(2026, 7, 5)] is statuses[dt.date(2026, 7, 9)]
+    assert statuses[dt.date(2026, 7, 4)] is not statuses[dt.date(2026, 7, 5)]
+    assert statuses[dt.date(2026, 7, 9)]["A"].reason == "not-active"
+    assert statuses[dt.date(2026, 7, 10)]["A"] == sync.StatusResult("未着手", "due-soon")
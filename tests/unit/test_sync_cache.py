@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import pathlib
+
+from scripts import github_project_sync as sync
+
+
+class ScriptedTransport:
+    name = "scripted"
+
+    def __init__(self, responder) -> None:
+        self.responder = responder
+        self.variables: list[dict] = []
+
+    def request(self, method, endpoint, *, body=None, headers=None):
+        self.variables.append(body["variables"])
+        return sync.GitHubResponse(200, {}, {"data": self.responder(body["variables"])})
+
+
+def graphql_issue(number: int, updated_at: str, title: str = "Issue") -> dict:
+    return {
+        "number": number,
+        "id": f"I_{number}",
+        "title": title,
+        "body": "",
+        "url": f"https://github.com/octo/plan/issues/{number}",
+        "state": "OPEN",
+        "updatedAt": updated_at,
+        "labels": {"nodes": []},
+        "milestone": None,
+    }
+
+
+def connection(nodes: list) -> dict:
+    return {"nodes": nodes, "pageInfo": {"hasNextPage": False, "endCursor": None}}
+
+
+def test_project_state_is_reused_while_the_project_is_unchanged(tmp_path: pathlib.Path) -> None:
+    def responder(variables):
+        field = {"__typename": "ProjectV2Field", "id": "F_1", "name": "完了定義", "dataType": "TEXT"}
+        item = {
+            "id": "ITEM_1",
+            "content": {"url": "https://github.com/octo/plan/issues/1", "number": 1, "title": "Issue"},
+            "fieldValues": {"nodes": [{"text": "done", "field": {"name": "完了定義"}}]},
+        }
+        return {"repositoryOwner": {"projectV2": {"fields": connection([field]), "items": connection([item])}}}
+
+    transport = ScriptedTransport(responder)
+    sync.set_transport(transport)
+    cache_path = tmp_path / "octo__plan.json"
+    project = {"id": "P_1", "number": 7, "updatedAt": "2026-03-02T00:00:00Z"}
+    try:
+        sync.set_sync_cache(sync.SyncCache(cache_path))
+        first = sync.fetch_project_state(project, "octo")
+        sync.SYNC_CACHE.save()
+        sync.set_sync_cache(sync.SyncCache(cache_path))
+        second = sync.fetch_project_state(project, "octo")
+        assert sync.SYNC_CACHE.stats["not_modified"] == 1
+        sync.fetch_project_state({**project, "updatedAt": "2026-03-03T00:00:00Z"}, "octo")
+    finally:
+        sync.set_transport(None)
+        sync.set_sync_cache(None)
+
+    assert first == second
+    assert second[1]["https://github.com/octo/plan/issues/1"]["完了定義"] == "done"
+    assert len(transport.variables) == 2
+
+
+def test_repo_state_merges_issues_changed_since_watermark(tmp_path: pathlib.Path) -> None:
+    def responder(variables):
+        if variables["since"] == "2026-03-01T00:00:00Z":
+            issues = [graphql_issue(2, "2026-03-02T00:00:00Z", title="Renamed")]
+        else:
+            issues = [graphql_issue(2, "2026-03-01T00:00:00Z"), graphql_issue(1, "2026-02-01T00:00:00Z")]
+        return {
+            "repository": {
+                "id": "R_1",
+                "labels": connection([]),
+                "milestones": connection([]),
+                "issues": connection(issues),
+            }
+        }
+
+    transport = ScriptedTransport(responder)
+    sync.set_transport(transport)
+    sync.set_sync_cache(sync.SyncCache(tmp_path / "octo__plan.json"))
+    try:
+        sync.fetch_repo_state(sync.RepoTarget("octo", "plan"))
+        issues = sync.fetch_repo_state(sync.RepoTarget("octo", "plan"))["issues"]
+        watermark = sync.SYNC_CACHE.entries["repos/octo/plan/issues"]["watermark"]
+    finally:
+        sync.set_transport(None)
+        sync.set_sync_cache(None)
+
+    assert [(issue["number"], issue["title"]) for issue in issues] == [(2, "Renamed"), (1, "Issue")]
+    assert watermark == "2026-03-02T00:00:00Z"
+    assert [variables["since"] for variables in transport.variables] == [None, "2026-03-01T00:00:00Z"]
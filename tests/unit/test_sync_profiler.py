@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import itertools
+
+import pytest
+
+from scripts import github_project_sync as sync
+
+
+class SizedTransport:
+    name = "sized"
+
+    def request(self, method, endpoint, *, body=None, headers=None):
+        status = 404 if endpoint.endswith("/missing") else 200
+        return sync.GitHubResponse(status, {}, {"ok": True}, sent=10 if body else 0, received=100)
+
+
+@pytest.fixture
+def profiler():
+    profiler = sync.SyncProfiler()
+    sync.set_profiler(profiler)
+    yield profiler
+    sync.set_profiler(sync.SyncProfiler())
+
+
+def test_endpoint_name_masks_ids_and_names_graphql_root_fields() -> None:
+    assert sync.endpoint_name("patch", "repos/octo/plan/issues/12", None) == "PATCH repos/{owner}/{repo}/issues/{n}"
+    assert (
+        sync.endpoint_name("GET", "https://api.github.com/repositories/99/issues?page=2", None)
+        == "GET repositories/{n}/issues"
+    )
+    batch = {"query": "mutation($a: ID!) {\n  f0: updateProjectV2ItemFieldValue(input: {}) { clientMutationId }\n}"}
+    assert sync.endpoint_name("POST", "graphql", batch) == "graphql mutation updateProjectV2ItemFieldValue"
+    assert sync.endpoint_name("POST", "graphql", {"query": "query { viewer { login } }"}) == "graphql query viewer"
+
+
+def test_requests_are_counted_per_endpoint_with_bytes_and_errors(profiler) -> None:
+    sync.set_transport(SizedTransport())
+    try:
+        sync.gh_api_json("repos/octo/plan/issues/1")
+        sync.gh_api_json("repos/octo/plan/issues/2")
+        sync.gh_api_json("repos/octo/plan/issues", method="POST", body={"title": "New"})
+        with pytest.raises(sync.SyncCommandError):
+            sync.gh_api_json("repos/octo/plan/missing")
+    finally:
+        sync.set_transport(None)
+
+    requests = profiler.to_dict()["requests"]
+    assert requests["GET repos/{owner}/{repo}/issues/{n}"]["count"] == 2
+    assert requests["GET repos/{owner}/{repo}/issues/{n}"]["received"] == 200
+    assert requests["POST repos/{owner}/{repo}/issues"]["sent"] == 10
+    assert requests["GET repos/{owner}/{repo}/missing"]["errors"] == 1
+    assert sum(requests["GET repos/{owner}/{repo}/issues/{n}"]["histogram"]) == 2
+
+
+def test_spans_accumulate_per_phase() -> None:
+    ticks = itertools.count()
+    profiler = sync.SyncProfiler(clock=lambda: float(next(ticks)))
+    with profiler.span("plan"):
+        pass
+    with profiler.span("plan"):
+        pass
+    with profiler.span("fetch"):
+        pass
+    assert profiler.to_dict()["spans"] == {"plan": 2.0, "fetch": 1.0}
+    assert profiler.render()[:3] == ["Profile:", "- spans:", "  - plan: 2.000s"]
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import datetime as dt
+import json
+import pathlib
+
+from scripts import github_project_sync as sync
+
+
+def make_ctx(report_dir: pathlib.Path) -> sync.SyncContext:
+    return sync.SyncContext(
+        dry_run=True,
+        repo=sync.RepoTarget(owner="octo", repo="plan"),
+        project_owner="octo",
+        project_title="plan",
+        today=dt.date(2026, 3, 14),
+        seed_path=pathlib.Path("data/project-seed.yaml"),
+        report_dir=report_dir,
+    )
+
+
+def write_jsonl(path: pathlib.Path, operations: list[tuple[str, str, str]]) -> pathlib.Path:
+    records = [{"type": "run", "mode": "dry-run"}]
+    records.extend(
+        {"type": "operation", "category": category, "action": action, "target": target, "details": {}}
+        for category, action, target in operations
+    )
+    path.write_text("".join(json.dumps(record) + "\n" for record in records), encoding="utf-8")
+    return path
+
+
+def test_operations_are_on_disk_before_the_report_is_closed(tmp_path: pathlib.Path) -> None:
+    ctx = make_ctx(tmp_path)
+    ctx.warn("recorded before the stream")
+    ctx.report = sync.ReportStream.start(ctx)
+    ctx.record("label", "create", "area:ai", color="fff")
+    ctx.record("issue", "noop", "ISS-001 First")
+
+    streamed = list(sync.iter_report_records(ctx.report.path))
+    assert [record["type"] for record in streamed] == ["run", "warning", "operation", "operation"]
+    assert streamed[2]["details"] == {"color": "fff"}
+
+    paths = sync.write_report(ctx, seed={}, project={"number": 7}, planned_issues=[])
+    assert ctx.report is None
+    markdown = pathlib.Path(paths["md"]).read_text(encoding="utf-8")
+    assert "- Project number: `7`" in markdown
+    assert "- label: create=1" in markdown
+    assert markdown.endswith("- [label] create area:ai\n- [issue] noop ISS-001 First")
+    assert (tmp_path / "latest_dry-run.jsonl").read_bytes() == pathlib.Path(paths["jsonl"]).read_bytes()
+
+
+def test_streamed_operations_are_counted_but_not_retained(tmp_path: pathlib.Path) -> None:
+    ctx = make_ctx(tmp_path)
+    ctx.record("project", "noop", "plan")
+    assert len(ctx.operations) == 1
+    ctx.report = sync.ReportStream.start(ctx)
+    for index in range(3):
+        ctx.record("issue", "create", f"ISS-00{index}")
+
+    assert ctx.operations == []
+    assert sync.summarize_operations(ctx) == {"project": {"noop": 1}, "issue": {"create": 3}}
+    paths = sync.write_report(ctx, seed={}, project=None, planned_issues=[])
+    records = sync.iter_report_records(pathlib.Path(paths["jsonl"]))
+    assert sum(record["type"] == "operation" for record in records) == 4
+
+
+def test_interrupted_report_renders_what_was_streamed(tmp_path: pathlib.Path) -> None:
+    path = write_jsonl(tmp_path / "run.jsonl", [("issue", "create", "ISS-001 First")])
+    with path.open("a", encoding="utf-8") as handle:
+        handle.write('{"type": "operation", "categ')
+
+    sync.render_report_markdown(path, tmp_path / "run.md")
+    markdown = (tmp_path / "run.md").read_text(encoding="utf-8")
+    assert "## Incomplete" in markdown
+    assert markdown.endswith("- [issue] create ISS-001 First")
+
+
+def test_diff_reports_pairs_operations_by_category_and_target(tmp_path: pathlib.Path) -> None:
+    old = write_jsonl(
+        tmp_path / "old.jsonl",
+        [
+            ("project", "noop", "plan"),
+            ("project", "noop", "plan"),
+            ("issue", "create", "ISS-001 First"),
+            ("issue", "noop", "ISS-002 Second"),
+        ],
+    )
+    new = write_jsonl(
+        tmp_path / "new.jsonl",
+        [
+            ("project", "noop", "plan"),
+            ("project", "link", "plan"),
+            ("issue", "noop", "ISS-001 First"),
+            ("issue", "create", "ISS-003 Third"),
+        ],
+    )
+
+    diff = sync.diff_reports(old, new)
+    assert diff.changed == [("project", "noop", "link", "plan"), ("issue", "create", "noop", "ISS-001 First")]
+    assert diff.added == [("issue", "create", "ISS-003 Third")]
+    assert diff.removed == [("issue", "noop", "ISS-002 Second")]
+    lines = sync.render_report_diff(diff)
+    assert "- issue: unchanged" in lines
+    assert "- project: link=0->1, noop=2->1" in lines
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import copy
+import datetime as dt
+import pathlib
+
+import yaml
+
+from scripts import github_project_sync as sync
+from scripts.github_standin import StandinConfig, StandinServer
+
+
+REPO = sync.RepoTarget(owner="bench", repo="plan")
+TODAY = dt.date(2026, 3, 14)
+
+
+def small_seed() -> dict:
+    seed = yaml.safe_load(pathlib.Path("data/project-seed.yaml").read_text(encoding="utf-8"))
+    seed["epics"], seed["phase_cards"], seed["win_conditions"] = [], [], []
+    seed["issues"] = seed["issues"][:3]
+    for issue in seed["issues"]:
+        issue["blocked_by"], issue["dependencies"] = [], []
+    return seed
+
+
+def make_ctx() -> sync.SyncContext:
+    return sync.SyncContext(
+        dry_run=False,
+        repo=REPO,
+        project_owner="bench",
+        project_title="plan",
+        today=TODAY,
+        seed_path=pathlib.Path("data/project-seed.yaml"),
+        report_dir=pathlib.Path("data/sync-reports"),
+    )
+
+
+def test_watch_cycle_pushes_only_changed_entities() -> None:
+    seed = small_seed()
+    with StandinServer(StandinConfig()) as server:
+        sync.set_transport(sync.HttpTransport("token", base_url=server.url))
+        try:
+            remote = sync.fetch_remote_snapshot(REPO, "bench", "plan")
+            state = sync.WatchState(seed=seed, today=TODAY, planned_issues=[], fields={}, milestone_numbers={})
+            changes, cycle_ctx = sync.watch_cycle(make_ctx(), remote, state, seed, today=TODAY)
+            assert len(changes.planned_issues) == 3
+            assert cycle_ctx.errors == []
+
+            edited = copy.deepcopy(seed)
+            edited["issues"][1]["title"] += " (edited)"
+            before = server.traffic["requests"]
+            changes, cycle_ctx = sync.watch_cycle(make_ctx(), remote, state, edited, today=TODAY)
+            assert [issue.seed_id for issue in changes.planned_issues] == [edited["issues"][1]["id"]]
+            assert changes.labels == changes.milestones == changes.fields == []
+            assert [operation.action for operation in cycle_ctx.operations] == ["update"]
+            assert server.traffic["requests"] - before == 1
+
+            before = server.traffic["requests"]
+            changes, _ = sync.watch_cycle(make_ctx(), remote, state, copy.deepcopy(edited), today=TODAY)
+            assert changes.is_empty()
+            assert server.traffic["requests"] == before
+        finally:
+            sync.set_transport(None)
+
+
+def test_watch_cycle_restores_values_cleared_by_an_option_change() -> None:
+    seed = small_seed()
+    with StandinServer(StandinConfig()) as server:
+        sync.set_transport(sync.HttpTransport("token", base_url=server.url))
+        try:
+            remote = sync.fetch_remote_snapshot(REPO, "bench", "plan")
+            ctx = make_ctx()
+            sync.ensure_project(ctx, remote, seed)
+            fields = sync.ensure_project_fields(ctx, remote, sync.seed_field_specs(seed))
+            state = sync.WatchState(seed=seed, today=TODAY, planned_issues=[], fields=fields, milestone_numbers={})
+            sync.watch_cycle(make_ctx(), remote, state, seed, today=TODAY)
+
+            def priorities() -> int:
+                project = server.state.projects[0]
+                nodes = [server.state.graphql_item(project, item)["fieldValues"]["nodes"] for item in project["items"]]
+                return sum(value["field"]["name"] == "優先度" for values in nodes for value in values)
+
+            assert priorities() == 3
+
+            edited = copy.deepcopy(seed)
+            next(field for field in edited["project_fields"] if field["name"] == "優先度")["options"].append("P3")
+            changes, cycle_ctx = sync.watch_cycle(make_ctx(), remote, state, edited, today=TODAY)
+            assert [spec.name for spec in changes.fields] == ["優先度"]
+            assert changes.planned_issues == []
+            assert cycle_ctx.errors == []
+            assert priorities() == 3
+        finally:
+            sync.set_transport(None)